@@ -0,0 +1,92 @@
+"""Awaitable facade over a bounded pipeline executor.
+
+The fact-check pipelines are blocking code. These wrappers run each call on
+one process-wide ThreadPoolExecutor of PIPELINE_MAX_WORKERS threads and
+await the result, so an event loop is never blocked by a pipeline. There is
+no async I/O underneath: at most PIPELINE_MAX_WORKERS checks run at once per
+process. Up to PIPELINE_MAX_WAITING more calls queue for a thread; past that
+PipelineBusy is raised at once, so callers can shed load (the ASGI app
+answers 503) instead of waiting behind a full executor.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from api import core
+
+PIPELINE_MAX_WORKERS = 32
+PIPELINE_MAX_WAITING = 32
+
+
+class PipelineBusy(RuntimeError):
+    """Raised when every pipeline thread is busy and the wait queue is full."""
+
+
+_executor = ThreadPoolExecutor(
+    max_workers=PIPELINE_MAX_WORKERS, thread_name_prefix="pipeline"
+)
+_lock = threading.Lock()
+_counters = {"in_flight": 0, "running": 0, "completed": 0, "rejected": 0}
+
+
+def _run_counted(fn: Callable[..., Any], *args: Any) -> Any:
+    with _lock:
+        _counters["running"] += 1
+    try:
+        return fn(*args)
+    finally:
+        with _lock:
+            _counters["running"] -= 1
+
+
+async def run_in_pipeline(fn: Callable[..., Any], *args: Any) -> Any:
+    loop = asyncio.get_running_loop()
+    with _lock:
+        if _counters["in_flight"] >= PIPELINE_MAX_WORKERS + PIPELINE_MAX_WAITING:
+            _counters["rejected"] += 1
+            raise PipelineBusy("All pipeline workers are busy")
+        _counters["in_flight"] += 1
+    try:
+        return await loop.run_in_executor(
+            _executor, functools.partial(_run_counted, fn, *args)
+        )
+    finally:
+        with _lock:
+            _counters["in_flight"] -= 1
+            _counters["completed"] += 1
+
+
+def pipeline_stats() -> Dict[str, int]:
+    with _lock:
+        waiting = _counters["in_flight"] - _counters["running"]
+        return {
+            "max_workers": PIPELINE_MAX_WORKERS,
+            "max_waiting": PIPELINE_MAX_WAITING,
+            **_counters,
+            "waiting": max(0, waiting),
+        }
+
+
+async def fact_check_text_input_async(text: str) -> Tuple[Dict[str, Any], int]:
+    return await run_in_pipeline(core.fact_check_text_input, text)
+
+
+async def fact_check_url_input_async(url: str) -> Tuple[Dict[str, Any], int]:
+    return await run_in_pipeline(core.fact_check_url_input, url)
+
+
+async def fact_check_image_input_async(
+    image_data_url: Optional[str], image_url: Optional[str]
+) -> Tuple[Dict[str, Any], int]:
+    return await run_in_pipeline(
+        core.fact_check_image_input, image_data_url, image_url
+    )
+
+
+async def fact_check_extension_post_input_async(
+    payload: Dict[str, Any],
+) -> Tuple[Dict[str, Any], int]:
+    return await run_in_pipeline(core.fact_check_extension_post_input, payload)
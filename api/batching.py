@@ -0,0 +1,130 @@
+"""Micro-batching of LLM work items across concurrent requests."""
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+class _Batch:
+    def __init__(self, deadline: float):
+        self.items: List[Any] = []
+        self.futures: List[Future] = []
+        self.cost = 0
+        self.deadline = deadline
+        self.sealed = False
+
+
+class MicroBatcher:
+    """Pools items from concurrent callers into shared ``handler`` calls.
+
+    The caller whose item opens a batch leads it: while another batch's
+    handler is running it waits up to ``window`` seconds for other callers
+    to add items, then runs ``handler(items)`` on its own thread and hands
+    each caller its share of the results. When no handler is running the
+    batcher is idle and the leader runs at once, so a lone request pays no
+    window. A batch is sealed early once it holds ``max_items`` items or
+    another item would push its total ``cost(item)`` past ``max_cost``.
+    ``handler`` must return one result per item, in order.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], Sequence[Any]],
+        window: float = 0.05,
+        max_items: int = 8,
+        max_cost: Optional[int] = None,
+        cost: Callable[[Any], int] = lambda item: 1,
+    ):
+        self.handler = handler
+        self.window = window
+        self.max_items = max_items
+        self.max_cost = max_cost
+        self._cost = cost
+        self._cond = threading.Condition()
+        self._open: Optional[_Batch] = None
+        self._running = 0  # batches whose handler is executing
+        self._counters = {"items": 0, "batches": 0, "failed": 0, "largest": 0}
+
+    def _seal(self, batch: _Batch) -> None:
+        # Caller holds self._cond.
+        batch.sealed = True
+        if self._open is batch:
+            self._open = None
+        self._cond.notify_all()
+
+    def _add(self, item: Any) -> Tuple[Future, Optional[_Batch]]:
+        # Caller holds self._cond.
+        cost = self._cost(item)
+        batch = self._open
+        if (
+            batch is not None
+            and self.max_cost is not None
+            and batch.cost + cost > self.max_cost
+        ):
+            self._seal(batch)
+            batch = None
+        led = None
+        if batch is None:
+            batch = self._open = led = _Batch(time.monotonic() + self.window)
+        future: Future = Future()
+        batch.items.append(item)
+        batch.futures.append(future)
+        batch.cost += cost
+        if len(batch.items) >= self.max_items:
+            self._seal(batch)
+        return future, led
+
+    def map(self, items: Sequence[Any]) -> List[Any]:
+        """Return ``handler``'s result for each item, batched with other callers."""
+        with self._cond:
+            added = [self._add(item) for item in items]
+        for _, batch in added:
+            if batch is not None:
+                self._run(batch)
+        return [future.result() for future, _ in added]
+
+    def _run(self, batch: _Batch) -> None:
+        with self._cond:
+            # Waiting only pays off while another batch holds the provider;
+            # its completion wakes us so the pooled items go out right away.
+            while not batch.sealed and self._running:
+                remaining = batch.deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            self._seal(batch)
+            self._running += 1
+            self._counters["items"] += len(batch.items)
+            self._counters["batches"] += 1
+            self._counters["largest"] = max(self._counters["largest"], len(batch.items))
+        try:
+            results = list(self.handler(list(batch.items)))
+            if len(results) != len(batch.items):
+                raise ValueError(
+                    f"Batch handler returned {len(results)} results "
+                    f"for {len(batch.items)} items"
+                )
+        except Exception as exc:
+            with self._cond:
+                self._counters["failed"] += 1
+            for future in batch.futures:
+                future.set_exception(exc)
+            return
+        finally:
+            with self._cond:
+                self._running -= 1
+                self._cond.notify_all()
+        for future, result in zip(batch.futures, results):
+            future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            batches = self._counters["batches"]
+            return {
+                **self._counters,
+                "mean_batch_size": (
+                    round(self._counters["items"] / batches, 2) if batches else None
+                ),
+                "open_items": len(self._open.items) if self._open else 0,
+            }
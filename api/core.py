@@ -1,16 +1,26 @@
 import base64
+import codecs
+import copy
 import datetime
+import functools
+import hashlib
 import ipaddress
 import json
 import os
+import queue
 import re
+import threading
 import time
 import unicodedata
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    as_completed,
+    wait,
+)
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
-from urllib import error as urllib_error
-from urllib import request as urllib_request
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from urllib.parse import (
     parse_qs,
     parse_qsl,
@@ -21,9 +31,20 @@ from urllib.parse import (
     urlunparse,
 )
 
-import requests
+import lxml.etree
+import lxml.html
 from bs4 import BeautifulSoup
 from readability import Document
+from readability.cleaners import html_cleaner
+from readability.htmls import build_doc
+
+from api.batching import MicroBatcher
+from api.cache import build_cache
+from api.jsonstream import JsonArrayStream
+from api.ratelimit import RateLimiter, SQLiteRateStore
+from api.routing import ProviderRouter
+from api.transport import HttpPool, ProviderClient
+from api.workpool import WorkPool
 
 
 def _get_env_var_insensitive(key: str) -> Optional[str]:
@@ -98,17 +119,226 @@ MAX_IMAGE_DOWNLOAD_BYTES = 8 * 1024 * 1024
 MAX_WEB_EVIDENCE_SOURCES = 5
 MAX_WEB_EVIDENCE_CLAIMS = 6
 MAX_WEB_EVIDENCE_FETCHES = 4
+CLAIM_VERDICT_TOKENS = 250  # expected output per verdict
+# Evidence re-checks from concurrent requests are pooled into one prompt.
+EVIDENCE_BATCH_WINDOW_SECONDS = 0.25
+EVIDENCE_BATCH_MAX_CLAIMS = 24
+# A third of Groq's 12k TPM, so one pooled prompt never spends the minute.
+EVIDENCE_BATCH_MAX_TOKENS = 4000
 WEB_SEARCH_TIMEOUT_SECONDS = 8
 WEB_EVIDENCE_FETCH_TIMEOUT_SECONDS = 6
+HTML_FETCH_MAX_BYTES = 2 * 1024 * 1024  # stop reading larger pages past this point
+HTML_STREAM_CHUNK_BYTES = 64 * 1024
+HEAD_ONLY_PLATFORMS = {"instagram", "facebook"}  # only og:/twitter: meta is usable
+WEB_SEARCH_CONCURRENT = True  # query all engines at once instead of in turn
+URL_PIPELINE_CONCURRENT = True  # analyze post text and images in parallel
+SERP_PARSER = "lxml"  # "bs4" switches result pages back to BeautifulSoup
 GEMINI_RETRY_ATTEMPTS = 1
 GEMINI_INITIAL_RETRY_DELAY_SECONDS = 1.0
 GEMINI_BACKOFF_MULTIPLIER = 2.0
 MAX_GEMINI_RETRY_DELAY_SECONDS = 4.0
 GEMINI_TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
-GEMINI_INTER_REQUEST_DELAY = 0.5  # seconds between API calls
-GROQ_INTER_REQUEST_DELAY = 0.3  # Groq has higher RPM limits than Gemini
+# Free-tier budgets per provider, overridable per "provider:model". Live
+# x-ratelimit-*-tokens and Retry-After responses tighten them further.
+PROVIDER_RATE_LIMITS = {
+    "groq": {"rpm": 30, "tpm": 12000},
+    f"groq:{GROQ_FALLBACK_TEXT_MODEL}": {"rpm": 30, "tpm": 6000},
+    f"groq:{GROQ_VISION_MODEL}": {"rpm": 30, "tpm": 30000},
+    "gemini": {"rpm": 15, "tpm": 1000000},
+}
+RATE_LIMIT_MAX_WAIT_SECONDS = 10  # beyond this, skip to the next model instead
+ESTIMATED_COMPLETION_TOKENS = 512
+ESTIMATED_IMAGE_TOKENS = 1000
+
+# Provider routing: latency EWMA, rolling error rate and a circuit breaker per
+# provider:model route.
+ROUTER_EWMA_ALPHA = 0.3
+ROUTER_ERROR_WINDOW = 20
+ROUTER_MIN_SAMPLES = 5
+ROUTER_ERROR_THRESHOLD = 0.5
+ROUTER_OPEN_SECONDS = 30
+ROUTER_MAX_OPEN_SECONDS = 300
+ROUTER_LATENCY_MARGIN = 2.0  # reorder providers only past this latency ratio
 GROQ_MAX_IMAGE_SIZE_BYTES = 4 * 1024 * 1024  # Groq limits base64 images to 4MB
 UPSTREAM_TIMEOUT_SECONDS = 25
+TWITTER_ADAPTER_DEADLINE_SECONDS = 12  # overall budget for the parallel X sources
+REDDIT_HEDGE_DELAY_SECONDS = 1.5  # start the next reddit fallback if no answer by then
+REDDIT_ADAPTER_DEADLINE_SECONDS = 15
+REDDIT_FAILURE_THRESHOLD = 3  # consecutive failures before a route cools down
+REDDIT_FAILURE_COOLDOWN_SECONDS = 10 * 60
+CHECKER_KEY_RELOAD_SECONDS = 300  # how often the shared checker re-reads API keys
+HTTP_POOL_MAX_CONNECTIONS = 64  # requests in flight across all hosts
+HTTP_POOL_DEFAULT_SIZE = 4  # keep-alive connections kept per host
+HTTP_POOL_HOST_SIZES = {
+    "reddit.com": 8,
+    "api.reddit.com": 8,
+    "cdn.syndication.twimg.com": 8,
+    "pbs.twimg.com": 8,
+    "duckduckgo.com": 8,
+    "bing.com": 8,
+    "search.yahoo.com": 8,
+}
+EVIDENCE_POOL_MAX_WORKERS = 16  # shared by every request's evidence searches/fetches
+EVIDENCE_DEFAULT_HOST_LIMIT = 4  # pages fetched at once from any one site
+EVIDENCE_HOST_LIMITS = {
+    "duckduckgo.com": 2,
+    "bing.com": 2,
+    "search.yahoo.com": 2,
+}
+WEB_EVIDENCE_DEADLINE_SECONDS = 20  # overall budget for one request's evidence
+ADAPTER_POOL_MAX_WORKERS = 16  # shared by every request's X/reddit adapter sources
+ADAPTER_DEFAULT_HOST_LIMIT = 8
+STREAM_POOL_MAX_WORKERS = 32  # streamed fact checks running at once
+IMAGE_ANALYSIS_POOL_MAX_WORKERS = 8  # URL image analyses run beside text checks
+
+HTTP_POOL = HttpPool(
+    max_connections=HTTP_POOL_MAX_CONNECTIONS,
+    default_pool_size=HTTP_POOL_DEFAULT_SIZE,
+    host_pool_sizes=HTTP_POOL_HOST_SIZES,
+)
+
+# Search engines and evidence pages are fetched on one process-wide pool so
+# concurrent requests share a fixed thread budget and per-host limits.
+EVIDENCE_POOL = WorkPool(
+    max_workers=EVIDENCE_POOL_MAX_WORKERS,
+    host_limits=EVIDENCE_HOST_LIMITS,
+    default_host_limit=EVIDENCE_DEFAULT_HOST_LIMIT,
+    name="evidence",
+)
+
+# Parallel X sources and hedged reddit routes run here, apart from the
+# evidence pool, so a burst of social URLs cannot crowd out evidence work.
+ADAPTER_POOL = WorkPool(
+    max_workers=ADAPTER_POOL_MAX_WORKERS,
+    default_host_limit=ADAPTER_DEFAULT_HOST_LIMIT,
+    name="adapter",
+)
+
+# Streamed pipelines and the image half of URL checks each get their own
+# bounded pool. They are separate because a streamed URL check waits on its
+# image analysis, and sharing one pool could deadlock it once full.
+STREAM_POOL = WorkPool(
+    max_workers=STREAM_POOL_MAX_WORKERS,
+    default_host_limit=STREAM_POOL_MAX_WORKERS,
+    name="stream",
+)
+IMAGE_ANALYSIS_POOL = WorkPool(
+    max_workers=IMAGE_ANALYSIS_POOL_MAX_WORKERS,
+    default_host_limit=IMAGE_ANALYSIS_POOL_MAX_WORKERS,
+    name="image-analysis",
+)
+
+LLM_CONNECT_TIMEOUT_SECONDS = 5
+LLM_READ_TIMEOUT_SECONDS = UPSTREAM_TIMEOUT_SECONDS
+
+# Owned by the process, not by FactChecker, so every request reuses the same
+# keep-alive connections to each provider.
+PROVIDER_CLIENTS = {
+    "gemini": ProviderClient(
+        "gemini",
+        connect_timeout=LLM_CONNECT_TIMEOUT_SECONDS,
+        read_timeout=LLM_READ_TIMEOUT_SECONDS,
+    ),
+    "groq": ProviderClient(
+        "groq",
+        connect_timeout=LLM_CONNECT_TIMEOUT_SECONDS,
+        read_timeout=LLM_READ_TIMEOUT_SECONDS,
+    ),
+}
+
+# Set FACT_CHECK_CACHE_PATH to a SQLite file to keep caches across restarts.
+CACHE_DB_PATH = _get_env_var_insensitive("FACT_CHECK_CACHE_PATH") or None
+# Workers that point at the same file share one provider budget.
+RATE_LIMIT_DB_PATH = (
+    _get_env_var_insensitive("FACT_CHECK_RATE_LIMIT_PATH") or CACHE_DB_PATH
+)
+RATE_LIMITER = RateLimiter(
+    PROVIDER_RATE_LIMITS,
+    store=SQLiteRateStore(RATE_LIMIT_DB_PATH) if RATE_LIMIT_DB_PATH else None,
+)
+PROVIDER_ROUTER = ProviderRouter(
+    alpha=ROUTER_EWMA_ALPHA,
+    window=ROUTER_ERROR_WINDOW,
+    min_samples=ROUTER_MIN_SAMPLES,
+    error_threshold=ROUTER_ERROR_THRESHOLD,
+    open_seconds=ROUTER_OPEN_SECONDS,
+    max_open_seconds=ROUTER_MAX_OPEN_SECONDS,
+)
+VERDICT_CACHE_TTL_SECONDS = 6 * 60 * 60
+VERDICT_CACHE_MAX_ENTRIES = 2048
+VERDICT_PROMPT_VERSION = "1"  # bump when verdict prompts change
+
+VERDICT_CACHE = build_cache(
+    max_entries=VERDICT_CACHE_MAX_ENTRIES,
+    ttl=VERDICT_CACHE_TTL_SECONDS,
+    disk_path=CACHE_DB_PATH,
+    table="verdicts",
+)
+
+# Extracted URL content, keyed on the normalized URL. TTLs are per platform;
+# generic pages with ETag/Last-Modified are kept for the revalidation window
+# and refreshed with a conditional GET once their TTL lapses.
+EXTRACTION_CACHE_MAX_ENTRIES = 1024
+EXTRACTION_CACHE_TTLS = {
+    "twitter": 60 * 60,
+    "reddit": 15 * 60,
+    "tiktok": 60 * 60,
+    "youtube": 6 * 60 * 60,
+    "instagram": 30 * 60,
+    "facebook": 30 * 60,
+    "generic": 10 * 60,
+}
+EXTRACTION_REVALIDATE_WINDOW_SECONDS = 24 * 60 * 60
+EXTRACTION_CACHE = build_cache(
+    max_entries=EXTRACTION_CACHE_MAX_ENTRIES,
+    ttl=EXTRACTION_CACHE_TTLS["generic"],
+    disk_path=CACHE_DB_PATH,
+    table="extractions",
+)
+
+# Evidence-checked results per normalized claim, shared by the text, URL,
+# image and extension pipelines.
+CLAIM_STORE_MAX_ENTRIES = 8192
+CLAIM_STORE = build_cache(
+    max_entries=CLAIM_STORE_MAX_ENTRIES,
+    ttl=VERDICT_CACHE_TTL_SECONDS,
+    disk_path=CACHE_DB_PATH,
+    table="claims",
+)
+
+# Per-engine search results keyed by normalized query. Entries outlive their
+# freshness window so a stale hit can be served while it is refreshed.
+SEARCH_CACHE_MAX_ENTRIES = 4096
+SEARCH_CACHE_TTL_SECONDS = 30 * 60
+SEARCH_CACHE_STALE_SECONDS = 6 * 60 * 60  # how long a stale result may still be served
+SEARCH_NEGATIVE_TTL_SECONDS = 2 * 60  # back off engines that return nothing/refuse us
+SEARCH_CACHE = build_cache(
+    max_entries=SEARCH_CACHE_MAX_ENTRIES,
+    ttl=SEARCH_CACHE_TTL_SECONDS + SEARCH_CACHE_STALE_SECONDS,
+    disk_path=CACHE_DB_PATH,
+    table="searches",
+)
+_SEARCH_REVALIDATING: set = set()
+_SEARCH_REVALIDATING_LOCK = threading.Lock()
+
+# Title and snippet per evidence page URL, reused across claims and requests.
+PAGE_SUMMARY_CACHE_MAX_ENTRIES = 4096
+PAGE_SUMMARY_CACHE_TTL_SECONDS = 24 * 60 * 60
+PAGE_SUMMARY_NEGATIVE_TTL_SECONDS = 10 * 60
+PAGE_SUMMARY_CACHE = build_cache(
+    max_entries=PAGE_SUMMARY_CACHE_MAX_ENTRIES,
+    ttl=PAGE_SUMMARY_CACHE_TTL_SECONDS,
+    disk_path=CACHE_DB_PATH,
+    table="page_summaries",
+)
+
+
+def _http_get(url: str, **kwargs: Any):
+    return HTTP_POOL.get(url, **kwargs)
+
+
+def _http_head(url: str, **kwargs: Any):
+    return HTTP_POOL.head(url, **kwargs)
 
 
 @dataclass
@@ -314,6 +544,22 @@ def _clean_sources(value: Any, fallback: Optional[List[str]] = None) -> List[str
     return _dedupe_sources(fallback or [])
 
 
+def _estimate_tokens(payload: Dict[str, Any]) -> int:
+    chars = 0
+    images = 0
+    for message in payload.get("messages", []):
+        content = message.get("content", "")
+        if isinstance(content, str):
+            chars += len(content)
+            continue
+        for part in content if isinstance(content, list) else []:
+            if isinstance(part, dict) and part.get("type") == "image_url":
+                images += 1
+            elif isinstance(part, dict):
+                chars += len(str(part.get("text", "")))
+    return chars // 4 + images * ESTIMATED_IMAGE_TOKENS + ESTIMATED_COMPLETION_TOKENS
+
+
 def _retry_delay_seconds(attempt: int) -> float:
     return GEMINI_INITIAL_RETRY_DELAY_SECONDS * (GEMINI_BACKOFF_MULTIPLIER**attempt)
 
@@ -354,6 +600,134 @@ def _retry_after_seconds(response: Optional[GeminiResponse]) -> Optional[float]:
     return None
 
 
+ContentListener = Optional[Callable[[str], None]]
+
+
+def _sse_events(upstream: Any) -> Iterator[Dict[str, Any]]:
+    try:
+        for line in upstream.iter_lines():
+            if not line.startswith(b"data:"):
+                continue
+            data = line[len(b"data:") :].strip()
+            if data == b"[DONE]":
+                return
+            try:
+                event = json.loads(data)
+            except ValueError:
+                continue
+            if isinstance(event, dict):
+                yield event
+    finally:
+        upstream.close()
+
+
+def _read_groq_stream(upstream: Any, on_content: Callable[[str], None]) -> str:
+    """Collect an OpenAI-style SSE completion into a non-streamed response body."""
+    content = ""
+    for event in _sse_events(upstream):
+        for choice in event.get("choices") or []:
+            delta = (choice.get("delta") or {}).get("content") or ""
+            if delta:
+                content += delta
+                on_content(content)
+    return json.dumps(
+        {"choices": [{"message": {"role": "assistant", "content": content}}]}
+    )
+
+
+def _read_gemini_stream(upstream: Any, on_content: Callable[[str], None]) -> str:
+    """Merge streamGenerateContent chunks into one native Gemini response body."""
+    content = ""
+    grounding: Dict[str, Any] = {}
+    for event in _sse_events(upstream):
+        candidates = event.get("candidates") or [{}]
+        candidate = candidates[0] if isinstance(candidates[0], dict) else {}
+        parts = (candidate.get("content") or {}).get("parts") or []
+        delta = "".join(p.get("text", "") for p in parts if isinstance(p, dict))
+        grounding = candidate.get("groundingMetadata") or grounding
+        if delta:
+            content += delta
+            on_content(content)
+    merged: Dict[str, Any] = {"content": {"parts": [{"text": content}]}}
+    if grounding:
+        merged["groundingMetadata"] = grounding
+    return json.dumps({"candidates": [merged]})
+
+
+def _observe_rate_limits(provider: str, model: str, response: GeminiResponse) -> None:
+    retry_after = None
+    if response.status_code in GEMINI_TRANSIENT_STATUS_CODES:
+        retry_after = _retry_after_seconds(response)
+    RATE_LIMITER.observe(provider, model, response.headers, retry_after=retry_after)
+
+
+def _record_route(
+    provider: str, model: str, started: float, response: Optional[GeminiResponse]
+) -> None:
+    if response is not None and response.status_code == 429:
+        # Quota, not health: RATE_LIMITER.observe already backs off, so the
+        # breaker neither counts it nor keeps a probe slot for it.
+        PROVIDER_ROUTER.release(provider, model)
+        return
+    ok = response is not None and (
+        response.status_code not in GEMINI_TRANSIENT_STATUS_CODES
+    )
+    PROVIDER_ROUTER.record(provider, model, time.perf_counter() - started, ok)
+
+
+def _acquire_budget(provider: str, model: str, tokens: int) -> bool:
+    """Book rate-limit budget, giving back a claimed probe slot if none is booked."""
+    try:
+        acquired = RATE_LIMITER.acquire(
+            provider, model, tokens=tokens, max_wait=RATE_LIMIT_MAX_WAIT_SECONDS
+        )
+    except Exception:
+        PROVIDER_ROUTER.release(provider, model)
+        raise
+    if not acquired:
+        PROVIDER_ROUTER.release(provider, model)
+    return acquired
+
+
+def _budget_wait(provider: str, models: List[str], tokens: int) -> float:
+    """Shortest wait the shared budget imposes before any of ``models`` is free."""
+    return min(RATE_LIMITER.wait_time(provider, model, tokens) for model in models)
+
+
+def _route_providers(
+    candidates: List[Tuple[str, List[str]]], tokens: int
+) -> List[Tuple[str, List[str]]]:
+    """Order ``(provider, models)`` pairs, given in preference order, by health.
+
+    Providers with a closed (or probe-ready) breaker on some model come first,
+    then those the shared budget can serve without waiting. Between otherwise
+    equal providers the preferred one keeps its place unless its error-weighted
+    latency is ROUTER_LATENCY_MARGIN times worse than the next one's.
+    """
+
+    # Each provider's budget is read once per call, not once per comparison.
+    ranks = {
+        provider: (
+            not any(PROVIDER_ROUTER.available(provider, model) for model in models),
+            _budget_wait(provider, models, tokens) > 0,
+        )
+        for provider, models in candidates
+    }
+    ordered = sorted(candidates, key=lambda candidate: ranks[candidate[0]])
+    if len(ordered) == 2 and ranks[ordered[0][0]] == ranks[ordered[1][0]]:
+        first, second = (PROVIDER_ROUTER.score(*item) for item in ordered)
+        if first is not None and second is not None:
+            if first > second * ROUTER_LATENCY_MARGIN:
+                ordered.reverse()
+    return ordered
+
+
+def _groq_models(use_vision: bool) -> List[str]:
+    if use_vision:
+        return [GROQ_VISION_MODEL]
+    return [GROQ_TEXT_MODEL, GROQ_FALLBACK_TEXT_MODEL]
+
+
 def _models_for_payload(payload: Dict[str, Any]) -> List[str]:
     requested_model = payload.get("model") or GEMINI_PRIMARY_MODEL
     models = [requested_model]
@@ -457,11 +831,13 @@ def _remote_url_is_image(url: str) -> bool:
             **DEFAULT_HEADERS,
             "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
         }
-        resp = requests.head(url, headers=headers, allow_redirects=True, timeout=6)
+        resp = _http_head(url, headers=headers, allow_redirects=True, timeout=6)
         if resp.status_code in {405, 403} or resp.status_code >= 500:
-            resp = requests.get(
+            # Only the headers are needed; closing releases the pooled connection.
+            with _http_get(
                 url, headers=headers, allow_redirects=True, timeout=6, stream=True
-            )
+            ) as resp:
+                pass
         return resp.status_code < 400 and _is_image_content_type(
             resp.headers.get("Content-Type", "")
         )
@@ -505,23 +881,23 @@ def _download_image_as_data_url(
             **DEFAULT_HEADERS,
             "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
         }
-        resp = requests.get(url, headers=headers, timeout=15, stream=True)
-        resp.raise_for_status()
-        content_type = (
-            resp.headers.get("Content-Type", "").split(";", 1)[0].strip().lower()
-        )
-        if not _is_image_content_type(content_type):
-            return None
-
-        chunks = []
-        total = 0
-        for chunk in resp.iter_content(chunk_size=64 * 1024):
-            if not chunk:
-                continue
-            total += len(chunk)
-            if total > max_bytes:
+        with _http_get(url, headers=headers, timeout=15, stream=True) as resp:
+            resp.raise_for_status()
+            content_type = (
+                resp.headers.get("Content-Type", "").split(";", 1)[0].strip().lower()
+            )
+            if not _is_image_content_type(content_type):
                 return None
-            chunks.append(chunk)
+
+            chunks = []
+            total = 0
+            for chunk in resp.iter_content(chunk_size=64 * 1024):
+                if not chunk:
+                    continue
+                total += len(chunk)
+                if total > max_bytes:
+                    return None
+                chunks.append(chunk)
         if not chunks:
             return None
         encoded = base64.b64encode(b"".join(chunks)).decode("ascii")
@@ -551,33 +927,47 @@ def _has_post_adapter(platform: str) -> bool:
     return platform in {"twitter", "reddit", "tiktok", "youtube"}
 
 
-def _extract_meta_text(soup: BeautifulSoup) -> Tuple[str, str]:
-    title = ""
-    description = ""
+def _parse_html(html: str) -> lxml.html.HtmlElement:
+    """Parse a fetched page once so every extractor can share the tree."""
+    doc, _ = build_doc(html)
+    return doc
+
+
+def _html_text(node: lxml.html.HtmlElement) -> str:
+    # Same text BeautifulSoup's get_text(" ", strip=True) yields: script,
+    # style and template contents and comments are skipped.
+    parts = node.xpath(
+        "descendant-or-self::text()"
+        "[not(ancestor::script or ancestor::style or ancestor::template)]"
+    )
+    return " ".join(part.strip() for part in parts if part.strip())
+
 
-    og_title = soup.find("meta", property="og:title")
-    if og_title and og_title.get("content"):
-        title = og_title["content"].strip()
+def _meta_content(doc: lxml.html.HtmlElement, attr: str, value: str) -> str:
+    for meta in doc.iterfind(f".//meta[@{attr}]"):
+        if meta.get(attr) == value:
+            return meta.get("content") or ""
+    return ""
+
+
+def _extract_meta_text(doc: lxml.html.HtmlElement) -> Tuple[str, str]:
+    title = _meta_content(doc, "property", "og:title").strip()
 
     if not title:
-        title_tag = soup.find("title")
-        if title_tag:
-            title = title_tag.get_text(strip=True)
+        title_tag = doc.find(".//title")
+        if title_tag is not None:
+            title = "".join(part.strip() for part in title_tag.itertext())
 
-    og_desc = soup.find("meta", property="og:description") or soup.find(
-        "meta", attrs={"name": "description"}
-    )
-    if og_desc and og_desc.get("content"):
-        description = og_desc["content"].strip()
-    else:
-        tw_desc = soup.find("meta", attrs={"name": "twitter:description"})
-        if tw_desc and tw_desc.get("content"):
-            description = tw_desc["content"].strip()
+    description = (
+        _meta_content(doc, "property", "og:description")
+        or _meta_content(doc, "name", "description")
+        or _meta_content(doc, "name", "twitter:description")
+    ).strip()
 
     return title, description
 
 
-def _extract_meta_images(soup: BeautifulSoup, base_url: str) -> List[str]:
+def _extract_meta_images(doc: lxml.html.HtmlElement, base_url: str) -> List[str]:
     images = []
     for prop in [
         "og:image",
@@ -585,18 +975,18 @@ def _extract_meta_images(soup: BeautifulSoup, base_url: str) -> List[str]:
         "twitter:image",
         "twitter:image:src",
     ]:
-        meta = soup.find("meta", property=prop) or soup.find(
-            "meta", attrs={"name": prop}
+        content = _meta_content(doc, "property", prop) or _meta_content(
+            doc, "name", prop
         )
-        if meta and meta.get("content"):
-            images.append(_resolve_url(base_url, meta["content"]))
+        if content:
+            images.append(_resolve_url(base_url, content))
     return images
 
 
-def _extract_jsonld(soup: BeautifulSoup) -> List[dict]:
+def _extract_jsonld(doc: lxml.html.HtmlElement) -> List[dict]:
     items = []
-    for script in soup.find_all("script", type="application/ld+json"):
-        raw = script.string or script.get_text(strip=True)
+    for script in doc.iterfind(".//script[@type='application/ld+json']"):
+        raw = (script.text or "").strip()
         if not raw:
             continue
         try:
@@ -642,14 +1032,27 @@ def _extract_jsonld_images(items: List[dict]) -> List[str]:
     return images
 
 
-def _extract_body_text(html: str) -> str:
-    doc = Document(html)
-    summary_html = doc.summary()
-    soup = BeautifulSoup(summary_html, "lxml")
-    text = soup.get_text(separator=" ", strip=True)
+class _ParsedDocument(Document):
+    """readability Document that starts from an already-parsed page tree.
+
+    Overrides readability's private ``_parse`` (the version is pinned in
+    requirements.txt for that reason); the body mirrors 0.8.1's minus the
+    ``build_doc`` call.
+    """
+
+    def _parse(self, input: lxml.html.HtmlElement) -> lxml.html.HtmlElement:
+        # clean_html deep-copies element input, so readability's retries never
+        # touch the shared tree.
+        doc = html_cleaner.clean_html(input)
+        doc.resolve_base_href(handle_failures=self.handle_failures)
+        return doc
+
+
+def _extract_body_text(doc: lxml.html.HtmlElement) -> str:
+    summary_html = _ParsedDocument(doc).summary(html_partial=True)
+    text = _html_text(lxml.html.fragment_fromstring(summary_html, create_parent=True))
     if len(text) < 200:
-        full = BeautifulSoup(html, "lxml")
-        text = full.get_text(separator=" ", strip=True)
+        text = _html_text(doc)
     return _clean_text(text)
 
 
@@ -667,13 +1070,68 @@ def _looks_blocked(text: str) -> bool:
     )
 
 
-def _fetch_html(url: str) -> Tuple[str, str, str]:
-    resp = requests.get(url, headers=DEFAULT_HEADERS, timeout=12)
-    resp.raise_for_status()
-    content_type = resp.headers.get("Content-Type", "")
-    if not _is_html_content_type(content_type):
-        return "", resp.url, content_type
-    return resp.text, resp.url, content_type
+def _declared_charset(content_type: str, raw: bytes) -> str:
+    match = re.search(r"charset=[\"']?([\w.:-]+)", content_type, re.I)
+    if not match:
+        match = re.search(
+            rb"<meta[^>]+charset=[\"']?([\w.:-]+)", raw[:4096], re.I
+        )
+    if not match:
+        return "utf-8"
+    charset = match.group(1)
+    if isinstance(charset, bytes):
+        charset = charset.decode("ascii", "replace")
+    try:
+        return codecs.lookup(charset).name
+    except LookupError:
+        return "utf-8"
+
+
+def _read_html_body(resp: Any, head_only: bool = False) -> str:
+    """Read a streamed HTML response, stopping at HTML_FETCH_MAX_BYTES.
+
+    With ``head_only`` the bytes are also fed to lxml's pull parser and
+    reading stops as soon as ``</head>`` has been seen, which is all the
+    og:/twitter: meta and JSON-LD lookups need.
+    """
+    parser = (
+        lxml.etree.HTMLPullParser(events=("end",), tag="head") if head_only else None
+    )
+    chunks: List[bytes] = []
+    size = 0
+    for chunk in resp.iter_content(HTML_STREAM_CHUNK_BYTES):
+        if not chunk:
+            continue
+        chunk = chunk[: HTML_FETCH_MAX_BYTES - size]
+        chunks.append(chunk)
+        size += len(chunk)
+        if parser is not None:
+            parser.feed(chunk)
+            if any(True for _ in parser.read_events()):
+                break
+        if size >= HTML_FETCH_MAX_BYTES:
+            break
+    raw = b"".join(chunks)
+    charset = _declared_charset(resp.headers.get("Content-Type", ""), raw)
+    return raw.decode(charset, "replace")
+
+
+def _fetch_html(
+    url: str,
+    head_only: bool = False,
+    validators: Optional[Dict[str, str]] = None,
+) -> Tuple[str, str, str]:
+    """Fetch a page; ``validators`` is filled with its ETag/Last-Modified."""
+    with _http_get(url, headers=DEFAULT_HEADERS, timeout=12, stream=True) as resp:
+        resp.raise_for_status()
+        if validators is not None:
+            for name, header in (("etag", "ETag"), ("last_modified", "Last-Modified")):
+                if resp.headers.get(header):
+                    validators[name] = resp.headers[header]
+        content_type = resp.headers.get("Content-Type", "")
+        if not _is_html_content_type(content_type):
+            return "", resp.url, content_type
+        return _read_html_body(resp, head_only=head_only), resp.url, content_type
 
 
 def _fetch_jina_text(url: str) -> Optional[str]:
@@ -683,7 +1141,7 @@ def _fetch_jina_text(url: str) -> Optional[str]:
         wrapped = (
             f"https://r.jina.ai/{parsed.scheme}://{parsed.netloc}{parsed.path}{query}"
         )
-        resp = requests.get(wrapped, headers=DEFAULT_HEADERS, timeout=14)
+        resp = _http_get(wrapped, headers=DEFAULT_HEADERS, timeout=14)
         text = _clean_text(resp.text)
         if resp.status_code == 200 and len(text) > 200 and not _looks_blocked(text):
             return text
@@ -762,6 +1220,127 @@ def _claim_key(text: str) -> str:
     return _clean_text(re.sub(r"^\[Image\]\s*", "", text or "", flags=re.I)).lower()
 
 
+def _verdict_cache_key(kind: str, text: str, max_claims: int = 0) -> str:
+    parts = [
+        kind,
+        VERDICT_PROMPT_VERSION,
+        GROQ_TEXT_MODEL,
+        GEMINI_PRIMARY_MODEL,
+        datetime.date.today().isoformat(),
+        str(max_claims),
+        _claim_key(text),
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def _cached_verdict(key: str) -> Optional[Any]:
+    cached = VERDICT_CACHE.get(key)
+    return copy.deepcopy(cached) if cached is not None else None
+
+
+def _store_verdict(key: str, value: Any) -> None:
+    VERDICT_CACHE.set(key, copy.deepcopy(value))
+
+
+def _evidence_batch_cost(entry: Dict[str, Any]) -> int:
+    return len(json.dumps(entry, ensure_ascii=False)) // 4 + CLAIM_VERDICT_TOKENS
+
+
+def _text_claim_result(
+    item: Any, grounding_sources: Optional[List[str]] = None
+) -> Optional[Dict[str, Any]]:
+    if not isinstance(item, dict):
+        return None
+    claim = _clean_text(str(item.get("claim", "")))
+    if not claim:
+        claim = _clean_text(str(item.get("statement", "") or item.get("text", "")))
+    if not claim and item.get("explanation"):
+        claim = "Text claim analysis"
+    if not claim:
+        return None
+    return {
+        "claim": claim,
+        "result": {
+            "verdict": item.get("verdict", "INSUFFICIENT EVIDENCE"),
+            "confidence": _coerce_confidence(item.get("confidence", 75)),
+            "explanation": item.get("explanation", "Analysis completed"),
+            "sources": _clean_sources(item.get("sources", []), grounding_sources),
+        },
+    }
+
+
+def _claim_error_result(response: Optional[GeminiResponse]) -> Dict[str, Any]:
+    status = response.status_code if response is not None else "no-response"
+    error_detail = ""
+    if response and response.body:
+        parsed = _try_parse_json_block(response.body)
+        if isinstance(parsed, dict) and "error" in parsed:
+            if isinstance(parsed["error"], str):
+                error_detail = f"; {parsed['error']}"
+            else:
+                error_detail = f"; {json.dumps(parsed['error'])}"
+        elif response.body:
+            error_detail = f"; {response.body[:200]}"
+    return {
+        "verdict": "ERROR",
+        "confidence": 0,
+        "explanation": f"Failed to verify claim (upstream status: {status}{error_detail})",
+        "sources": [],
+    }
+
+
+def _claim_verdict(
+    parsed: Dict[str, Any], grounding_sources: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    urls: List[str] = []
+    if isinstance(parsed.get("sources"), list):
+        for item in parsed["sources"]:
+            if isinstance(item, str) and re.match(
+                r"^https?://", item.strip(), flags=re.I
+            ):
+                urls.append(item.strip())
+    if not urls and isinstance(parsed.get("explanation"), str):
+        urls = re.findall(r"https?://[^\s)\]}]+", parsed["explanation"], flags=re.I)
+    conf_val = parsed.get("confidence", 75)
+    if isinstance(conf_val, str):
+        conf_val = re.sub(r"[^\d]", "", conf_val)
+        conf_val = int(conf_val) if conf_val else 75
+    else:
+        try:
+            conf_val = int(conf_val)
+        except Exception:
+            conf_val = 75
+    return {
+        "verdict": parsed.get("verdict", "INSUFFICIENT EVIDENCE"),
+        "confidence": conf_val,
+        "explanation": parsed.get("explanation", "Analysis completed"),
+        "sources": _clean_sources(urls, grounding_sources),
+    }
+
+
+def _known_claim_result(item: Any) -> Optional[Dict[str, Any]]:
+    """Return a stored evidence-checked result for this claim, keeping its wording."""
+    if (
+        not isinstance(item, dict)
+        or not item.get("claim")
+        or not isinstance(item.get("result"), dict)
+    ):
+        return None
+    stored = CLAIM_STORE.get(_verdict_cache_key("claim_result", item["claim"]))
+    if stored is None:
+        return None
+    return {"claim": item["claim"], "result": copy.deepcopy(stored)}
+
+
+def _remember_claim_result(item: Dict[str, Any]) -> None:
+    result = item.get("result")
+    if not isinstance(result, dict) or result.get("verdict") == "ERROR":
+        return
+    CLAIM_STORE.set(
+        _verdict_cache_key("claim_result", item["claim"]), copy.deepcopy(result)
+    )
+
+
 def _rank_search_sources(
     items: List[Dict[str, str]], max_results: int
 ) -> List[Dict[str, str]]:
@@ -775,12 +1354,175 @@ def _rank_search_sources(
     return [by_url[url] for url in deduped_urls if url in by_url]
 
 
+def _search_cache_key(host: str, query: str, max_results: int) -> str:
+    normalized = _clean_text(_clean_search_query(query)).lower()
+    return f"search:{host}:{max_results}:{normalized}"
+
+
+def _store_search_results(key: str, results: List[Dict[str, str]]) -> None:
+    if results:
+        SEARCH_CACHE.set(
+            key,
+            {"results": results, "fresh_until": time.time() + SEARCH_CACHE_TTL_SECONDS},
+            SEARCH_CACHE_TTL_SECONDS + SEARCH_CACHE_STALE_SECONDS,
+        )
+    else:
+        SEARCH_CACHE.set(
+            key,
+            {"results": [], "fresh_until": time.time() + SEARCH_NEGATIVE_TTL_SECONDS},
+            SEARCH_NEGATIVE_TTL_SECONDS,
+        )
+
+
+def _revalidate_search(
+    key: str,
+    host: str,
+    search_fn: Callable[[str, int], List[Dict[str, str]]],
+    query: str,
+    max_results: int,
+    stale_results: List[Dict[str, str]],
+) -> None:
+    with _SEARCH_REVALIDATING_LOCK:
+        if key in _SEARCH_REVALIDATING:
+            return
+        _SEARCH_REVALIDATING.add(key)
+
+    def _refresh() -> None:
+        try:
+            results = search_fn(query, max_results)
+            if results:
+                _store_search_results(key, copy.deepcopy(results))
+            else:
+                # Keep serving the stale results, but leave the engine alone
+                # for a while instead of retrying on every request.
+                SEARCH_CACHE.set(
+                    key,
+                    {
+                        "results": stale_results,
+                        "fresh_until": time.time() + SEARCH_NEGATIVE_TTL_SECONDS,
+                    },
+                    SEARCH_NEGATIVE_TTL_SECONDS + SEARCH_CACHE_STALE_SECONDS,
+                )
+        finally:
+            with _SEARCH_REVALIDATING_LOCK:
+                _SEARCH_REVALIDATING.discard(key)
+
+    EVIDENCE_POOL.submit(_refresh, host=host)
+
+
+def _cached_search(host: str) -> Callable:
+    """Cache a search engine's results per normalized query.
+
+    Fresh hits are returned as-is, stale hits are returned while a background
+    refresh runs on EVIDENCE_POOL, and empty (blocked or no-result) answers
+    are remembered for SEARCH_NEGATIVE_TTL_SECONDS.
+    """
+
+    def decorator(search_fn: Callable) -> Callable:
+        @functools.wraps(search_fn)
+        def wrapper(query: str, max_results: int) -> List[Dict[str, str]]:
+            if not _clean_search_query(query):
+                return search_fn(query, max_results)
+            key = _search_cache_key(host, query, max_results)
+            entry = SEARCH_CACHE.get(key)
+            if entry is not None:
+                if entry["results"] and entry["fresh_until"] <= time.time():
+                    _revalidate_search(
+                        key, host, search_fn, query, max_results, entry["results"]
+                    )
+                return copy.deepcopy(entry["results"])
+            results = search_fn(query, max_results)
+            _store_search_results(key, copy.deepcopy(results))
+            return results
+
+        return wrapper
+
+    return decorator
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Result node, link and snippet selectors per engine. The CSS forms drive the
+# BeautifulSoup parser; the XPath forms are the same selectors for raw lxml.
+SERP_CSS_SELECTORS = {
+    "duckduckgo": (".result", ".result__a", ".result__snippet"),
+    "bing": ("li.b_algo", "a", "p"),
+    "yahoo": ("div.dd.algo", "a", ".compText"),
+}
+SERP_XPATHS = {
+    engine: tuple(lxml.etree.XPath(path) for path in paths)
+    for engine, paths in {
+        "duckduckgo": (
+            f"//*[{_has_class('result')}]",
+            f"descendant::*[{_has_class('result__a')}][1]",
+            f"descendant::*[{_has_class('result__snippet')}][1]",
+        ),
+        "bing": (
+            f"//li[{_has_class('b_algo')}]",
+            "descendant::a[1]",
+            "descendant::p[1]",
+        ),
+        "yahoo": (
+            f"//div[{_has_class('dd')} and {_has_class('algo')}]",
+            "descendant::a[1]",
+            f"descendant::*[{_has_class('compText')}][1]",
+        ),
+    }.items()
+}
+
+
+def _serp_rows_lxml(engine: str, html: str) -> Iterable[Tuple[str, str, str]]:
+    results, link_path, snippet_path = SERP_XPATHS[engine]
+    for node in results(lxml.html.document_fromstring(html)):
+        links = link_path(node)
+        if not links:
+            continue
+        snippets = snippet_path(node)
+        yield (
+            links[0].get("href", ""),
+            _html_text(links[0]),
+            _html_text(snippets[0]) if snippets else "",
+        )
+
+
+def _serp_rows_bs4(engine: str, html: str) -> Iterable[Tuple[str, str, str]]:
+    results, link_selector, snippet_selector = SERP_CSS_SELECTORS[engine]
+    for node in BeautifulSoup(html, "lxml").select(results):
+        link = node.select_one(link_selector)
+        if not link:
+            continue
+        snippet_node = node.select_one(snippet_selector)
+        yield (
+            link.get("href", ""),
+            link.get_text(" ", strip=True),
+            snippet_node.get_text(" ", strip=True) if snippet_node else "",
+        )
+
+
+def _parse_serp(engine: str, html: str, max_results: int) -> List[Dict[str, str]]:
+    rows = _serp_rows_bs4 if SERP_PARSER == "bs4" else _serp_rows_lxml
+    items: List[Dict[str, str]] = []
+    for href, title, snippet in rows(engine, html):
+        url = _normalize_source_url(_unwrap_search_result_url(href))
+        if not url or _is_google_grounding_redirect(url):
+            continue
+        items.append(
+            {"url": url, "title": _clean_text(title), "snippet": _clean_text(snippet)}
+        )
+        if len(items) >= max_results * 2:
+            break
+    return _rank_search_sources(items, max_results)
+
+
+@_cached_search("duckduckgo.com")
 def _search_duckduckgo_sources(query: str, max_results: int) -> List[Dict[str, str]]:
     query = _clean_search_query(query)
     if not query:
         return []
     try:
-        resp = requests.get(
+        resp = _http_get(
             "https://duckduckgo.com/html/",
             params={"q": query},
             headers=DEFAULT_HEADERS,
@@ -788,34 +1530,18 @@ def _search_duckduckgo_sources(query: str, max_results: int) -> List[Dict[str, s
         )
         if resp.status_code != 200:
             return []
-        soup = BeautifulSoup(resp.text, "lxml")
-        items: List[Dict[str, str]] = []
-        for node in soup.select(".result"):
-            link = node.select_one(".result__a")
-            if not link:
-                continue
-            url = _normalize_source_url(_unwrap_search_result_url(link.get("href", "")))
-            if not url or _is_google_grounding_redirect(url):
-                continue
-            title = _clean_text(link.get_text(" ", strip=True))
-            snippet_node = node.select_one(".result__snippet")
-            snippet = _clean_text(
-                snippet_node.get_text(" ", strip=True) if snippet_node else ""
-            )
-            items.append({"url": url, "title": title, "snippet": snippet})
-            if len(items) >= max_results * 2:
-                break
-        return _rank_search_sources(items, max_results)
+        return _parse_serp("duckduckgo", resp.text, max_results)
     except Exception:
         return []
 
 
+@_cached_search("bing.com")
 def _search_bing_sources(query: str, max_results: int) -> List[Dict[str, str]]:
     query = _clean_search_query(query)
     if not query:
         return []
     try:
-        resp = requests.get(
+        resp = _http_get(
             "https://www.bing.com/search",
             params={"q": query},
             headers=DEFAULT_HEADERS,
@@ -823,34 +1549,18 @@ def _search_bing_sources(query: str, max_results: int) -> List[Dict[str, str]]:
         )
         if resp.status_code != 200:
             return []
-        soup = BeautifulSoup(resp.text, "lxml")
-        items: List[Dict[str, str]] = []
-        for node in soup.select("li.b_algo"):
-            link = node.find("a")
-            if not link:
-                continue
-            url = _normalize_source_url(_unwrap_search_result_url(link.get("href", "")))
-            if not url or _is_google_grounding_redirect(url):
-                continue
-            title = _clean_text(link.get_text(" ", strip=True))
-            snippet_node = node.find("p")
-            snippet = _clean_text(
-                snippet_node.get_text(" ", strip=True) if snippet_node else ""
-            )
-            items.append({"url": url, "title": title, "snippet": snippet})
-            if len(items) >= max_results * 2:
-                break
-        return _rank_search_sources(items, max_results)
+        return _parse_serp("bing", resp.text, max_results)
     except Exception:
         return []
 
 
+@_cached_search("search.yahoo.com")
 def _search_yahoo_sources(query: str, max_results: int) -> List[Dict[str, str]]:
     query = _clean_search_query(query)
     if not query:
         return []
     try:
-        resp = requests.get(
+        resp = _http_get(
             "https://search.yahoo.com/search",
             params={"p": query},
             headers=DEFAULT_HEADERS,
@@ -858,30 +1568,94 @@ def _search_yahoo_sources(query: str, max_results: int) -> List[Dict[str, str]]:
         )
         if resp.status_code != 200:
             return []
-        soup = BeautifulSoup(resp.text, "lxml")
-        items: List[Dict[str, str]] = []
-        for node in soup.select("div.dd.algo"):
-            link = node.find("a")
-            if not link:
-                continue
-            url = _normalize_source_url(_unwrap_search_result_url(link.get("href", "")))
-            if not url or _is_google_grounding_redirect(url):
-                continue
-            title = _clean_text(link.get_text(" ", strip=True))
-            snippet_node = node.find(class_="compText")
-            snippet = _clean_text(
-                snippet_node.get_text(" ", strip=True) if snippet_node else ""
-            )
-            items.append({"url": url, "title": title, "snippet": snippet})
-            if len(items) >= max_results * 2:
-                break
-        return _rank_search_sources(items, max_results)
+        return _parse_serp("yahoo", resp.text, max_results)
     except Exception:
         return []
 
 
 def _search_web_sources(
     query: str, max_results: int = MAX_WEB_EVIDENCE_SOURCES
+) -> List[Dict[str, str]]:
+    if not WEB_SEARCH_CONCURRENT:
+        return _search_web_sources_sequential(query, max_results)
+    return _search_web_sources_concurrent(query, max_results)
+
+
+def _distinct_nonsocial_count(items: List[Dict[str, str]], limit: int) -> int:
+    urls = [
+        item["url"] for item in items if not _is_social_source_url(item.get("url", ""))
+    ]
+    return len(_dedupe_sources(urls, limit))
+
+
+def _search_engines() -> List[Tuple[str, Callable[[str, int], List[Dict[str, str]]]]]:
+    # Resolved per call so each engine runs under its own host limit.
+    if not WEB_SEARCH_CONCURRENT:
+        return [("", _search_web_sources_sequential)]
+    return [
+        ("duckduckgo.com", _search_duckduckgo_sources),
+        ("bing.com", _search_bing_sources),
+        ("search.yahoo.com", _search_yahoo_sources),
+    ]
+
+
+class _ClaimSearch:
+    """Engine queries for one claim on EVIDENCE_POOL, merged in priority order."""
+
+    def __init__(self, query: str, max_results: int):
+        self.query = query
+        self.max_results = max_results
+        self.results_by_engine: Dict[int, List[Dict[str, str]]] = {}
+        self.futures: Dict[Future, int] = {
+            EVIDENCE_POOL.submit(search_fn, query, max_results, host=host): index
+            for index, (host, search_fn) in enumerate(_search_engines())
+        }
+
+    def record(self, future: Future) -> None:
+        self.results_by_engine[self.futures[future]] = (
+            _future_result_or_none(future) or []
+        )
+
+    def combined(self) -> List[Dict[str, str]]:
+        return [
+            item
+            for index in sorted(self.results_by_engine)
+            for item in self.results_by_engine[index]
+        ]
+
+    def settled(self) -> bool:
+        if len(self.results_by_engine) == len(self.futures):
+            return True
+        return (
+            _distinct_nonsocial_count(self.combined(), self.max_results)
+            >= self.max_results
+        )
+
+    def finish(self) -> List[Dict[str, str]]:
+        for future in self.futures:
+            future.cancel()
+        return _rank_search_sources(self.combined(), self.max_results)
+
+
+def _search_web_sources_concurrent(
+    query: str, max_results: int
+) -> List[Dict[str, str]]:
+    """Query every engine at once and stop once enough non-social sources arrive."""
+    search = _ClaimSearch(query, max_results)
+    try:
+        for future in as_completed(
+            search.futures, timeout=WEB_SEARCH_TIMEOUT_SECONDS + 2
+        ):
+            search.record(future)
+            if search.settled():
+                break
+    except FuturesTimeoutError:
+        pass
+    return search.finish()
+
+
+def _search_web_sources_sequential(
+    query: str, max_results: int
 ) -> List[Dict[str, str]]:
     combined: List[Dict[str, str]] = []
     for search_fn in (
@@ -898,31 +1672,67 @@ def _search_web_sources(
     return _rank_search_sources(combined, max_results)
 
 
+def _page_summary_cache_key(url: str) -> str:
+    return f"summary:{_normalize_source_url(url) or url}"
+
+
+def _apply_page_summary(
+    source: Dict[str, str], summary: Dict[str, str]
+) -> Dict[str, str]:
+    if summary.get("title"):
+        source["title"] = summary["title"]
+    if summary.get("snippet"):
+        source["snippet"] = summary["snippet"]
+    return source
+
+
+def _cached_page_summary(url: str) -> Optional[Dict[str, str]]:
+    if not url or _is_social_source_url(url):
+        return None
+    return PAGE_SUMMARY_CACHE.get(_page_summary_cache_key(url))
+
+
 def _fetch_evidence_page_summary(source: Dict[str, str]) -> Dict[str, str]:
     url = source.get("url", "")
     if not url or _is_social_source_url(url):
         return source
-    try:
-        resp = requests.get(
-            url, headers=DEFAULT_HEADERS, timeout=WEB_EVIDENCE_FETCH_TIMEOUT_SECONDS
+    cached = _cached_page_summary(url)
+    if cached is not None:
+        return _apply_page_summary(source, cached)
+    summary = _fetch_page_summary_uncached(url)
+    if summary is None:
+        # Remember unreachable pages briefly so every claim on the topic does
+        # not wait out the fetch timeout again.
+        PAGE_SUMMARY_CACHE.set(
+            _page_summary_cache_key(url), {}, PAGE_SUMMARY_NEGATIVE_TTL_SECONDS
         )
-        if resp.status_code >= 400 or not _is_html_content_type(
-            resp.headers.get("Content-Type", "")
-        ):
-            return source
-        soup = BeautifulSoup(resp.text, "lxml")
-        title, description = _extract_meta_text(soup)
-        body = _extract_body_text(resp.text)
+        return source
+    PAGE_SUMMARY_CACHE.set(_page_summary_cache_key(url), summary)
+    return _apply_page_summary(source, summary)
+
+
+def _fetch_page_summary_uncached(url: str) -> Optional[Dict[str, str]]:
+    try:
+        with _http_get(
+            url,
+            headers=DEFAULT_HEADERS,
+            timeout=WEB_EVIDENCE_FETCH_TIMEOUT_SECONDS,
+            stream=True,
+        ) as resp:
+            if resp.status_code >= 400 or not _is_html_content_type(
+                resp.headers.get("Content-Type", "")
+            ):
+                return None
+            html = _read_html_body(resp)
+        doc = _parse_html(html)
+        title, description = _extract_meta_text(doc)
+        body = _extract_body_text(doc)
         summary = _clean_text(
             " ".join(part for part in [description, body[:900]] if part)
         )
-        if title:
-            source["title"] = title
-        if summary:
-            source["snippet"] = _truncate(summary, 900)
     except Exception:
-        pass
-    return source
+        return None
+    return {"title": title or "", "snippet": _truncate(summary, 900) if summary else ""}
 
 
 def _gather_web_evidence_for_claims(
@@ -936,39 +1746,62 @@ def _gather_web_evidence_for_claims(
         return {}
 
     evidence: Dict[str, List[Dict[str, str]]] = {}
-    with ThreadPoolExecutor(max_workers=min(4, len(clean_claims))) as executor:
-        futures = {
-            executor.submit(_search_web_sources, claim): claim for claim in clean_claims
-        }
-        for future in as_completed(futures):
-            claim = futures[future]
-            try:
-                sources = future.result() or []
-            except Exception:
-                sources = []
-            evidence[claim] = sources
-
-    fetch_candidates: List[Tuple[str, Dict[str, str]]] = []
-    for claim, sources in evidence.items():
-        for source in sources[:MAX_WEB_EVIDENCE_FETCHES]:
-            fetch_candidates.append((claim, source))
-
-    if fetch_candidates:
-        with ThreadPoolExecutor(max_workers=min(6, len(fetch_candidates))) as executor:
-            futures = {
-                executor.submit(_fetch_evidence_page_summary, dict(source)): (
-                    claim,
-                    index,
-                )
-                for claim, sources in evidence.items()
-                for index, source in enumerate(sources[:MAX_WEB_EVIDENCE_FETCHES])
-            }
-            for future in as_completed(futures):
-                claim, index = futures[future]
-                try:
-                    evidence[claim][index] = future.result()
-                except Exception:
-                    pass
+    searches = {
+        claim: _ClaimSearch(claim, MAX_WEB_EVIDENCE_SOURCES) for claim in clean_claims
+    }
+    # Maps every outstanding future to (claim, source index); search futures
+    # use index None. A claim's page fetches are queued as soon as its own
+    # search settles rather than after every claim has been searched.
+    pending: Dict[Future, Tuple[str, Optional[int]]] = {
+        future: (claim, None)
+        for claim, search in searches.items()
+        for future in search.futures
+    }
+
+    def _settle(claim: str, fetch: bool = True) -> None:
+        search = searches.pop(claim)
+        for future in search.futures:
+            pending.pop(future, None)
+        evidence[claim] = search.finish()
+        for index, source in enumerate(evidence[claim][:MAX_WEB_EVIDENCE_FETCHES]):
+            # Pages already summarized for an earlier claim are filled in
+            # directly; only misses go to the pool.
+            cached = _cached_page_summary(source.get("url", ""))
+            if cached is not None:
+                _apply_page_summary(source, cached)
+                continue
+            if not fetch or _is_social_source_url(source.get("url", "")):
+                continue
+            future = EVIDENCE_POOL.submit(
+                _fetch_evidence_page_summary,
+                dict(source),
+                host=urlparse(source.get("url", "")).hostname or "",
+            )
+            pending[future] = (claim, index)
+
+    deadline = time.monotonic() + WEB_EVIDENCE_DEADLINE_SECONDS
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        done, _ = wait(list(pending), timeout=remaining, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future not in pending:
+                continue
+            claim, index = pending.pop(future)
+            if index is None:
+                searches[claim].record(future)
+                if searches[claim].settled():
+                    _settle(claim)
+                continue
+            result = _future_result_or_none(future)
+            if result is not None:
+                evidence[claim][index] = result
+
+    for claim in list(searches):
+        _settle(claim, fetch=False)
+    for future in pending:
+        future.cancel()
     return evidence
 
 
@@ -1018,9 +1851,11 @@ def _has_substantial_article_text(text: str) -> bool:
     return len(_clean_text(text)) >= 400
 
 
-def _extract_images_from_html(soup: BeautifulSoup, base_url: str) -> List[str]:
+def _extract_images_from_html(
+    doc: lxml.html.HtmlElement, base_url: str
+) -> List[str]:
     images: List[str] = []
-    for img in soup.find_all("img"):
+    for img in doc.iter("img"):
         src = img.get("src") or img.get("data-src") or img.get("data-original")
         if not src:
             srcset = img.get("srcset")
@@ -1068,6 +1903,145 @@ def _image_detection_info(url: str, text: str, image_urls: List[str]) -> Dict[st
     }
 
 
+def _future_result_or_none(future: Future) -> Any:
+    try:
+        return future.result()
+    except Exception:
+        return None
+
+
+class FailureMemory:
+    """Remembers routes that keep failing and skips them for a cooldown.
+
+    A route is skipped once it has failed ``threshold`` times in a row, until
+    ``cooldown`` seconds have passed; any success resets its count.
+    """
+
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._failures: Dict[str, int] = {}
+        self._skip_until: Dict[str, float] = {}
+
+    def should_skip(self, route: str) -> bool:
+        with self._lock:
+            return self._skip_until.get(route, 0.0) > time.monotonic()
+
+    def record_failure(self, route: str) -> None:
+        with self._lock:
+            count = self._failures.get(route, 0) + 1
+            self._failures[route] = count
+            if count >= self.threshold:
+                self._skip_until[route] = time.monotonic() + self.cooldown
+                self._failures[route] = 0
+
+    def record_success(self, route: str) -> None:
+        with self._lock:
+            self._failures.pop(route, None)
+            self._skip_until.pop(route, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._failures.clear()
+            self._skip_until.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "cooling_down": sorted(
+                    route for route, until in self._skip_until.items() if until > now
+                ),
+                "failures": dict(self._failures),
+            }
+
+
+REDDIT_FAILURES = FailureMemory(
+    threshold=REDDIT_FAILURE_THRESHOLD, cooldown=REDDIT_FAILURE_COOLDOWN_SECONDS
+)
+
+
+class RouteUnavailable(Exception):
+    """A route answered, but with a status saying it is blocked or down."""
+
+
+def _check_route_status(resp: Any) -> None:
+    """Raise RouteUnavailable for 403, 429 and 5xx responses."""
+    if resp.status_code in (403, 429) or resp.status_code >= 500:
+        raise RouteUnavailable(f"HTTP {resp.status_code}")
+
+
+def _hedged_first(
+    attempts: List[Tuple[str, Callable[[], Any]]],
+    failures: FailureMemory,
+    hedge_delay: Optional[float] = None,
+    deadline: Optional[float] = None,
+) -> Optional[Any]:
+    """Return the first truthy result from ``attempts`` using hedged requests.
+
+    Attempts start in order on ADAPTER_POOL; the next one is launched as soon
+    as the previous fails, or after ``hedge_delay`` seconds without an answer.
+    Routes are "<host> <shape>" keys; routes cooling down in ``failures`` are
+    skipped (unless every route is cooling down). Only attempts that raise
+    (transport errors, RouteUnavailable) count as route failures; an empty
+    answer such as a deleted post is neutral. Delay and deadline default to
+    the reddit adapter settings.
+    """
+    if hedge_delay is None:
+        hedge_delay = REDDIT_HEDGE_DELAY_SECONDS
+    if deadline is None:
+        deadline = REDDIT_ADAPTER_DEADLINE_SECONDS
+    active = [
+        attempt for attempt in attempts if not failures.should_skip(attempt[0])
+    ]
+    attempts = active or attempts
+    if not attempts:
+        return None
+    running: Dict[Future, Tuple[int, str]] = {}
+    next_index = 0
+    end = time.monotonic() + deadline
+
+    def _launch() -> None:
+        nonlocal next_index
+        route, attempt = attempts[next_index]
+        future = ADAPTER_POOL.submit(attempt, host=route.split(" ", 1)[0])
+        running[future] = (next_index, route)
+        next_index += 1
+
+    try:
+        _launch()
+        while running:
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                break
+            if next_index < len(attempts):
+                remaining = min(hedge_delay, remaining)
+            done, _ = wait(
+                list(running), timeout=remaining, return_when=FIRST_COMPLETED
+            )
+            if not done:
+                if next_index < len(attempts):
+                    _launch()
+                continue
+            for future in sorted(done, key=lambda item: running[item][0]):
+                _, route = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception:
+                    failures.record_failure(route)
+                    continue
+                if result:
+                    failures.record_success(route)
+                    return result
+            if next_index < len(attempts):
+                _launch()
+    finally:
+        for future in running:
+            future.cancel()
+    return None
+
+
 def _build_reddit_json_url(url: str) -> str:
     parsed = urlparse(url)
     path = parsed.path.rstrip("/")
@@ -1120,53 +2094,74 @@ def _reddit_post_from_json(data: Any) -> Optional[Dict[str, Any]]:
     return None
 
 
-def _extract_reddit_json(url: str) -> Optional[Dict[str, Any]]:
+def _reddit_json_post(json_url: str) -> Optional[Dict[str, Any]]:
     headers = {
         **BROWSER_HEADERS,
         "User-Agent": "AI-Fact-Checker/1.0 by u/ad_unboxthetech",
         "Accept": "application/json,text/html;q=0.9,*/*;q=0.8",
     }
-    for json_url in _reddit_request_candidates(url):
-        try:
-            resp = requests.get(json_url, headers=headers, timeout=10)
-            if resp.status_code != 200:
-                continue
-            post = _reddit_post_from_json(resp.json())
-            if not post:
-                continue
-            title = post.get("title", "")
-            body = post.get("selftext", "")
-            text = _clean_text(f"{title} {body}")
-            images: List[str] = []
-            if post.get("url_overridden_by_dest") and _is_image_like(
-                post["url_overridden_by_dest"]
-            ):
-                images.append(post["url_overridden_by_dest"])
-            preview = post.get("preview", {}).get("images", [])
-            for img in preview:
-                source = img.get("source", {}).get("url")
-                if source:
-                    images.append(source.replace("&amp;", "&"))
-                for resolution in img.get("resolutions", []) or []:
-                    url_value = resolution.get("url")
-                    if url_value:
-                        images.append(url_value.replace("&amp;", "&"))
-            media_meta = post.get("media_metadata") or {}
-            for media in media_meta.values():
-                if media.get("e") == "Image" and media.get("s"):
-                    src = media["s"].get("u") or media["s"].get("gif")
-                    if src:
-                        images.append(src.replace("&amp;", "&"))
-            return {"text": text, "title": title, "images": _dedupe(images)}
-        except Exception:
-            continue
-    return None
+    resp = _http_get(json_url, headers=headers, timeout=10)
+    _check_route_status(resp)
+    if resp.status_code != 200:
+        return None
+    post = _reddit_post_from_json(resp.json())
+    if not post:
+        return None
+    title = post.get("title", "")
+    body = post.get("selftext", "")
+    text = _clean_text(f"{title} {body}")
+    images: List[str] = []
+    if post.get("url_overridden_by_dest") and _is_image_like(
+        post["url_overridden_by_dest"]
+    ):
+        images.append(post["url_overridden_by_dest"])
+    preview = post.get("preview", {}).get("images", [])
+    for img in preview:
+        source = img.get("source", {}).get("url")
+        if source:
+            images.append(source.replace("&amp;", "&"))
+        for resolution in img.get("resolutions", []) or []:
+            url_value = resolution.get("url")
+            if url_value:
+                images.append(url_value.replace("&amp;", "&"))
+    media_meta = post.get("media_metadata") or {}
+    for media in media_meta.values():
+        if media.get("e") == "Image" and media.get("s"):
+            src = media["s"].get("u") or media["s"].get("gif")
+            if src:
+                images.append(src.replace("&amp;", "&"))
+    return {"text": text, "title": title, "images": _dedupe(images)}
+
+
+def _reddit_route(request_url: str) -> str:
+    """Failure-memory key for a reddit fetch: host plus URL shape."""
+    parsed = urlparse(request_url)
+    if "/by_id/" in parsed.path:
+        shape = "by_id"
+    elif parsed.path.endswith(".json"):
+        shape = "json"
+    else:
+        shape = "path"
+    return f"{parsed.netloc.lower()} {shape}"
+
+
+def _reddit_json_attempts(url: str) -> List[Tuple[str, Callable[[], Any]]]:
+    return [
+        (_reddit_route(json_url), functools.partial(_reddit_json_post, json_url))
+        for json_url in _reddit_request_candidates(url)
+    ]
+
+
+def _extract_reddit_json(url: str) -> Optional[Dict[str, Any]]:
+    return _hedged_first(_reddit_json_attempts(url), REDDIT_FAILURES)
 
 
 def _extract_reddit_old_html(url: str) -> Optional[Dict[str, Any]]:
+    # Transport errors and blocked statuses propagate to _hedged_first.
+    resp = _http_get(_reddit_old_url(url), headers=BROWSER_HEADERS, timeout=10)
+    _check_route_status(resp)
     try:
         post_id = _reddit_post_id(url)
-        resp = requests.get(_reddit_old_url(url), headers=BROWSER_HEADERS, timeout=10)
         if resp.status_code != 200:
             return None
         soup = BeautifulSoup(resp.text, "lxml")
@@ -1214,13 +2209,14 @@ def _extract_reddit_old_html(url: str) -> Optional[Dict[str, Any]]:
 
 
 def _extract_reddit_unfurled(url: str) -> Optional[Dict[str, Any]]:
+    resp = _http_get(
+        "https://api.microlink.io/",
+        params={"url": url},
+        headers=DEFAULT_HEADERS,
+        timeout=12,
+    )
+    _check_route_status(resp)
     try:
-        resp = requests.get(
-            "https://api.microlink.io/",
-            params={"url": url},
-            headers=DEFAULT_HEADERS,
-            timeout=12,
-        )
         if resp.status_code != 200:
             return None
         data = resp.json().get("data") or {}
@@ -1303,102 +2299,139 @@ def _extract_twitter(url: str) -> Optional[Dict[str, Any]]:
                 images.append(cleaned)
         images = _dedupe(images)
 
-    try:
+    def _fetch_tweet_result() -> Optional[Tuple[str, str, List[str]]]:
         # Newer syndication endpoint with richer media details
-        result_url = "https://cdn.syndication.twimg.com/tweet-result"
-        resp = requests.get(
-            result_url,
+        resp = _http_get(
+            "https://cdn.syndication.twimg.com/tweet-result",
             params={"id": tweet_id, "lang": "en"},
             headers=DEFAULT_HEADERS,
             timeout=10,
         )
-        if resp.status_code == 200:
-            data = resp.json()
-            text = _pick_text(data)
-            screen_name = _pick_screen_name(data)
-            title = f"Post by @{screen_name}" if screen_name else "Twitter/X post"
-            candidate_images: List[str] = []
-            for media in data.get("mediaDetails", []) or []:
-                media_type = (media.get("type") or "").lower()
-                if media_type in {"photo", "image"}:
-                    media_url = media.get("media_url_https") or media.get("media_url")
-                    if media_url:
-                        candidate_images.append(media_url)
-                elif media_type in {"video", "animated_gif"}:
-                    preview = (
-                        media.get("media_url_https")
-                        or media.get("media_url")
-                        or media.get("preview_image_url")
-                    )
-                    if preview:
-                        candidate_images.append(preview)
-            if not candidate_images:
-                for photo in data.get("photos", []) or []:
-                    if photo.get("url"):
-                        candidate_images.append(photo.get("url"))
-            if not candidate_images and isinstance(data.get("extended_entities"), dict):
-                for media in data["extended_entities"].get("media", []) or []:
-                    media_url = media.get("media_url_https") or media.get("media_url")
-                    if media_url:
-                        candidate_images.append(media_url)
-            _merge_candidate(text, title, candidate_images)
-    except Exception:
-        pass
-
-    try:
-        api_url = "https://cdn.syndication.twimg.com/widgets/tweet"
-        resp = requests.get(
-            api_url,
+        if resp.status_code != 200:
+            return None
+        data = resp.json()
+        text = _pick_text(data)
+        screen_name = _pick_screen_name(data)
+        title = f"Post by @{screen_name}" if screen_name else "Twitter/X post"
+        candidate_images: List[str] = []
+        for media in data.get("mediaDetails", []) or []:
+            media_type = (media.get("type") or "").lower()
+            if media_type in {"photo", "image"}:
+                media_url = media.get("media_url_https") or media.get("media_url")
+                if media_url:
+                    candidate_images.append(media_url)
+            elif media_type in {"video", "animated_gif"}:
+                preview = (
+                    media.get("media_url_https")
+                    or media.get("media_url")
+                    or media.get("preview_image_url")
+                )
+                if preview:
+                    candidate_images.append(preview)
+        if not candidate_images:
+            for photo in data.get("photos", []) or []:
+                if photo.get("url"):
+                    candidate_images.append(photo.get("url"))
+        if not candidate_images and isinstance(data.get("extended_entities"), dict):
+            for media in data["extended_entities"].get("media", []) or []:
+                media_url = media.get("media_url_https") or media.get("media_url")
+                if media_url:
+                    candidate_images.append(media_url)
+        return text, title, candidate_images
+
+    def _fetch_widgets() -> Optional[Tuple[str, str, List[str]]]:
+        resp = _http_get(
+            "https://cdn.syndication.twimg.com/widgets/tweet",
             params={"id": tweet_id, "lang": "en"},
             headers=DEFAULT_HEADERS,
             timeout=10,
         )
-        if resp.status_code == 200:
-            data = resp.json()
-            text = data.get("text") or data.get("full_text") or ""
-            user = data.get("user") or {}
-            title = (
-                f"Post by @{user.get('screen_name', 'user')}"
-                if user
-                else "Twitter/X post"
-            )
-            candidate_images: List[str] = []
-            for photo in data.get("photos", []) or []:
-                if photo.get("url"):
-                    candidate_images.append(photo.get("url"))
-            if data.get("video") and data["video"].get("poster"):
-                candidate_images.append(data["video"]["poster"])
-            _merge_candidate(text, title, candidate_images)
-    except Exception:
-        pass
-
-    # Critical fallback for X media extraction when syndication lacks images.
-    proxy = _extract_twitter_via_proxy(url)
-    if proxy:
-        _merge_candidate(
+        if resp.status_code != 200:
+            return None
+        data = resp.json()
+        text = data.get("text") or data.get("full_text") or ""
+        user = data.get("user") or {}
+        title = (
+            f"Post by @{user.get('screen_name', 'user')}" if user else "Twitter/X post"
+        )
+        candidate_images: List[str] = []
+        for photo in data.get("photos", []) or []:
+            if photo.get("url"):
+                candidate_images.append(photo.get("url"))
+        if data.get("video") and data["video"].get("poster"):
+            candidate_images.append(data["video"]["poster"])
+        return text, title, candidate_images
+
+    def _fetch_proxy() -> Optional[Tuple[str, str, List[str]]]:
+        # Critical fallback for X media extraction when syndication lacks images.
+        proxy = _extract_twitter_via_proxy(url)
+        if not proxy:
+            return None
+        return (
             proxy.get("text", ""),
             proxy.get("title", "Twitter/X post"),
             proxy.get("images", []),
         )
 
-    try:
-        oembed = requests.get(
+    def _fetch_oembed() -> Optional[Tuple[str, str, List[str]]]:
+        oembed = _http_get(
             "https://publish.twitter.com/oembed",
             params={"url": url},
             headers=DEFAULT_HEADERS,
             timeout=10,
         )
-        if oembed.status_code == 200:
-            data = oembed.json()
-            html = data.get("html", "")
-            text = (
-                BeautifulSoup(html, "lxml").get_text(" ", strip=True)
-                if html
-                else data.get("title", "")
-            )
-            _merge_candidate(text, data.get("author_name") or "Twitter/X post", [])
-    except Exception:
-        pass
+        if oembed.status_code != 200:
+            return None
+        data = oembed.json()
+        html = data.get("html", "")
+        text = (
+            BeautifulSoup(html, "lxml").get_text(" ", strip=True)
+            if html
+            else data.get("title", "")
+        )
+        return text, data.get("author_name") or "Twitter/X post", []
+
+    # All sources run at once. Candidates are merged in the order above, so
+    # earlier sources keep text/title precedence; once text and title are
+    # settled, later sources that finish can only add images and merge right
+    # away. Stragglers are ignored once text and images are both present or
+    # the overall deadline passes.
+    sources = [
+        (_fetch_tweet_result, "cdn.syndication.twimg.com"),
+        (_fetch_widgets, "cdn.syndication.twimg.com"),
+        (_fetch_proxy, "api.fxtwitter.com"),
+        (_fetch_oembed, "publish.twitter.com"),
+    ]
+    futures = [ADAPTER_POOL.submit(source, host=host) for source, host in sources]
+    deadline = time.monotonic() + TWITTER_ADAPTER_DEADLINE_SECONDS
+    merged = set()
+
+    def _merge_finished(force: bool = False) -> None:
+        for index, future in enumerate(futures):
+            if index in merged:
+                continue
+            if future.done():
+                candidate = _future_result_or_none(future)
+                if candidate:
+                    _merge_candidate(*candidate)
+                merged.add(index)
+            elif not (force or (best_text and best_title != "Twitter/X post")):
+                break
+
+    try:
+        while len(merged) < len(futures) and not (best_text and images):
+            _merge_finished()
+            pending = [future for future in futures if not future.done()]
+            if (best_text and images) or not pending:
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                _merge_finished(force=True)
+                break
+            wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+    finally:
+        for future in futures:
+            future.cancel()
 
     if best_text or images:
         return {"text": best_text, "title": best_title, "images": images}
@@ -1431,7 +2464,7 @@ def _extract_twitter_via_proxy(url: str) -> Optional[Dict[str, Any]]:
     tweet_id = match.group(1)
     try:
         proxy_url = f"https://api.fxtwitter.com/i/status/{tweet_id}"
-        resp = requests.get(proxy_url, headers=DEFAULT_HEADERS, timeout=10)
+        resp = _http_get(proxy_url, headers=DEFAULT_HEADERS, timeout=10)
         if resp.status_code != 200:
             return None
         data = resp.json()
@@ -1457,16 +2490,16 @@ def _extract_twitter_via_proxy(url: str) -> Optional[Dict[str, Any]]:
 
 
 def _extract_reddit(url: str) -> Optional[Dict[str, Any]]:
-    return (
-        _extract_reddit_json(url)
-        or _extract_reddit_old_html(url)
-        or _extract_reddit_unfurled(url)
-    )
+    attempts = _reddit_json_attempts(url) + [
+        ("old.reddit.com html", functools.partial(_extract_reddit_old_html, url)),
+        ("api.microlink.io", functools.partial(_extract_reddit_unfurled, url)),
+    ]
+    return _hedged_first(attempts, REDDIT_FAILURES)
 
 
 def _extract_oembed(url: str, endpoint: str) -> Optional[Dict[str, Any]]:
     try:
-        resp = requests.get(
+        resp = _http_get(
             endpoint,
             params={"url": url, "format": "json"},
             headers=DEFAULT_HEADERS,
@@ -1485,11 +2518,68 @@ def _extract_oembed(url: str, endpoint: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _html_not_modified(url: str, validators: Dict[str, str]) -> bool:
+    headers = dict(DEFAULT_HEADERS)
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    try:
+        # Streamed so a changed page does not download the body twice.
+        with _http_get(url, headers=headers, timeout=12, stream=True) as resp:
+            return resp.status_code == 304
+    except Exception:
+        return False
+
+
 def extract_content_from_url(url: str) -> Dict[str, Any]:
     url = normalize_url(url)
     if not is_valid_url(url):
         raise ValueError("Invalid URL. Only http(s) URLs are supported.")
 
+    cache_key = f"extract:{_normalize_source_url(url) or url}"
+    platform = _detect_platform(url)
+    ttl = EXTRACTION_CACHE_TTLS.get(platform, EXTRACTION_CACHE_TTLS["generic"])
+    entry = EXTRACTION_CACHE.get(cache_key)
+    if entry is not None and entry["fresh_until"] <= time.time():
+        validators = entry.get("validators") or {}
+        if validators and _html_not_modified(url, validators):
+            entry = {**entry, "fresh_until": time.time() + ttl}
+            EXTRACTION_CACHE.set(
+                cache_key, entry, ttl + EXTRACTION_REVALIDATE_WINDOW_SECONDS
+            )
+        else:
+            entry = None
+    if entry is not None:
+        return copy.deepcopy(entry["content"])
+
+    validators: Dict[str, str] = {}
+    content = _extract_content_uncached(url, validators)
+    if platform != "generic":
+        validators = {}
+    if content.get("text") or content.get("image_urls"):
+        entry = {
+            "content": content,
+            "validators": validators,
+            "fresh_until": time.time() + ttl,
+        }
+        EXTRACTION_CACHE.set(
+            cache_key,
+            copy.deepcopy(entry),
+            ttl + EXTRACTION_REVALIDATE_WINDOW_SECONDS if validators else ttl,
+        )
+    return content
+
+
+def _extract_content_uncached(
+    url: str, validators: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """Extract a URL's text and images without the cache.
+
+    ``validators`` is filled with the origin's ETag/Last-Modified only when
+    the returned content was built from the origin's own HTML.
+    """
+    origin_validators: Dict[str, str] = {}
     if _is_image_like(url):
         return {
             "text": "",
@@ -1532,19 +2622,23 @@ def extract_content_from_url(url: str) -> Dict[str, Any]:
 
     if not prefer_extracted and (not text_content or len(text_content.strip()) < 80):
         try:
-            html, final_url, content_type = _fetch_html(url)
+            html, final_url, content_type = _fetch_html(
+                url,
+                head_only=platform in HEAD_ONLY_PLATFORMS,
+                validators=origin_validators,
+            )
         except Exception:
             html = ""
 
     if html:
-        soup = BeautifulSoup(html, "lxml")
-        meta_title, meta_desc = _extract_meta_text(soup)
+        doc = _parse_html(html)
+        meta_title, meta_desc = _extract_meta_text(doc)
         title = title or meta_title
 
-        jsonld_items = _extract_jsonld(soup)
+        jsonld_items = _extract_jsonld(doc)
         jsonld_text = _extract_jsonld_text(jsonld_items)
 
-        body_text = _extract_body_text(html)
+        body_text = _extract_body_text(doc)
         if not prefer_extracted and (
             not text_content or len(text_content.strip()) < 80
         ):
@@ -1555,9 +2649,9 @@ def extract_content_from_url(url: str) -> Dict[str, Any]:
             elif meta_desc:
                 text_content = meta_desc
 
-        image_urls.extend(_extract_meta_images(soup, final_url))
+        image_urls.extend(_extract_meta_images(doc, final_url))
         image_urls.extend(_extract_jsonld_images(jsonld_items))
-        image_urls.extend(_extract_images_from_html(soup, final_url))
+        image_urls.extend(_extract_images_from_html(doc, final_url))
     elif _is_image_content_type(content_type):
         image_urls.append(final_url)
         known_image_urls.append(final_url)
@@ -1571,6 +2665,8 @@ def extract_content_from_url(url: str) -> Dict[str, Any]:
         jina_text = _fetch_jina_text(url)
         if jina_text:
             text_content = jina_text
+            # A 304 from the origin says nothing about the Jina copy.
+            origin_validators = {}
 
     if platform == "twitter" and not image_urls:
         image_urls.extend(_extract_twitter_media_from_jina(url))
@@ -1581,6 +2677,8 @@ def extract_content_from_url(url: str) -> Dict[str, Any]:
 
     image_detection_info = _image_detection_info(url, text_content, image_urls)
 
+    if validators is not None:
+        validators.update(origin_validators)
     return {
         "text": text_content or "",
         "title": title or "",
@@ -1589,6 +2687,43 @@ def extract_content_from_url(url: str) -> Dict[str, Any]:
     }
 
 
+class CheckResults(list):
+    """Results of one FactChecker call, carrying that call's analysis error.
+
+    The checker is shared across request threads, so errors travel with the
+    returned list instead of living on the checker instance.
+    """
+
+    def __init__(self, items: Iterable[Any] = (), error: str = ""):
+        super().__init__(items)
+        self.error = error
+
+
+def _result_error(results: Any) -> str:
+    return getattr(results, "error", "") or ""
+
+
+def _returns_check_results(kind: str) -> Callable:
+    """Wrap a FactChecker method's list result in CheckResults.
+
+    ``kind`` names the per-thread error slot ("text" or "image") the method
+    writes through ``last_text_error``/``last_image_error``.
+    """
+
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args: Any, **kwargs: Any) -> CheckResults:
+            setattr(self._call_state, f"{kind}_error", "")
+            items = method(self, *args, **kwargs)
+            return CheckResults(
+                items, error=getattr(self._call_state, f"{kind}_error", "")
+            )
+
+        return wrapper
+
+    return decorator
+
+
 class FactChecker:
     def __init__(
         self, api_key: Optional[str] = None, groq_api_key: Optional[str] = None
@@ -1618,14 +2753,40 @@ class FactChecker:
                 "No API key configured. Set GROQ_API_KEY and/or GEMINI_API_KEY."
             )
 
-        # Keep legacy attribute for compatibility with _analyze_single_image_url
+        # Legacy single-key attribute kept for callers that still read it
         self.api_key = self.gemini_api_key or self.groq_api_key
 
         self.headers = {
             "Content-Type": "application/json",
         }
-        self.last_image_error = ""
-        self.last_text_error = ""
+        self._call_state = threading.local()
+        # One checker serves every request thread, so evidence re-checks from
+        # concurrent requests land in the same batches.
+        self._evidence_batcher = MicroBatcher(
+            self._recheck_evidence_batch,
+            window=EVIDENCE_BATCH_WINDOW_SECONDS,
+            max_items=EVIDENCE_BATCH_MAX_CLAIMS,
+            max_cost=EVIDENCE_BATCH_MAX_TOKENS,
+            cost=_evidence_batch_cost,
+        )
+
+    @property
+    def last_text_error(self) -> str:
+        """Text analysis error of the current thread's most recent call."""
+        return getattr(self._call_state, "text_error", "")
+
+    @last_text_error.setter
+    def last_text_error(self, value: str) -> None:
+        self._call_state.text_error = value
+
+    @property
+    def last_image_error(self) -> str:
+        """Image analysis error of the current thread's most recent call."""
+        return getattr(self._call_state, "image_error", "")
+
+    @last_image_error.setter
+    def last_image_error(self, value: str) -> None:
+        self._call_state.image_error = value
 
     @staticmethod
     def _translate_messages_to_contents(
@@ -1706,9 +2867,18 @@ class FactChecker:
             return body
 
     def _post_gemini(
-        self, payload: Dict[str, Any], retries: int = GEMINI_RETRY_ATTEMPTS
+        self,
+        payload: Dict[str, Any],
+        retries: int = GEMINI_RETRY_ATTEMPTS,
+        skip_unhealthy: bool = True,
+        on_content: ContentListener = None,
     ) -> Optional[GeminiResponse]:
-        """Call native Gemini API with retry and model fallback on ANY non-200."""
+        """Call native Gemini API with retry and model fallback on ANY non-200.
+
+        With ``on_content`` the model output is streamed (streamGenerateContent
+        over SSE) and the listener sees the text generated so far after every
+        chunk; the returned response is the same as without streaming.
+        """
         last_response: Optional[GeminiResponse] = None
         last_error: Optional[str] = None
         models = _models_for_payload(payload)
@@ -1718,6 +2888,7 @@ class FactChecker:
         contents = self._translate_messages_to_contents(messages)
 
         use_search = bool(payload.get("use_web_search"))
+        estimated_tokens = _estimate_tokens(payload)
 
         # Build generation config
         # CRITICAL: Gemini does NOT support response_mime_type together with tools
@@ -1732,50 +2903,49 @@ class FactChecker:
         # (thinkingConfig is silently ignored by models that don't support it)
 
         for model_index, model in enumerate(models):
-            api_url = (
-                f"{GEMINI_URL_BASE}/{model}:generateContent?key={self.gemini_api_key}"
-            )
+            method = "generateContent?"
+            if on_content:
+                method = "streamGenerateContent?alt=sse&"
+            api_url = f"{GEMINI_URL_BASE}/{model}:{method}key={self.gemini_api_key}"
             native_payload = {"contents": contents}
             if generation_config:
                 native_payload["generationConfig"] = generation_config
             if use_search:
                 native_payload["tools"] = [{"googleSearch": {}}]
             encoded_payload = json.dumps(native_payload).encode("utf-8")
-            model_failed = False
             for attempt in range(retries):
+                if skip_unhealthy and not PROVIDER_ROUTER.allow("gemini", model):
+                    last_error = f"Circuit open for {model}"
+                    break
+                if not _acquire_budget("gemini", model, estimated_tokens):
+                    last_error = f"Rate limit budget exhausted for {model}"
+                    break
+                started = time.perf_counter()
                 try:
-                    req = urllib_request.Request(
+                    upstream = PROVIDER_CLIENTS["gemini"].post(
                         api_url,
+                        model=model,
                         data=encoded_payload,
                         headers=self.headers,
-                        method="POST",
+                        stream=bool(on_content),
                     )
-                    with urllib_request.urlopen(
-                        req, timeout=UPSTREAM_TIMEOUT_SECONDS
-                    ) as upstream:
-                        body = upstream.read().decode("utf-8", errors="replace")
-                        status_code = int(getattr(upstream, "status", 200))
+                    if on_content and upstream.status_code < 400:
+                        body = _read_gemini_stream(upstream, on_content)
+                    else:
+                        body = upstream.content.decode("utf-8", errors="replace")
+                    if upstream.status_code < 400:
                         # Translate native response to OpenAI-compatible format
-                        translated_body = self._translate_native_response(body)
-                        response = GeminiResponse(
-                            status_code=status_code,
-                            body=translated_body,
-                            headers=dict(upstream.headers),
-                        )
-                except urllib_error.HTTPError as err:
-                    body = ""
-                    try:
-                        body = err.read().decode("utf-8", errors="replace")
-                    except Exception:
-                        body = ""
+                        body = self._translate_native_response(body)
                     response = GeminiResponse(
-                        status_code=int(err.code),
+                        status_code=upstream.status_code,
                         body=body,
-                        headers=dict(err.headers or {}),
+                        headers=dict(upstream.headers),
                     )
+                    _observe_rate_limits("gemini", model, response)
                 except Exception as err:
                     last_error = f"{type(err).__name__}: {err}"
                     response = None
+                _record_route("gemini", model, started, response)
 
                 if response is not None:
                     last_response = response
@@ -1783,11 +2953,9 @@ class FactChecker:
                         return response
                     # Non-transient errors (400, 403, 404, etc.) → try next model immediately
                     if response.status_code not in GEMINI_TRANSIENT_STATUS_CODES:
-                        model_failed = True
                         break
                     # Transient error (429, 5xx) with more models available → try next model
                     if model_index < len(models) - 1:
-                        model_failed = True
                         break
                 if attempt < retries - 1:
                     retry_after = _retry_after_seconds(last_response)
@@ -1798,10 +2966,6 @@ class FactChecker:
                     )
                     delay = min(delay, MAX_GEMINI_RETRY_DELAY_SECONDS)
                     time.sleep(delay)
-            if model_failed and model_index < len(models) - 1:
-                # Brief pause before trying next model
-                time.sleep(1.0)
-                continue
         if last_response is None and last_error:
             return GeminiResponse(status_code=0, body=json.dumps({"error": last_error}))
         return last_response
@@ -1811,19 +2975,22 @@ class FactChecker:
         payload: Dict[str, Any],
         retries: int = GEMINI_RETRY_ATTEMPTS,
         use_vision: bool = False,
+        skip_unhealthy: bool = True,
+        on_content: ContentListener = None,
     ) -> Optional[GeminiResponse]:
-        """Call Groq API (OpenAI-compatible) with retry and model fallback."""
+        """Call Groq API (OpenAI-compatible) with retry and model fallback.
+
+        With ``on_content`` the completion is streamed over SSE, as in
+        _post_gemini.
+        """
         if not self.groq_api_key:
             return None
 
         last_response: Optional[GeminiResponse] = None
         last_error: Optional[str] = None
 
-        # Select models based on whether vision is needed
-        if use_vision:
-            models = [GROQ_VISION_MODEL]
-        else:
-            models = [GROQ_TEXT_MODEL, GROQ_FALLBACK_TEXT_MODEL]
+        models = _groq_models(use_vision)
+        estimated_tokens = _estimate_tokens(payload)
 
         for model_index, model in enumerate(models):
             groq_payload: Dict[str, Any] = {
@@ -1833,6 +3000,8 @@ class FactChecker:
             # Groq supports response_format for JSON mode
             if payload.get("response_format", {}).get("type") == "json_object":
                 groq_payload["response_format"] = {"type": "json_object"}
+            if on_content:
+                groq_payload["stream"] = True
 
             encoded = json.dumps(groq_payload).encode("utf-8")
             headers = {
@@ -1841,50 +3010,45 @@ class FactChecker:
                 "User-Agent": "AI-Fact-Checker/1.0 (+https://anindya-das-ai-fact-checker.vercel.app)",
                 "Authorization": f"Bearer {self.groq_api_key}",
             }
-            model_failed = False
             for attempt in range(retries):
+                if skip_unhealthy and not PROVIDER_ROUTER.allow("groq", model):
+                    last_error = f"Circuit open for {model}"
+                    break
+                if not _acquire_budget("groq", model, estimated_tokens):
+                    last_error = f"Rate limit budget exhausted for {model}"
+                    break
+                started = time.perf_counter()
                 try:
-                    req = urllib_request.Request(
+                    upstream = PROVIDER_CLIENTS["groq"].post(
                         GROQ_URL_BASE,
+                        model=model,
                         data=encoded,
                         headers=headers,
-                        method="POST",
+                        stream=bool(on_content),
                     )
-                    with urllib_request.urlopen(
-                        req, timeout=UPSTREAM_TIMEOUT_SECONDS
-                    ) as upstream:
-                        body = upstream.read().decode("utf-8", errors="replace")
-                        status_code = int(getattr(upstream, "status", 200))
-                        # Groq responses are already in OpenAI format — no translation needed
-                        response = GeminiResponse(
-                            status_code=status_code,
-                            body=body,
-                            headers=dict(upstream.headers),
-                        )
-                except urllib_error.HTTPError as err:
-                    body = ""
-                    try:
-                        body = err.read().decode("utf-8", errors="replace")
-                    except Exception:
-                        body = ""
+                    if on_content and upstream.status_code < 400:
+                        body = _read_groq_stream(upstream, on_content)
+                    else:
+                        body = upstream.content.decode("utf-8", errors="replace")
+                    # Groq responses are already in OpenAI format — no translation needed
                     response = GeminiResponse(
-                        status_code=int(err.code),
+                        status_code=upstream.status_code,
                         body=body,
-                        headers=dict(err.headers or {}),
+                        headers=dict(upstream.headers),
                     )
+                    _observe_rate_limits("groq", model, response)
                 except Exception as err:
                     last_error = f"{type(err).__name__}: {err}"
                     response = None
+                _record_route("groq", model, started, response)
 
                 if response is not None:
                     last_response = response
                     if response.status_code == 200:
                         return response
                     if response.status_code not in GEMINI_TRANSIENT_STATUS_CODES:
-                        model_failed = True
                         break
                     if model_index < len(models) - 1:
-                        model_failed = True
                         break
                 if attempt < retries - 1:
                     retry_after = _retry_after_seconds(last_response)
@@ -1895,9 +3059,6 @@ class FactChecker:
                     )
                     delay = min(delay, MAX_GEMINI_RETRY_DELAY_SECONDS)
                     time.sleep(delay)
-            if model_failed and model_index < len(models) - 1:
-                time.sleep(0.5)
-                continue
 
         if last_response is None and last_error:
             return GeminiResponse(status_code=0, body=json.dumps({"error": last_error}))
@@ -1913,7 +3074,9 @@ class FactChecker:
                         return True
         return False
 
-    def _post_api(self, payload: Dict[str, Any]) -> Optional[GeminiResponse]:
+    def _post_api(
+        self, payload: Dict[str, Any], on_content: ContentListener = None
+    ) -> Optional[GeminiResponse]:
         """Unified API call: tries Groq first (primary), falls back to Gemini.
 
         Groq is preferred because:
@@ -1922,14 +3085,17 @@ class FactChecker:
         - OpenAI-compatible format (simpler, no translation needed)
 
         When use_web_search is set, we prefer Gemini (Google Search Grounding).
-        If Gemini fails, we fall back to Groq without search.
+        If Gemini fails, we fall back to Groq without search. Otherwise
+        _route_providers puts Gemini first while Groq's breaker is open, its
+        shared budget is spent, or it is running much slower than Gemini.
+        ``on_content`` streams the output; see _post_gemini.
         """
         use_vision = self._has_vision_content(payload)
         use_web_search = payload.get("use_web_search", False)
 
         # If web search is needed, try Gemini first (Google Search Grounding)
         if use_web_search and self.gemini_api_key:
-            response = self._post_gemini(payload)
+            response = self._post_gemini(payload, on_content=on_content)
             if response is not None and response.status_code == 200:
                 return response
             # Gemini failed — fall back to Groq without search
@@ -1937,34 +3103,44 @@ class FactChecker:
                 fallback_payload = {
                     k: v for k, v in payload.items() if k != "use_web_search"
                 }
-                response = self._post_groq(fallback_payload, use_vision=use_vision)
+                response = self._post_groq(
+                    fallback_payload, use_vision=use_vision, on_content=on_content
+                )
                 if response is not None and response.status_code == 200:
                     return response
             return response
 
-        # Try Groq first (if key is configured)
+        candidates: List[Tuple[str, List[str]]] = []
         if self.groq_api_key:
-            # Strip use_web_search from Groq payloads (not supported)
-            groq_payload = {k: v for k, v in payload.items() if k != "use_web_search"}
-            response = self._post_groq(groq_payload, use_vision=use_vision)
-            if response is not None and response.status_code == 200:
-                return response
-
-        # Fall back to Gemini
+            candidates.append(("groq", _groq_models(use_vision)))
         if self.gemini_api_key:
-            return self._post_gemini(payload)
-
-        # If we got a non-200 from Groq and no Gemini key, return whatever Groq gave us
-        return response if self.groq_api_key else None
-
-    def _rate_limit_pause(self):
-        """Brief pause between API calls to respect free-tier RPM limits."""
-        delay = (
-            GROQ_INTER_REQUEST_DELAY
-            if self.groq_api_key
-            else GEMINI_INTER_REQUEST_DELAY
+            candidates.append(("gemini", _models_for_payload(payload)))
+        candidates = _route_providers(candidates, _estimate_tokens(payload))
+        # With every route's breaker open, try them anyway rather than fail fast.
+        skip_unhealthy = any(
+            PROVIDER_ROUTER.available(provider, model)
+            for provider, models in candidates
+            for model in models
         )
-        time.sleep(delay)
+
+        # Return the last provider's response when none of them succeeds
+        response = None
+        for provider, _ in candidates:
+            if provider == "groq":
+                # Strip use_web_search from Groq payloads (not supported)
+                response = self._post_groq(
+                    {k: v for k, v in payload.items() if k != "use_web_search"},
+                    use_vision=use_vision,
+                    skip_unhealthy=skip_unhealthy,
+                    on_content=on_content,
+                )
+            else:
+                response = self._post_gemini(
+                    payload, skip_unhealthy=skip_unhealthy, on_content=on_content
+                )
+            if response is not None and response.status_code == 200:
+                return response
+        return response
 
     def extract_claims(self, text: str, max_claims: int = MAX_CLAIMS) -> List[str]:
         if not text:
@@ -2011,6 +3187,19 @@ class FactChecker:
         return claims[:max_claims]
 
     def fact_check_claim(self, claim: str) -> Dict[str, Any]:
+        known = _known_claim_result({"claim": claim, "result": {}})
+        if known is not None:
+            return known["result"]
+        cache_key = _verdict_cache_key("claim", claim)
+        cached = _cached_verdict(cache_key)
+        if cached is not None:
+            return cached
+        result = self._fact_check_claim_uncached(claim)
+        if result.get("verdict") != "ERROR":
+            _store_verdict(cache_key, result)
+        return result
+
+    def _fact_check_claim_uncached(self, claim: str) -> Dict[str, Any]:
         current_date = datetime.date.today().isoformat()
         prompt = (
             f"Today's date is {current_date}. "
@@ -2033,23 +3222,7 @@ class FactChecker:
         response = self._post_api(payload)
 
         if response is None or response.status_code != 200:
-            status = response.status_code if response is not None else "no-response"
-            error_detail = ""
-            if response and response.body:
-                parsed = _try_parse_json_block(response.body)
-                if isinstance(parsed, dict) and "error" in parsed:
-                    if isinstance(parsed["error"], str):
-                        error_detail = f"; {parsed['error']}"
-                    else:
-                        error_detail = f"; {json.dumps(parsed['error'])}"
-                elif response.body:
-                    error_detail = f"; {response.body[:200]}"
-            return {
-                "verdict": "ERROR",
-                "confidence": 0,
-                "explanation": f"Failed to verify claim (upstream status: {status}{error_detail})",
-                "sources": [],
-            }
+            return _claim_error_result(response)
 
         try:
             response_json = response.json()
@@ -2066,33 +3239,7 @@ class FactChecker:
             }
         parsed = _try_parse_json_block(content)
         if parsed is not None:
-            urls: List[str] = []
-            if isinstance(parsed.get("sources"), list):
-                for item in parsed["sources"]:
-                    if isinstance(item, str) and re.match(
-                        r"^https?://", item.strip(), flags=re.I
-                    ):
-                        urls.append(item.strip())
-            if not urls and isinstance(parsed.get("explanation"), str):
-                urls = re.findall(
-                    r"https?://[^\s)\]}]+", parsed["explanation"], flags=re.I
-                )
-            parsed["sources"] = _clean_sources(urls, grounding_sources)
-            conf_val = parsed.get("confidence", 75)
-            if isinstance(conf_val, str):
-                conf_val = re.sub(r"[^\d]", "", conf_val)
-                conf_val = int(conf_val) if conf_val else 75
-            else:
-                try:
-                    conf_val = int(conf_val)
-                except Exception:
-                    conf_val = 75
-            return {
-                "verdict": parsed.get("verdict", "INSUFFICIENT EVIDENCE"),
-                "confidence": conf_val,
-                "explanation": parsed.get("explanation", "Analysis completed"),
-                "sources": parsed.get("sources", []),
-            }
+            return _claim_verdict(parsed, grounding_sources)
 
         urls = re.findall(r"https?://[^\s)\]}]+", content, flags=re.I)
         return {
@@ -2102,12 +3249,41 @@ class FactChecker:
             "sources": _clean_sources(urls, grounding_sources),
         }
 
+    @_returns_check_results("text")
     def fact_check_text_claims(
-        self, text: str, max_claims: int = MAX_CLAIMS
+        self,
+        text: str,
+        max_claims: int = MAX_CLAIMS,
+        on_claim: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_reset: Optional[Callable[[], None]] = None,
     ) -> List[Dict[str, Any]]:
-        self.last_text_error = ""
+        """Extract and verify claims in one call.
+
+        ``on_claim`` receives each verdict as soon as the model has finished
+        writing it, before the full answer is in; cached answers skip it.
+        ``on_reset`` is called when a retry or provider fallback starts the
+        answer over, so claims streamed before it should be discarded.
+        """
         if not text:
             return []
+        cache_key = _verdict_cache_key("text", text, max_claims)
+        cached = _cached_verdict(cache_key)
+        if cached is not None:
+            return cached
+        results = self._fact_check_text_claims_uncached(
+            text, max_claims, on_claim, on_reset
+        )
+        if results and not self.last_text_error:
+            _store_verdict(cache_key, results)
+        return results
+
+    def _fact_check_text_claims_uncached(
+        self,
+        text: str,
+        max_claims: int,
+        on_claim: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_reset: Optional[Callable[[], None]] = None,
+    ) -> List[Dict[str, Any]]:
         clipped = _truncate(text, 7000)
         current_date = datetime.date.today().isoformat()
         prompt = (
@@ -2135,7 +3311,30 @@ class FactChecker:
             "response_format": {"type": "json_object"},
             "use_web_search": True,
         }
-        response = self._post_api(payload)
+        on_content = None
+        if on_claim is not None:
+            claim_stream = JsonArrayStream("claims")
+            streamed: Set[str] = set()
+            seen_text = [""]
+
+            def on_content(content: str) -> None:
+                if not content.startswith(seen_text[0]):
+                    # A retry or fallback began a new answer; its claims
+                    # replace the ones already sent.
+                    if streamed and on_reset is not None:
+                        on_reset()
+                    streamed.clear()
+                seen_text[0] = content
+                for item in claim_stream.feed(content):
+                    result = _text_claim_result(item)
+                    if result is None or len(streamed) >= max_claims:
+                        continue
+                    key = _claim_key(result["claim"])
+                    if key not in streamed:
+                        streamed.add(key)
+                        on_claim(copy.deepcopy(result))
+
+        response = self._post_api(payload, on_content=on_content)
         if response is None or response.status_code != 200:
             error_msg = _extract_error_message(response)
             print(
@@ -2196,37 +3395,38 @@ class FactChecker:
 
         results: List[Dict[str, Any]] = []
         for item in claim_items[:max_claims]:
-            if not isinstance(item, dict):
-                continue
-            claim = _clean_text(str(item.get("claim", "")))
-            if not claim:
-                claim = _clean_text(
-                    str(item.get("statement", "") or item.get("text", ""))
-                )
-            if not claim and item.get("explanation"):
-                claim = "Text claim analysis"
-            if not claim:
-                continue
-            results.append(
-                {
-                    "claim": claim,
-                    "result": {
-                        "verdict": item.get("verdict", "INSUFFICIENT EVIDENCE"),
-                        "confidence": _coerce_confidence(item.get("confidence", 75)),
-                        "explanation": item.get("explanation", "Analysis completed"),
-                        "sources": _clean_sources(
-                            item.get("sources", []), grounding_sources
-                        ),
-                    },
-                }
-            )
+            result = _text_claim_result(item, grounding_sources)
+            if result is not None:
+                results.append(result)
         return results
 
+    @_returns_check_results("text")
     def refine_results_with_web_evidence(
         self, results: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
-        """Search the public web for each claim and rerank/rewrite verdicts against evidence snippets."""
-        self.last_text_error = ""
+        """Search the public web for each claim and rerank/rewrite verdicts against evidence snippets.
+
+        Claims already verified by any pipeline are answered from the claim
+        store; only unseen claims go into the evidence prompt.
+        """
+        known = [_known_claim_result(item) for item in results]
+        unseen = [item for item, stored in zip(results, known) if stored is None]
+        refined_by_key = {
+            _claim_key(item["claim"]): item
+            for item in (self._refine_with_evidence(unseen) if unseen else [])
+            if isinstance(item, dict) and item.get("claim")
+        }
+        merged: List[Dict[str, Any]] = []
+        for item, stored in zip(results, known):
+            if stored is None and isinstance(item, dict) and item.get("claim"):
+                match = refined_by_key.get(_claim_key(item["claim"]))
+                stored = {**match, "claim": item["claim"]} if match else None
+            merged.append(stored if stored is not None else item)
+        return merged
+
+    def _refine_with_evidence(
+        self, results: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
         claims = [
             _clean_search_query(item.get("claim", ""))
             for item in results[:MAX_WEB_EVIDENCE_CLAIMS]
@@ -2260,47 +3460,17 @@ class FactChecker:
         if not evidence_payload:
             return results
 
-        current_date = datetime.date.today().isoformat()
-        prompt = (
-            f"Today's date is {current_date}. You are a careful fact-checking editor. "
-            "Re-check each claim using the provided public web evidence snippets. "
-            "Prefer independent reporting, official sources, and primary documents over the original social post. "
-            "CRITICAL: Verify that each claim accurately represents what the original text actually stated. "
-            "Watch for partial name matches — e.g., evidence about 'Claude' (an AI model) does NOT verify a claim about 'Claude Monet' (a painter), and vice versa. "
-            "If the claim text appears to have been incorrectly extracted (names truncated, entities confused), mark it FALSE or UNVERIFIABLE, not TRUE. "
-            "If the evidence supports the claim, mark TRUE. If it contradicts the claim, mark FALSE or PARTIALLY TRUE. "
-            "If the evidence is weak, missing, circular, or only repeats the same social post, mark INSUFFICIENT EVIDENCE. "
-            "Use only URLs that appear in the evidence list as sources. "
-            "Return ONLY JSON with this exact shape: "
-            '{"claims":[{"claim":"...","verdict":"TRUE|FALSE|PARTIALLY TRUE|INSUFFICIENT EVIDENCE|UNVERIFIABLE",'
-            '"confidence":85,"explanation":"2-3 sentences describing the evidence used","sources":["https://..."]}]}. '
-            f"Evidence package: {json.dumps(evidence_payload, ensure_ascii=False)}"
-        )
-        payload = {
-            "model": GEMINI_PRIMARY_MODEL,
-            "messages": [{"role": "user", "content": prompt}],
-            "response_format": {"type": "json_object"},
-        }
-        response = self._post_api(payload)
-
         updates: Dict[str, Dict[str, Any]] = {}
-        if response is not None and response.status_code == 200:
-            try:
-                content = response.json()["choices"][0]["message"]["content"]
-                parsed = _try_parse_json_block(content)
-                claim_items = (
-                    parsed.get("claims", []) if isinstance(parsed, dict) else parsed
+        for entry, outcome in zip(
+            evidence_payload, self._evidence_batcher.map(evidence_payload)
+        ):
+            if outcome.get("update"):
+                updates[_claim_key(entry["claim"])] = outcome["update"]
+            else:
+                # A claim the re-check did not answer counts as a failed check.
+                self.last_text_error = (
+                    outcome.get("error") or "Evidence re-check returned no verdict"
                 )
-                if isinstance(claim_items, dict):
-                    claim_items = [claim_items]
-                if isinstance(claim_items, list):
-                    for item in claim_items:
-                        if isinstance(item, dict) and item.get("claim"):
-                            updates[_claim_key(item["claim"])] = item
-            except Exception:
-                updates = {}
-        elif response is not None:
-            self.last_text_error = _extract_error_message(response)
 
         refined: List[Dict[str, Any]] = []
         for item in results:
@@ -2341,15 +3511,105 @@ class FactChecker:
             ):
                 item["result"]["sources"] = evidence_sources
             refined.append(item)
-        return refined
+        return self._remember_refined(refined, set(updates))
+
+    @staticmethod
+    def _remember_refined(
+        results: List[Dict[str, Any]], updated: Set[str]
+    ) -> List[Dict[str, Any]]:
+        """Store only the claims whose verdict was re-checked against evidence.
+
+        Claims without evidence, past MAX_WEB_EVIDENCE_CLAIMS, or whose re-check
+        failed keep their first-pass verdict, which is not worth storing.
+        """
+        for item in results:
+            if (
+                isinstance(item, dict)
+                and item.get("claim")
+                and _claim_key(item["claim"]) in updated
+            ):
+                _remember_claim_result(item)
+        return results
+
+    def _recheck_evidence_batch(
+        self, entries: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Re-check evidence packages pooled from concurrent requests in one call.
+
+        Returns ``{"update": item}`` per entry, or ``{"error": message}`` when
+        the provider call failed. ``item`` is None for claims the answer
+        skipped.
+        """
+        # Requests re-checking the same claim may have gathered different
+        # evidence; the shared verdict is made against all of it.
+        unique: Dict[str, Dict[str, Any]] = {}
+        for entry in entries:
+            key = _claim_key(entry["claim"])
+            if key not in unique:
+                unique[key] = {**entry, "evidence": list(entry["evidence"])}
+                continue
+            merged = unique[key]["evidence"]
+            seen = {item.get("url") or item.get("snippet") for item in merged}
+            for item in entry["evidence"]:
+                identity = item.get("url") or item.get("snippet")
+                if identity not in seen:
+                    merged.append(item)
+                    seen.add(identity)
+        evidence_payload = list(unique.values())
+        current_date = datetime.date.today().isoformat()
+        prompt = (
+            f"Today's date is {current_date}. You are a careful fact-checking editor. "
+            "Re-check each claim using the provided public web evidence snippets. "
+            "Prefer independent reporting, official sources, and primary documents over the original social post. "
+            "CRITICAL: Verify that each claim accurately represents what the original text actually stated. "
+            "Watch for partial name matches — e.g., evidence about 'Claude' (an AI model) does NOT verify a claim about 'Claude Monet' (a painter), and vice versa. "
+            "If the claim text appears to have been incorrectly extracted (names truncated, entities confused), mark it FALSE or UNVERIFIABLE, not TRUE. "
+            "If the evidence supports the claim, mark TRUE. If it contradicts the claim, mark FALSE or PARTIALLY TRUE. "
+            "If the evidence is weak, missing, circular, or only repeats the same social post, mark INSUFFICIENT EVIDENCE. "
+            "Use only URLs that appear in the evidence list as sources. "
+            "Return ONLY JSON with this exact shape: "
+            '{"claims":[{"claim":"...","verdict":"TRUE|FALSE|PARTIALLY TRUE|INSUFFICIENT EVIDENCE|UNVERIFIABLE",'
+            '"confidence":85,"explanation":"2-3 sentences describing the evidence used","sources":["https://..."]}]}. '
+            f"Evidence package: {json.dumps(evidence_payload, ensure_ascii=False)}"
+        )
+        payload = {
+            "model": GEMINI_PRIMARY_MODEL,
+            "messages": [{"role": "user", "content": prompt}],
+            "response_format": {"type": "json_object"},
+        }
+        response = self._post_api(payload)
+
+        updates: Dict[str, Dict[str, Any]] = {}
+        if response is not None and response.status_code == 200:
+            try:
+                content = response.json()["choices"][0]["message"]["content"]
+                parsed = _try_parse_json_block(content)
+                claim_items = (
+                    parsed.get("claims", []) if isinstance(parsed, dict) else parsed
+                )
+                if isinstance(claim_items, dict):
+                    claim_items = [claim_items]
+                if isinstance(claim_items, list):
+                    for item in claim_items:
+                        if isinstance(item, dict) and item.get("claim"):
+                            updates[_claim_key(item["claim"])] = item
+            except Exception:
+                updates = {}
+        else:
+            error = _extract_error_message(response)
+            return [{"error": error} for _ in entries]
+        return [
+            {"update": copy.deepcopy(updates.get(_claim_key(entry["claim"])))}
+            for entry in entries
+        ]
 
+    @_returns_check_results("image")
     def extract_image_claims(
         self,
         image_url: Optional[str],
         image_data_url: Optional[str],
         max_claims: int = MAX_IMAGE_CLAIMS,
     ) -> List[str]:
-        self.last_image_error = ""
         if not image_url and not image_data_url:
             return []
         current_date = datetime.date.today().isoformat()
@@ -2412,6 +3672,7 @@ class FactChecker:
                 claims.append(line)
         return claims[:max_claims]
 
+    @_returns_check_results("image")
     def fact_check_image_content(
         self,
         image_url: Optional[str],
@@ -2419,7 +3680,6 @@ class FactChecker:
         max_claims: int = MAX_IMAGE_CLAIMS,
     ) -> List[Dict[str, Any]]:
         """Analyze visible image claims and fact-check them in one Gemini call."""
-        self.last_image_error = ""
         if not image_url and not image_data_url:
             return []
         current_date = datetime.date.today().isoformat()
@@ -2548,14 +3808,136 @@ class FactChecker:
         return results
 
 
+class CheckerRegistry:
+    """Process-wide FactChecker shared by every request thread.
+
+    Provider keys are resolved once and re-checked every ``reload_seconds``
+    (or immediately after ``reload()``); the checker is only rebuilt when a
+    key actually changed.
+    """
+
+    def __init__(self, reload_seconds: float = CHECKER_KEY_RELOAD_SECONDS):
+        self.reload_seconds = reload_seconds
+        self._lock = threading.Lock()
+        self._checker: Optional[FactChecker] = None
+        self._keys: Optional[Tuple[str, str]] = None
+        self._checked_at = 0.0
+
+    @staticmethod
+    def _resolve_keys() -> Tuple[str, str]:
+        gemini_key = (
+            _get_env_var_insensitive("GEMINI_API_KEY")
+            or GEMINI_API_KEY
+            or _get_env_var_insensitive("GOOGLE_API_KEY")
+            or ""
+        )
+        groq_key = _get_env_var_insensitive("GROQ_API_KEY") or GROQ_API_KEY or ""
+        return gemini_key.strip(), groq_key.strip()
+
+    def get(self) -> Tuple[Optional[FactChecker], Optional[str]]:
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._checker is not None
+                and now - self._checked_at < self.reload_seconds
+            ):
+                return self._checker, None
+            keys = self._resolve_keys()
+            if self._checker is None or keys != self._keys:
+                try:
+                    self._checker = FactChecker(
+                        api_key=keys[0] or None, groq_api_key=keys[1] or None
+                    )
+                except Exception as exc:
+                    self._checker = None
+                    self._keys = None
+                    return None, str(exc)
+                self._keys = keys
+            self._checked_at = now
+            return self._checker, None
+
+    def reload(self) -> None:
+        with self._lock:
+            self._checked_at = 0.0
+
+
+CHECKER_REGISTRY = CheckerRegistry()
+
+
 def _get_checker() -> Tuple[Optional[FactChecker], Optional[str]]:
+    return CHECKER_REGISTRY.get()
+
+
+PipelineEvents = Optional[Callable[[str, Dict[str, Any]], None]]
+PIPELINE_FINAL_EVENTS = ("result", "error")
+
+
+def _emit(on_event: PipelineEvents, name: str, payload: Dict[str, Any]) -> None:
+    if on_event is not None:
+        on_event(name, copy.deepcopy(payload))
+
+
+def _claim_events(on_event: PipelineEvents) -> Dict[str, Any]:
+    # Only streamed requests ask the checker for claim-by-claim callbacks.
+    if on_event is None:
+        return {}
+    return {
+        "on_claim": lambda item: on_event("claim", item),
+        "on_reset": lambda: on_event("reset", {}),
+    }
+
+
+def start_pipeline(
+    fn: Callable[..., Tuple[Dict[str, Any], int]],
+    *args: Any,
+    on_event: Callable[[str, Dict[str, Any]], None],
+) -> Future:
+    """Run a fact_check_*_input pipeline on STREAM_POOL, reporting each stage.
+
+    ``on_event`` is called from the pool thread for every stage and finally
+    with ``result`` (the full response plus its ``status_code``), or with
+    ``error`` if the pipeline raised. Cancelling the returned future before
+    the pipeline starts means no events are sent.
+    """
+
+    def run() -> None:
+        try:
+            response, status = fn(*args, on_event=on_event)
+        except Exception as exc:
+            on_event(
+                "error", {"error": f"{type(exc).__name__}: {exc}", "status_code": 500}
+            )
+            return
+        on_event("result", {**response, "status_code": status})
+
+    return STREAM_POOL.submit(run)
+
+
+def stream_pipeline(
+    fn: Callable[..., Tuple[Dict[str, Any], int]], *args: Any
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Run a fact_check_*_input pipeline, yielding (event, payload) per stage.
+
+    Blocking counterpart of ``start_pipeline`` for WSGI responses; closing
+    the generator early cancels a pipeline that has not started yet.
+    """
+    events: "queue.Queue[Tuple[str, Dict[str, Any]]]" = queue.Queue()
+    future = start_pipeline(
+        fn, *args, on_event=lambda name, payload: events.put((name, payload))
+    )
     try:
-        return FactChecker(), None
-    except Exception as exc:
-        return None, str(exc)
+        while True:
+            name, payload = events.get()
+            yield name, payload
+            if name in PIPELINE_FINAL_EVENTS:
+                return
+    finally:
+        future.cancel()
 
 
-def fact_check_text_input(text: str) -> Tuple[Dict[str, Any], int]:
+def fact_check_text_input(
+    text: str, on_event: PipelineEvents = None
+) -> Tuple[Dict[str, Any], int]:
     checker, checker_error = _get_checker()
     if checker is None:
         return {
@@ -2566,9 +3948,18 @@ def fact_check_text_input(text: str) -> Tuple[Dict[str, Any], int]:
     if not text:
         return {"error": "No text provided"}, 400
 
-    results = checker.fact_check_text_claims(text)
-    if results and hasattr(checker, "refine_results_with_web_evidence"):
-        results = checker.refine_results_with_web_evidence(results)
+    refined_key = _verdict_cache_key("refined", text, MAX_CLAIMS)
+    results = _cached_verdict(refined_key)
+    text_analysis_error = ""
+    if results is None:
+        results = checker.fact_check_text_claims(text, **_claim_events(on_event))
+        text_analysis_error = _result_error(results)
+        _emit(on_event, "preliminary", {"fact_check_results": list(results)})
+        if results and hasattr(checker, "refine_results_with_web_evidence"):
+            results = checker.refine_results_with_web_evidence(results)
+            if not _result_error(results):
+                _store_verdict(refined_key, list(results))
+    _emit(on_event, "refined", {"fact_check_results": list(results)})
 
     response = {
         "original_text": text,
@@ -2576,8 +3967,8 @@ def fact_check_text_input(text: str) -> Tuple[Dict[str, Any], int]:
         "fact_check_results": results,
         "timestamp": time.time(),
     }
-    if checker.last_text_error and not results:
-        response["analysis_error"] = checker.last_text_error
+    if text_analysis_error and not results:
+        response["analysis_error"] = text_analysis_error
     return response, 200
 
 
@@ -2595,9 +3986,9 @@ def fact_check_image_input(
     results = checker.fact_check_image_content(
         image_url=image_url, image_data_url=image_data_url
     )
+    image_analysis_error = _result_error(results)
     if results and hasattr(checker, "refine_results_with_web_evidence"):
         results = checker.refine_results_with_web_evidence(results)
-    image_analysis_error = checker.last_image_error
 
     response = {
         "original_image": original_image,
@@ -2611,19 +4002,19 @@ def fact_check_image_input(
     return response, 200
 
 
-def _analyze_single_image_url(api_key: str, image_url: str) -> Dict[str, Any]:
+def _analyze_single_image_url(checker: FactChecker, image_url: str) -> Dict[str, Any]:
     try:
-        checker = FactChecker(api_key=api_key)
         image_data_url = _download_image_as_data_url(image_url)
         checks = checker.fact_check_image_content(
             image_url=None if image_data_url else image_url,
             image_data_url=image_data_url,
         )
-        if checker.last_image_error:
+        image_error = _result_error(checks)
+        if image_error:
             return {
                 "image_url": image_url,
                 "status": "failed",
-                "reason": checker.last_image_error,
+                "reason": image_error,
                 "claims": [],
                 "checks": [],
             }
@@ -2645,18 +4036,15 @@ def _analyze_single_image_url(api_key: str, image_url: str) -> Dict[str, Any]:
 def _analyze_image_urls_with_queue(
     checker: FactChecker, image_urls: List[str]
 ) -> List[Dict[str, Any]]:
-    """Analyze images sequentially to avoid rate-limit exhaustion on free tier."""
+    """Analyze images one at a time; RATE_LIMITER paces the provider calls."""
     candidates = [url for url in image_urls[:MAX_IMAGES_TO_ANALYZE] if url]
     if not candidates:
         return []
 
     results: List[Dict[str, Any]] = []
     for image_url in candidates:
-        # Rate-limit pause between image analysis calls
-        if results:
-            time.sleep(GEMINI_INTER_REQUEST_DELAY)
         try:
-            result = _analyze_single_image_url(checker.api_key, image_url)
+            result = _analyze_single_image_url(checker, image_url)
             results.append(result)
         except Exception as exc:
             results.append(
@@ -2672,7 +4060,9 @@ def _analyze_image_urls_with_queue(
     return results
 
 
-def fact_check_url_input(url: str) -> Tuple[Dict[str, Any], int]:
+def fact_check_url_input(
+    url: str, on_event: PipelineEvents = None
+) -> Tuple[Dict[str, Any], int]:
     checker, checker_error = _get_checker()
     if checker is None:
         return {"error": checker_error or "No AI provider API key configured"}, 500
@@ -2686,6 +4076,17 @@ def fact_check_url_input(url: str) -> Tuple[Dict[str, Any], int]:
     title = content.get("title", "")
     image_urls = content.get("image_urls", [])
     image_detection_info = content.get("image_detection_info", {})
+    _emit(
+        on_event,
+        "extracted",
+        {
+            "source_url": url,
+            "source_title": title,
+            "original_text": text,
+            "images_detected": len(image_urls),
+            "image_urls": image_urls[:10],
+        },
+    )
 
     results: List[Dict[str, Any]] = []
     text_analysis_error = ""
@@ -2693,20 +4094,39 @@ def fact_check_url_input(url: str) -> Tuple[Dict[str, Any], int]:
     should_analyze_text = bool(text) and (
         not image_urls or _has_substantial_article_text(text) or _has_claim_signal(text)
     )
+    should_analyze_images = bool(image_urls) and not _has_substantial_article_text(text)
+    image_future: Optional[Future] = None
+    if should_analyze_text and should_analyze_images and URL_PIPELINE_CONCURRENT:
+        # Text and images go to the provider in parallel; RATE_LIMITER keeps
+        # both within the provider budget. Text claims are refined with web
+        # evidence while the images are still being analyzed.
+        image_future = IMAGE_ANALYSIS_POOL.submit(
+            _analyze_image_urls_with_queue, checker, image_urls
+        )
+
+    refined_count = 0
     if should_analyze_text:
-        results.extend(checker.fact_check_text_claims(text))
-        text_analysis_error = checker.last_text_error
-        # Pause before any subsequent image analysis to avoid rate limits
-        if results and image_urls and hasattr(checker, "_rate_limit_pause"):
-            checker._rate_limit_pause()
+        text_results = checker.fact_check_text_claims(text, **_claim_events(on_event))
+        results.extend(text_results)
+        text_analysis_error = _result_error(text_results)
+        _emit(on_event, "preliminary", {"fact_check_results": list(text_results)})
+        if image_future is not None:
+            if results and hasattr(checker, "refine_results_with_web_evidence"):
+                results = list(checker.refine_results_with_web_evidence(results))
+                _emit(on_event, "refined", {"fact_check_results": results})
+            refined_count = len(results)
 
     image_analysis_results: List[Dict[str, Any]] = []
     image_analysis_skipped_reason = ""
-    should_analyze_images = bool(image_urls) and not _has_substantial_article_text(text)
     if image_urls and not should_analyze_images:
         image_analysis_skipped_reason = "Visual analysis skipped because article text was available; image analysis is reserved for image-first posts."
     if should_analyze_images:
-        image_analysis_results = _analyze_image_urls_with_queue(checker, image_urls)
+        if image_future is not None:
+            image_analysis_results = image_future.result()
+        else:
+            image_analysis_results = _analyze_image_urls_with_queue(
+                checker, image_urls
+            )
         for image_result in image_analysis_results:
             checks = image_result.get("checks", [])
             if isinstance(checks, list):
@@ -2717,9 +4137,14 @@ def fact_check_url_input(url: str) -> Tuple[Dict[str, Any], int]:
                         and item.get("result")
                     ):
                         results.append(item)
+        _emit(on_event, "images", {"image_analysis_results": image_analysis_results})
 
-    if results and hasattr(checker, "refine_results_with_web_evidence"):
-        results = checker.refine_results_with_web_evidence(results)
+    unrefined = results[refined_count:]
+    if unrefined and hasattr(checker, "refine_results_with_web_evidence"):
+        results = results[:refined_count] + list(
+            checker.refine_results_with_web_evidence(unrefined)
+        )
+        _emit(on_event, "refined", {"fact_check_results": results})
 
     source_fallback = _clean_sources([url])
     for item in results:
@@ -2847,32 +4272,29 @@ def fact_check_extension_post_input(
 
     if text:
         context = _build_extension_context(payload, text)
-        results.extend(checker.fact_check_text_claims(context))
-        text_analysis_error = checker.last_text_error
-        if results and (image_url or screenshot_data_url):
-            checker._rate_limit_pause()
+        text_results = checker.fact_check_text_claims(context)
+        results.extend(text_results)
+        text_analysis_error = _result_error(text_results)
 
     should_analyze_image = bool(screenshot_data_url) and (
         not results or not _has_claim_signal(text)
     )
     if should_analyze_image:
-        results.extend(
-            checker.fact_check_image_content(
-                image_url=None,
-                image_data_url=screenshot_data_url,
-                max_claims=min(3, MAX_IMAGE_CLAIMS),
-            )
+        image_results = checker.fact_check_image_content(
+            image_url=None,
+            image_data_url=screenshot_data_url,
+            max_claims=min(3, MAX_IMAGE_CLAIMS),
         )
-        image_analysis_error = checker.last_image_error
+        results.extend(image_results)
+        image_analysis_error = _result_error(image_results)
     elif image_url and not results:
-        results.extend(
-            checker.fact_check_image_content(
-                image_url=image_url,
-                image_data_url=None,
-                max_claims=min(3, MAX_IMAGE_CLAIMS),
-            )
+        image_results = checker.fact_check_image_content(
+            image_url=image_url,
+            image_data_url=None,
+            max_claims=min(3, MAX_IMAGE_CLAIMS),
         )
-        image_analysis_error = checker.last_image_error
+        results.extend(image_results)
+        image_analysis_error = _result_error(image_results)
 
     if results and hasattr(checker, "refine_results_with_web_evidence"):
         results = checker.refine_results_with_web_evidence(results)
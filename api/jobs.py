@@ -0,0 +1,296 @@
+"""Background fact-check jobs: submit, poll, fetch the result later.
+
+Long URL checks can outlive a load balancer's idle timeout. A job runs the
+usual ``fact_check_*_input`` pipeline on a bounded pool of worker threads
+and keeps its response in a SQLite store for JOB_TTL_SECONDS, so the client
+can poll instead of holding a connection open. Identical submissions made
+while a job is queued, running or finished share that job instead of
+repeating the work.
+
+Jobs need a long-running server process (gunicorn, uvicorn). On serverless
+platforms such as Vercel the function is frozen once the 202 response is
+sent, so the worker thread never finishes; submissions are refused there.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Set, Tuple
+
+from api import core
+
+JOB_MAX_WORKERS = 4
+JOB_TTL_SECONDS = 60 * 60
+JOB_HEARTBEAT_SECONDS = 15  # how often a worker touches the jobs it holds
+JOB_STALE_SECONDS = 90  # unfinished jobs not touched for this long have died
+# A file, so every worker process on the host sees the same jobs.
+JOB_STORE_PATH = (
+    core._get_env_var_insensitive("FACT_CHECK_JOB_STORE_PATH")
+    or core.CACHE_DB_PATH
+    or os.path.join(tempfile.gettempdir(), "fact_check_jobs.sqlite3")
+)
+JOBS_SUPPORTED = not core._get_env_var_insensitive("VERCEL")
+
+Runner = Callable[[Dict[str, Any]], Tuple[Dict[str, Any], int]]
+
+
+class SQLiteJobStore:
+    """Job records in one SQLite table, shared by every process using the file.
+
+    Any object with the same ``create_or_find``/``get``/``update``/
+    ``touch``/``fail_stale``/``purge``/``counts`` methods can stand in for it.
+    """
+
+    def __init__(self, path: str = ":memory:", table: str = "jobs"):
+        if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", table):
+            raise ValueError(f"Invalid job table name: {table!r}")
+        self.table = table
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=5, check_same_thread=False, isolation_level=None
+        )
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "id TEXT PRIMARY KEY, kind TEXT NOT NULL, dedupe_key TEXT NOT NULL, "
+                "status TEXT NOT NULL, status_code INTEGER, result TEXT, error TEXT, "
+                "created_at REAL NOT NULL, updated_at REAL NOT NULL, "
+                "expires_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {table}_dedupe ON {table} (dedupe_key)"
+            )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # BEGIN IMMEDIATE takes the write lock up front, so a check and the
+        # write that depends on it cannot interleave with another process.
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    @staticmethod
+    def _decode(row: Optional[sqlite3.Row]) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        job = dict(row)
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def create_or_find(
+        self, job_id: str, kind: str, dedupe_key: str, ttl: float
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Return the live job for ``dedupe_key``, or create one as ``job_id``.
+
+        A job is live while it is unexpired and has neither failed nor
+        finished with a 5xx response (a provider outage or timeout is worth
+        retrying). The second value says whether a new job was created.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                f"SELECT * FROM {self.table} WHERE dedupe_key = ? "
+                "AND status != 'failed' AND expires_at > ? "
+                "AND NOT (status = 'done' AND COALESCE(status_code, 0) >= 500) "
+                "ORDER BY created_at DESC LIMIT 1",
+                (dedupe_key, now),
+            ).fetchone()
+            if row is not None:
+                return self._decode(row), False
+            conn.execute(
+                f"INSERT INTO {self.table} (id, kind, dedupe_key, status, "
+                "created_at, updated_at, expires_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, kind, dedupe_key, "queued", now, now, now + ttl),
+            )
+            row = conn.execute(
+                f"SELECT * FROM {self.table} WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._decode(row), True
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT * FROM {self.table} WHERE id = ? AND expires_at > ?",
+                (job_id, time.time()),
+            ).fetchone()
+        return self._decode(row)
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        if "result" in fields:
+            fields["result"] = json.dumps(fields["result"], ensure_ascii=False)
+        fields["updated_at"] = time.time()
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._transaction() as conn:
+            conn.execute(
+                f"UPDATE {self.table} SET {assignments} WHERE id = ?",
+                (*fields.values(), job_id),
+            )
+
+    def touch(self, job_ids: Set[str]) -> None:
+        """Mark unfinished jobs as still held by a live worker."""
+        if not job_ids:
+            return
+        ids = list(job_ids)
+        with self._transaction() as conn:
+            conn.execute(
+                f"UPDATE {self.table} SET updated_at = ? WHERE id IN "
+                f"({', '.join('?' for _ in ids)}) "
+                "AND status IN ('queued', 'running')",
+                (time.time(), *ids),
+            )
+
+    def fail_stale(self, stale_seconds: float) -> int:
+        """Fail unfinished jobs whose worker stopped touching them."""
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                f"UPDATE {self.table} SET status = 'failed', error = ?, "
+                "updated_at = ? WHERE status IN ('queued', 'running') "
+                "AND updated_at <= ?",
+                ("Job worker stopped before finishing", now, now - stale_seconds),
+            )
+        return cursor.rowcount
+
+    def purge(self) -> int:
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                f"DELETE FROM {self.table} WHERE expires_at <= ?", (time.time(),)
+            )
+        return cursor.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT status, COUNT(*) FROM {self.table} GROUP BY status"
+            ).fetchall()
+        return {status: count for status, count in rows}
+
+
+class JobManager:
+    """Runs submitted jobs on ``max_workers`` threads and records the outcome.
+
+    While this process holds a job it touches the job's row every
+    ``heartbeat`` seconds. Queued or running jobs that nobody has touched
+    for ``stale_after`` seconds belonged to a worker that died, and are
+    marked failed the next time jobs are submitted or read.
+    """
+
+    def __init__(
+        self,
+        runners: Dict[str, Runner],
+        store: Any,
+        max_workers: int = JOB_MAX_WORKERS,
+        ttl: float = JOB_TTL_SECONDS,
+        heartbeat: float = JOB_HEARTBEAT_SECONDS,
+        stale_after: float = JOB_STALE_SECONDS,
+    ):
+        self.runners = runners
+        self.store = store
+        self.max_workers = max_workers
+        self.ttl = ttl
+        self.heartbeat = heartbeat
+        self.stale_after = stale_after
+        self._lock = threading.Lock()
+        self._held: Set[str] = set()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="job"
+        )
+
+    @staticmethod
+    def dedupe_key(kind: str, payload: Dict[str, Any]) -> str:
+        canonical = json.dumps([kind, payload], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def submit(self, kind: str, payload: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """Queue a job, or return the live one for an identical submission.
+
+        Returns the job record and whether a new job was created.
+        """
+        if kind not in self.runners:
+            raise ValueError(f"Unknown job kind: {kind!r}")
+        self.store.fail_stale(self.stale_after)
+        self.store.purge()
+        job, created = self.store.create_or_find(
+            uuid.uuid4().hex, kind, self.dedupe_key(kind, payload), self.ttl
+        )
+        if created:
+            with self._lock:
+                self._held.add(job["id"])
+            self._start_heartbeat()
+            self._executor.submit(self._run, job["id"], kind, payload)
+        return job, created
+
+    def _start_heartbeat(self) -> None:
+        with self._lock:
+            if self._heartbeat_thread is not None:
+                return
+            self._heartbeat_thread = threading.Thread(
+                target=self._beat, name="job-heartbeat", daemon=True
+            )
+            self._heartbeat_thread.start()
+
+    def _beat(self) -> None:
+        while True:
+            time.sleep(self.heartbeat)
+            with self._lock:
+                held = set(self._held)
+            try:
+                self.store.touch(held)
+            except sqlite3.Error:
+                # Try again next beat; a job is only failed after stale_after.
+                pass
+
+    def _run(self, job_id: str, kind: str, payload: Dict[str, Any]) -> None:
+        try:
+            self.store.update(job_id, status="running")
+            try:
+                result, status_code = self.runners[kind](payload)
+            except Exception as exc:
+                self.store.update(
+                    job_id, status="failed", error=f"{type(exc).__name__}: {exc}"
+                )
+                return
+            self.store.update(
+                job_id, status="done", status_code=status_code, result=result
+            )
+        finally:
+            with self._lock:
+                self._held.discard(job_id)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        self.store.fail_stale(self.stale_after)
+        return self.store.get(job_id)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            held = len(self._held)
+        return {"max_workers": self.max_workers, "held": held, **self.store.counts()}
+
+
+JOB_RUNNERS: Dict[str, Runner] = {
+    "text": lambda payload: core.fact_check_text_input(payload.get("text", "")),
+    "url": lambda payload: core.fact_check_url_input(payload["url"]),
+    "image": lambda payload: core.fact_check_image_input(
+        payload.get("image_data_url"), payload.get("image_url")
+    ),
+    "extension": lambda payload: core.fact_check_extension_post_input(payload),
+}
+
+JOBS = JobManager(JOB_RUNNERS, SQLiteJobStore(JOB_STORE_PATH))
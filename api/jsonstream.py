@@ -0,0 +1,78 @@
+"""Incremental extraction of array elements from JSON that is still arriving."""
+
+import json
+from typing import Any, List, Optional
+
+
+class JsonArrayStream:
+    """Pull completed elements of one JSON array out of a growing text.
+
+    ``feed`` takes everything generated so far and returns the elements of
+    the top-level ``"<key>": [...]`` array (or of a bare top-level array) that
+    have closed since the previous call. Text around the JSON, such as code
+    fences, is ignored. When the text no longer extends what was fed before,
+    for example because the provider call was retried, parsing starts over.
+    """
+
+    def __init__(self, key: str = "claims"):
+        self.key = key
+        self._reset()
+
+    def _reset(self) -> None:
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_string: Optional[str] = None
+        self._key_ready = False
+        self._array_depth: Optional[int] = None
+        self._item_start: Optional[int] = None
+        self._done = False
+
+    def feed(self, text: str) -> List[Any]:
+        if not text.startswith(self._text):
+            self._reset()
+        self._text = text
+        items: List[Any] = []
+        while self._pos < len(text) and not self._done:
+            self._step(text, text[self._pos], items)
+            self._pos += 1
+        return items
+
+    def _step(self, text: str, ch: str, items: List[Any]) -> None:
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif ch == "\\":
+                self._escape = True
+            elif ch == '"':
+                self._in_string = False
+                self._last_string = text[self._string_start + 1 : self._pos]
+            return
+        if ch.isspace():
+            return
+        key_ready, self._key_ready = self._key_ready, False
+        if ch == '"':
+            self._in_string = True
+            self._string_start = self._pos
+        elif ch == ":":
+            self._key_ready = self._depth == 1 and self._last_string == self.key
+        elif ch in "{[":
+            opens_target = key_ready or self._depth == 0
+            if ch == "[" and self._array_depth is None and opens_target:
+                self._array_depth = self._depth + 1
+            elif ch == "{" and self._depth == self._array_depth:
+                self._item_start = self._pos
+            self._depth += 1
+        elif ch in "}]":
+            self._depth -= 1
+            if self._item_start is not None and self._depth == self._array_depth:
+                try:
+                    items.append(json.loads(text[self._item_start : self._pos + 1]))
+                except ValueError:
+                    pass
+                self._item_start = None
+            elif self._array_depth is not None and self._depth < self._array_depth:
+                self._done = True
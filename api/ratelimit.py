@@ -0,0 +1,345 @@
+"""Token-bucket rate limiting for LLM providers, optionally shared by processes."""
+
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple
+
+
+class TokenBucket:
+    """Bucket of ``capacity`` units refilled evenly over each minute.
+
+    ``reserve`` hands out budget first come, first served: it always books
+    the amount and returns how long the caller must wait for it, so bursts
+    from many threads queue up behind each other instead of stampeding.
+    """
+
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.time):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self._clock = clock
+        self._level = self.capacity
+        self._updated = clock()
+        self.blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._level = min(
+            self.capacity, self._level + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def wait_time(self, amount: float = 1.0) -> float:
+        now = self._clock()
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        shortfall = max(0.0, amount - self._level) / self.rate if self.rate else 0.0
+        return max(shortfall, self.blocked_until - now)
+
+    def reserve(self, amount: float = 1.0) -> float:
+        wait = self.wait_time(amount)
+        self._level -= min(amount, self.capacity)
+        return wait
+
+    def limit_remaining(self, remaining: float) -> None:
+        now = self._clock()
+        self._refill(now)
+        self._level = min(self._level, float(remaining))
+
+    def block_for(self, seconds: float) -> None:
+        self.blocked_until = max(self.blocked_until, self._clock() + seconds)
+
+    def level(self) -> float:
+        self._refill(self._clock())
+        return self._level
+
+    def state(self) -> Tuple[float, float, float]:
+        return self._level, self._updated, self.blocked_until
+
+    def load(self, level: float, updated: float, blocked_until: float) -> None:
+        self._level = min(self.capacity, level)
+        self._updated = updated
+        self.blocked_until = blocked_until
+
+
+def parse_reset_seconds(value: str) -> Optional[float]:
+    """Parse rate-limit reset values such as ``"7.66s"``, ``"2m59.5s"``, ``"500ms"``."""
+    value = (value or "").strip()
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    total = 0.0
+    matched = False
+    for number, unit in re.findall(r"([\d.]+)\s*(ms|h|m|s)", value):
+        matched = True
+        total += float(number) * {"ms": 0.001, "s": 1, "m": 60, "h": 3600}[unit]
+    return total if matched else None
+
+
+class SQLiteRateStore:
+    """Bucket state kept in one SQLite table, shared by processes on a host.
+
+    ``transaction`` holds the database write lock while buckets are loaded,
+    updated and written back, so gunicorn workers draw from one budget
+    instead of each keeping its own guess. ``read`` only loads the current
+    state and takes no write lock.
+    """
+
+    def __init__(self, path: str, table: str = "rate_limits", timeout: float = 5.0):
+        if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", table):
+            raise ValueError(f"Invalid rate limit table name: {table!r}")
+        self.path = path
+        self.table = table
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=timeout, check_same_thread=False, isolation_level=None
+        )
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "key TEXT PRIMARY KEY, level REAL NOT NULL, "
+                "updated REAL NOT NULL, blocked_until REAL NOT NULL)"
+            )
+
+    def _load(self, buckets: Dict[str, TokenBucket]) -> None:
+        # Caller holds self._lock.
+        keys = list(buckets)
+        rows = self._conn.execute(
+            f"SELECT key, level, updated, blocked_until FROM {self.table} "
+            f"WHERE key IN ({', '.join('?' for _ in keys)})",
+            keys,
+        ).fetchall()
+        for key, level, updated, blocked_until in rows:
+            buckets[key].load(level, updated, blocked_until)
+
+    def read(self, buckets: Dict[str, TokenBucket]) -> None:
+        with self._lock:
+            self._load(buckets)
+
+    @contextmanager
+    def transaction(self, buckets: Dict[str, TokenBucket]) -> Iterator[None]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._load(buckets)
+                yield
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO {self.table} "
+                    "(key, level, updated, blocked_until) VALUES (?, ?, ?, ?)",
+                    [(key, *bucket.state()) for key, bucket in buckets.items()],
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+
+class RateLimiter:
+    """RPM/TPM budget per provider and model.
+
+    ``limits`` maps ``"provider"`` or ``"provider:model"`` to a dict with
+    ``rpm`` and optionally ``tpm``; model entries override the provider's.
+    The TPM budget tightens from ``x-ratelimit-*-tokens`` response headers and
+    every budget pauses while a ``Retry-After`` is in force. With a ``store`` the bucket levels live in
+    SQLite and every process using the same file shares them; request
+    counters in ``stats()`` stay per process. If the store fails (for
+    example stays locked past its timeout) the call falls back to this
+    process's buckets and ``store_errors`` is incremented.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, Mapping[str, float]],
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+        store: Optional[SQLiteRateStore] = None,
+    ):
+        self.limits = {key: dict(value) for key, value in limits.items()}
+        self._clock = clock
+        self._sleep = sleep
+        self.store = store
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple[str, str], Dict[str, TokenBucket]] = {}
+        self._counters: Dict[Tuple[str, str], Dict[str, float]] = {}
+        self.store_errors = 0
+
+    def _limits_for(self, provider: str, model: str) -> Dict[str, float]:
+        return {
+            **self.limits.get(provider, {}),
+            **self.limits.get(f"{provider}:{model}", {}),
+        }
+
+    def _buckets_for(self, provider: str, model: str) -> Dict[str, TokenBucket]:
+        key = (provider, model)
+        buckets = self._buckets.get(key)
+        if buckets is None:
+            limits = self._limits_for(provider, model)
+            buckets = {
+                kind: TokenBucket(limits[kind], clock=self._clock)
+                for kind in ("rpm", "tpm")
+                if limits.get(kind)
+            }
+            self._buckets[key] = buckets
+            self._counters[key] = {"acquired": 0, "waited_seconds": 0.0, "rejected": 0}
+        return buckets
+
+    def _keyed(self, provider: str, model: str) -> Dict[str, TokenBucket]:
+        buckets = self._buckets_for(provider, model)
+        return {f"{provider}:{model}:{kind}": b for kind, b in buckets.items()}
+
+    @contextmanager
+    def _synced(
+        self, provider: str, model: str
+    ) -> Iterator[Dict[str, TokenBucket]]:
+        # Callers must hold self._lock.
+        buckets = self._buckets_for(provider, model)
+        if self.store is None or not buckets:
+            yield buckets
+            return
+        with self.store.transaction(self._keyed(provider, model)):
+            yield buckets
+
+    def _read(self, provider: str, model: str) -> Dict[str, TokenBucket]:
+        # Callers must hold self._lock. Loads shared state without locking it.
+        buckets = self._buckets_for(provider, model)
+        if self.store is not None and buckets:
+            try:
+                self.store.read(self._keyed(provider, model))
+            except sqlite3.Error:
+                self.store_errors += 1
+        return buckets
+
+    def wait_time(self, provider: str, model: str, tokens: int = 0) -> float:
+        """Seconds until a call would be allowed, without booking it."""
+        with self._lock:
+            buckets = self._read(provider, model)
+            return max(
+                [
+                    bucket.wait_time(1 if kind == "rpm" else tokens)
+                    for kind, bucket in buckets.items()
+                ]
+                or [0.0]
+            )
+
+    def _book(
+        self,
+        provider: str,
+        model: str,
+        buckets: Dict[str, TokenBucket],
+        tokens: int,
+        max_wait: Optional[float],
+    ) -> Optional[float]:
+        # Caller holds self._lock. Returns the wait, or None when rejected.
+        counters = self._counters[(provider, model)]
+        amounts = {"rpm": 1, "tpm": tokens}
+        wait = max(
+            [bucket.wait_time(amounts[kind]) for kind, bucket in buckets.items()]
+            or [0.0]
+        )
+        if max_wait is not None and wait > max_wait:
+            counters["rejected"] += 1
+            return None
+        for kind, bucket in buckets.items():
+            bucket.reserve(amounts[kind])
+        counters["acquired"] += 1
+        counters["waited_seconds"] += wait
+        return wait
+
+    def acquire(
+        self,
+        provider: str,
+        model: str,
+        tokens: int = 0,
+        max_wait: Optional[float] = None,
+    ) -> bool:
+        """Book one request (and ``tokens``), sleeping only if budget is short.
+
+        Returns False without booking anything when the wait would exceed
+        ``max_wait``, so callers can move on to another model instead.
+        """
+        booked = False
+        wait: Optional[float] = None
+        with self._lock:
+            try:
+                with self._synced(provider, model) as buckets:
+                    wait = self._book(provider, model, buckets, tokens, max_wait)
+                    booked = True
+            except sqlite3.Error:
+                self.store_errors += 1
+                if not booked:
+                    buckets = self._buckets_for(provider, model)
+                    wait = self._book(provider, model, buckets, tokens, max_wait)
+        if wait is None:
+            return False
+        if wait > 0:
+            self._sleep(wait)
+        return True
+
+    def observe(
+        self,
+        provider: str,
+        model: str,
+        headers: Mapping[str, Any],
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """Fold a provider response's rate-limit signals into the budget."""
+        lowered = {str(k).lower(): str(v) for k, v in (headers or {}).items()}
+        with self._lock:
+            try:
+                with self._synced(provider, model) as buckets:
+                    self._apply(buckets, lowered, retry_after)
+            except sqlite3.Error:
+                self.store_errors += 1
+                self._apply(self._buckets_for(provider, model), lowered, retry_after)
+
+    @staticmethod
+    def _apply(
+        buckets: Dict[str, TokenBucket],
+        lowered: Mapping[str, str],
+        retry_after: Optional[float],
+    ) -> None:
+        # Groq's x-ratelimit-*-requests headers count requests per day, not
+        # per minute, so they say nothing about the RPM bucket; only the
+        # per-minute token headers are applied.
+        bucket = buckets.get("tpm")
+        remaining = lowered.get("x-ratelimit-remaining-tokens")
+        if bucket is not None and remaining is not None:
+            try:
+                remaining_value: Optional[float] = float(remaining)
+            except ValueError:
+                remaining_value = None
+            if remaining_value is not None:
+                bucket.limit_remaining(remaining_value)
+                if remaining_value <= 0:
+                    reset = parse_reset_seconds(
+                        lowered.get("x-ratelimit-reset-tokens", "")
+                    )
+                    if reset:
+                        bucket.block_for(reset)
+        if retry_after:
+            for bucket in buckets.values():
+                bucket.block_for(retry_after)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            report: Dict[str, Any] = {}
+            for provider, model in list(self._buckets):
+                buckets = self._read(provider, model)
+                now = self._clock()
+                report[f"{provider}:{model}"] = {
+                    **self._counters[(provider, model)],
+                    **{
+                        f"{kind}_available": round(bucket.level(), 1)
+                        for kind, bucket in buckets.items()
+                    },
+                    "blocked_for_seconds": round(
+                        max([0.0] + [b.blocked_until - now for b in buckets.values()]),
+                        1,
+                    ),
+                }
+            return report
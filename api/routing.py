@@ -0,0 +1,175 @@
+"""Health tracking and circuit breaking for LLM provider routes."""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class _Route:
+    def __init__(self, window: int):
+        self.latency_ewma: Optional[float] = None
+        self.outcomes: "deque[bool]" = deque(maxlen=window)
+        self.state = CLOSED
+        self.open_until = 0.0
+        self.open_seconds = 0.0
+        self.probing = False
+        self.requests = 0
+        self.errors = 0
+        self.skipped = 0
+
+
+class ProviderRouter:
+    """Per ``provider:model`` latency EWMA, rolling error rate and breaker.
+
+    A route's breaker opens once at least ``min_samples`` of its last
+    ``window`` calls are known and ``error_threshold`` of them failed. While
+    open the route is skipped; after ``open_seconds`` a single probe call is
+    let through. A successful probe closes the breaker, a failed one reopens
+    it for twice as long, up to ``max_open_seconds``.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.3,
+        window: int = 20,
+        min_samples: int = 5,
+        error_threshold: float = 0.5,
+        open_seconds: float = 30.0,
+        max_open_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.alpha = alpha
+        self.window = window
+        self.min_samples = min_samples
+        self.error_threshold = error_threshold
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._routes: Dict[str, _Route] = {}
+
+    def _route(self, provider: str, model: str) -> _Route:
+        key = f"{provider}:{model}"
+        route = self._routes.get(key)
+        if route is None:
+            route = self._routes[key] = _Route(self.window)
+        return route
+
+    def _open(self, route: _Route, seconds: float) -> None:
+        route.state = OPEN
+        route.open_seconds = min(seconds, self.max_open_seconds)
+        route.open_until = self._clock() + route.open_seconds
+        route.probing = False
+
+    def available(self, provider: str, model: str) -> bool:
+        """Whether ``allow`` would currently let a call through (no side effects)."""
+        with self._lock:
+            route = self._route(provider, model)
+            if route.state == CLOSED:
+                return True
+            if route.state == OPEN:
+                return self._clock() >= route.open_until
+            return not route.probing
+
+    def allow(self, provider: str, model: str) -> bool:
+        """Admit a call, claiming the probe slot when the breaker is recovering."""
+        with self._lock:
+            route = self._route(provider, model)
+            if route.state == OPEN and self._clock() >= route.open_until:
+                route.state = HALF_OPEN
+            if route.state == CLOSED:
+                return True
+            if route.state == HALF_OPEN and not route.probing:
+                route.probing = True
+                return True
+            route.skipped += 1
+            return False
+
+    def record(self, provider: str, model: str, latency: float, ok: bool) -> None:
+        with self._lock:
+            route = self._route(provider, model)
+            route.requests += 1
+            if ok:
+                route.latency_ewma = (
+                    latency
+                    if route.latency_ewma is None
+                    else self.alpha * latency + (1 - self.alpha) * route.latency_ewma
+                )
+            else:
+                route.errors += 1
+            route.outcomes.append(ok)
+            if route.state == HALF_OPEN:
+                if ok:
+                    route.state = CLOSED
+                    route.outcomes.clear()
+                    route.open_seconds = 0.0
+                else:
+                    self._open(route, route.open_seconds * 2)
+                route.probing = False
+            elif route.state == CLOSED:
+                error_rate = self._error_rate(route)
+                if error_rate is not None and error_rate >= self.error_threshold:
+                    self._open(route, self.open_seconds)
+
+    def release(self, provider: str, model: str) -> None:
+        """Give back a probe slot claimed by ``allow`` when no call was made."""
+        with self._lock:
+            self._route(provider, model).probing = False
+
+    def _error_rate(self, route: _Route) -> Optional[float]:
+        if len(route.outcomes) < self.min_samples:
+            return None
+        return route.outcomes.count(False) / len(route.outcomes)
+
+    def score(self, provider: str, models: Iterable[str]) -> Optional[float]:
+        """Best error-weighted latency among the provider's available models.
+
+        ``None`` means no model has a latency sample yet.
+        """
+        best: Optional[float] = None
+        for model in models:
+            if not self.available(provider, model):
+                continue
+            with self._lock:
+                route = self._route(provider, model)
+                if route.latency_ewma is None:
+                    continue
+                errors = route.outcomes.count(False) / max(1, len(route.outcomes))
+                value = route.latency_ewma * (1 + errors)
+            best = value if best is None else min(best, value)
+        return best
+
+    def clear(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        now = self._clock()
+        with self._lock:
+            return {
+                key: {
+                    "state": route.state,
+                    "latency_ms_ewma": (
+                        round(route.latency_ewma * 1000, 1)
+                        if route.latency_ewma is not None
+                        else None
+                    ),
+                    "error_rate": (
+                        round(route.outcomes.count(False) / len(route.outcomes), 3)
+                        if route.outcomes
+                        else None
+                    ),
+                    "requests": route.requests,
+                    "errors": route.errors,
+                    "skipped": route.skipped,
+                    "open_for_seconds": round(max(0.0, route.open_until - now), 1)
+                    if route.state == OPEN
+                    else 0.0,
+                }
+                for key, route in self._routes.items()
+            }
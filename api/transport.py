@@ -0,0 +1,220 @@
+"""Pooled, keep-alive HTTP transport shared by all outbound fetches."""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class HttpPool:
+    """Thread-safe registry of keep-alive sessions, one per upstream host.
+
+    Each host gets its own ``requests.Session`` with a connection pool sized
+    from ``host_pool_sizes`` (or ``default_pool_size``), so repeated calls to
+    the same few hosts reuse TCP+TLS connections instead of handshaking again.
+    ``max_connections`` caps the number of requests in flight across all
+    hosts; callers block for up to ``acquire_timeout`` seconds for a slot.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 64,
+        default_pool_size: int = 4,
+        host_pool_sizes: Optional[Dict[str, int]] = None,
+        acquire_timeout: float = 10.0,
+    ):
+        self.max_connections = max_connections
+        self.default_pool_size = default_pool_size
+        self.host_pool_sizes = dict(host_pool_sizes or {})
+        self.acquire_timeout = acquire_timeout
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._sessions: Dict[str, requests.Session] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._in_flight = 0
+        self._exhausted = 0
+
+    def _pool_size_for(self, host: str) -> int:
+        bare_host = host.removeprefix("www.")
+        return self.host_pool_sizes.get(
+            host, self.host_pool_sizes.get(bare_host, self.default_pool_size)
+        )
+
+    def session_for(self, url: str) -> requests.Session:
+        host = (urlparse(url).hostname or "").lower()
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                # A few extra host slots per adapter keep redirect targets
+                # (e.g. reddit -> old.reddit) from evicting the primary pool.
+                adapter = HTTPAdapter(
+                    pool_connections=4, pool_maxsize=self._pool_size_for(host)
+                )
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[host] = session
+                self._counters[host] = {"requests": 0, "errors": 0}
+        return session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        session = self.session_for(url)
+        host = (urlparse(url).hostname or "").lower()
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            with self._lock:
+                self._exhausted += 1
+            raise requests.ConnectionError(
+                f"HTTP pool exhausted ({self.max_connections} requests in flight)"
+            )
+        with self._lock:
+            self._in_flight += 1
+            self._counters[host]["requests"] += 1
+        try:
+            return session.request(method, url, **kwargs)
+        except Exception:
+            with self._lock:
+                self._counters[host]["errors"] += 1
+            raise
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._slots.release()
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("HEAD", url, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            sessions = dict(self._sessions)
+            counters = {host: dict(values) for host, values in self._counters.items()}
+            in_flight = self._in_flight
+            exhausted = self._exhausted
+        hosts: Dict[str, Dict[str, int]] = {}
+        for host, session in sessions.items():
+            opened = 0
+            for adapter in set(session.adapters.values()):
+                pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+                if pools is None:
+                    continue
+                for key in list(pools.keys()):
+                    pool = pools.get(key)
+                    opened += int(getattr(pool, "num_connections", 0) or 0)
+            requests_made = counters.get(host, {}).get("requests", 0)
+            hosts[host] = {
+                **counters.get(host, {}),
+                "pool_size": self._pool_size_for(host),
+                "connections_opened": opened,
+                "connections_reused": max(0, requests_made - opened),
+            }
+        return {
+            "max_connections": self.max_connections,
+            "in_flight": in_flight,
+            "exhausted": exhausted,
+            "hosts": hosts,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            self._counters.clear()
+        for session in sessions:
+            session.close()
+
+
+class ProviderClient:
+    """Process-wide keep-alive client for one LLM provider.
+
+    Holds a single pooled session so consecutive claims and fallback models
+    reuse the TLS connection to the provider. Connect and read timeouts are
+    tuned separately, and every call records its time-to-first-byte and
+    total latency per model.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 25.0,
+        pool_size: int = 8,
+        latency_window: int = 200,
+    ):
+        self.name = name
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.latency_window = latency_window
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._lock = threading.Lock()
+        self._samples: Dict[str, Any] = {}
+
+    def post(self, url: str, model: str = "", **kwargs: Any) -> requests.Response:
+        kwargs.setdefault("timeout", (self.connect_timeout, self.read_timeout))
+        started = time.perf_counter()
+        try:
+            response = self._session.post(url, **kwargs)
+        except Exception:
+            self._record(model, None, time.perf_counter() - started, ok=False)
+            raise
+        self._record(
+            model,
+            response.elapsed.total_seconds(),
+            time.perf_counter() - started,
+            ok=response.status_code < 400,
+        )
+        return response
+
+    def _record(
+        self, model: str, ttfb: Optional[float], total: float, ok: bool
+    ) -> None:
+        with self._lock:
+            samples = self._samples.setdefault(
+                model or self.name,
+                {
+                    "requests": 0,
+                    "errors": 0,
+                    "ttfb": deque(maxlen=self.latency_window),
+                    "total": deque(maxlen=self.latency_window),
+                },
+            )
+            samples["requests"] += 1
+            if not ok:
+                samples["errors"] += 1
+            if ttfb is not None:
+                samples["ttfb"].append(ttfb)
+            samples["total"].append(total)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            models = {
+                model: {
+                    "requests": samples["requests"],
+                    "errors": samples["errors"],
+                    "ttfb_ms_p50": _percentile_ms(samples["ttfb"], 0.5),
+                    "ttfb_ms_p95": _percentile_ms(samples["ttfb"], 0.95),
+                    "total_ms_p50": _percentile_ms(samples["total"], 0.5),
+                    "total_ms_p95": _percentile_ms(samples["total"], 0.95),
+                }
+                for model, samples in self._samples.items()
+            }
+        return {"provider": self.name, "models": models}
+
+    def close(self) -> None:
+        self._session.close()
+
+
+def _percentile_ms(samples: Any, fraction: float) -> Optional[float]:
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return round(ordered[index] * 1000, 1)
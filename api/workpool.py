@@ -0,0 +1,135 @@
+"""Process-wide bounded executor with per-host concurrency limits."""
+
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+
+def _host_key(host: str) -> str:
+    return (host or "").lower().removeprefix("www.")
+
+
+class WorkPool:
+    """Shared worker pool that keeps at most N tasks per host in flight.
+
+    Tasks are submitted with the host they will talk to. A task whose host is
+    already at its limit waits in a per-host queue without holding a worker
+    thread, so a slow search engine cannot starve page fetches to other hosts.
+    ``stats()`` reports queue depth, running tasks and per-host load.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 16,
+        host_limits: Optional[Dict[str, int]] = None,
+        default_host_limit: int = 4,
+        name: str = "workpool",
+    ):
+        self.max_workers = max_workers
+        self.host_limits = {
+            _host_key(host): limit for host, limit in (host_limits or {}).items()
+        }
+        self.default_host_limit = default_host_limit
+        self.name = name
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=name
+        )
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Deque[Tuple[Future, Callable, tuple, dict]]] = {}
+        self._host_running: Dict[str, int] = {}
+        self._host_counters: Dict[str, Dict[str, int]] = {}
+        self._waiting = 0
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._peak_queue_depth = 0
+
+    def limit_for(self, host: str) -> int:
+        return self.host_limits.get(_host_key(host), self.default_host_limit)
+
+    def submit(
+        self, fn: Callable[..., Any], *args: Any, host: str = "", **kwargs: Any
+    ) -> Future:
+        key = _host_key(host)
+        future: Future = Future()
+        with self._lock:
+            self._pending.setdefault(key, deque()).append((future, fn, args, kwargs))
+            self._host_counters.setdefault(key, {"submitted": 0, "throttled": 0})
+            self._host_counters[key]["submitted"] += 1
+            if self._host_running.get(key, 0) >= self.limit_for(key):
+                self._host_counters[key]["throttled"] += 1
+            self._waiting += 1
+            self._note_queue_depth()
+        self._dispatch(key)
+        return future
+
+    def _note_queue_depth(self) -> None:
+        self._peak_queue_depth = max(
+            self._peak_queue_depth, self._waiting + self._queued
+        )
+
+    def _dispatch(self, key: str) -> None:
+        while True:
+            with self._lock:
+                pending = self._pending.get(key)
+                if not pending:
+                    return
+                if self._host_running.get(key, 0) >= self.limit_for(key):
+                    return
+                future, fn, args, kwargs = pending.popleft()
+                self._waiting -= 1
+                if future.cancelled():
+                    continue
+                self._host_running[key] = self._host_running.get(key, 0) + 1
+                self._queued += 1
+            self._executor.submit(self._run, key, future, fn, args, kwargs)
+
+    def _run(
+        self, key: str, future: Future, fn: Callable, args: tuple, kwargs: dict
+    ) -> None:
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        ok = True
+        try:
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except BaseException as exc:
+                    ok = False
+                    future.set_exception(exc)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+                if not ok:
+                    self._failed += 1
+                self._host_running[key] -= 1
+            self._dispatch(key)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hosts = {
+                key: {
+                    **counters,
+                    "in_flight": self._host_running.get(key, 0),
+                    "waiting": len(self._pending.get(key, ())),
+                    "limit": self.limit_for(key),
+                }
+                for key, counters in self._host_counters.items()
+            }
+            return {
+                "max_workers": self.max_workers,
+                "queue_depth": self._waiting + self._queued,
+                "peak_queue_depth": self._peak_queue_depth,
+                "waiting_on_host": self._waiting,
+                "running": self._running,
+                "completed": self._completed,
+                "failed": self._failed,
+                "hosts": hosts,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
@@ -1,9 +1,11 @@
+import json
 import os
 import time
 
 from dotenv import load_dotenv
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request, stream_with_context
 from flask_cors import CORS
+from flask_cors.core import get_cors_headers, get_cors_options
 
 # Load environment variables before importing core utilities
 try:
@@ -11,18 +13,51 @@ try:
 except Exception:
     pass
 
+from api.aio import pipeline_stats
+from api.jobs import JOBS, JOBS_SUPPORTED
 from api.core import (
+    ADAPTER_POOL,
+    CLAIM_STORE,
+    EVIDENCE_POOL,
+    EXTRACTION_CACHE,
     GEMINI_API_KEY,
     GROQ_API_KEY,
+    HTTP_POOL,
+    IMAGE_ANALYSIS_POOL,
+    PAGE_SUMMARY_CACHE,
+    PROVIDER_CLIENTS,
+    PROVIDER_ROUTER,
+    RATE_LIMITER,
+    REDDIT_FAILURES,
+    SEARCH_CACHE,
+    STREAM_POOL,
+    VERDICT_CACHE,
     _get_env_var_insensitive,
     fact_check_extension_post_input,
     fact_check_image_input,
     fact_check_text_input,
     fact_check_url_input,
+    stream_pipeline,
 )
 
 app = Flask(__name__)
-CORS(app)
+# Room for a 10 MB image data URL plus the JSON around it. asgi.py enforces
+# the same limit on its native routes.
+app.config["MAX_CONTENT_LENGTH"] = 16 * 1024 * 1024
+# One CORS policy for the Flask routes and asgi.py's native routes.
+CORS_OPTIONS: dict = {}
+CORS(app, **CORS_OPTIONS)
+
+
+def cors_headers(request_headers, method: str) -> list:
+    """The CORS headers Flask-CORS adds to a response for this request."""
+    options = get_cors_options(app, CORS_OPTIONS)
+    return list(get_cors_headers(options, request_headers, method).items(multi=True))
+
+
+@app.errorhandler(413)
+def request_too_large(_error):
+    return jsonify({"error": "Request body is too large"}), 413
 
 
 import mimetypes
@@ -81,24 +116,98 @@ def health_check():
             "primary_provider": "groq"
             if groq_set
             else ("gemini" if gemini_set else "none"),
+            "http_pool": HTTP_POOL.stats(),
+            "evidence_pool": EVIDENCE_POOL.stats(),
+            "adapter_pool": ADAPTER_POOL.stats(),
+            "stream_pool": STREAM_POOL.stats(),
+            "image_analysis_pool": IMAGE_ANALYSIS_POOL.stats(),
+            "async_pipeline": pipeline_stats(),
+            "jobs": JOBS.stats(),
+            "rate_limits": RATE_LIMITER.stats(),
+            "provider_routes": PROVIDER_ROUTER.stats(),
+            "verdict_cache": VERDICT_CACHE.stats(),
+            "claim_store": CLAIM_STORE.stats(),
+            "extraction_cache": EXTRACTION_CACHE.stats(),
+            "search_cache": SEARCH_CACHE.stats(),
+            "page_summary_cache": PAGE_SUMMARY_CACHE.stats(),
+            "reddit_routes": REDDIT_FAILURES.stats(),
+            "llm_providers": {
+                name: client.stats() for name, client in PROVIDER_CLIENTS.items()
+            },
         }
     )
 
 
+def fact_check_request_error(data: dict):
+    """Return an (error body, status) pair when a fact-check payload is invalid."""
+    if not data.get("text", "") and not data.get("url", ""):
+        return {"error": "No text or URL provided"}, 400
+    return None
+
+
+def image_request_error(data: dict):
+    """Return an (error body, status) pair when an image payload is invalid."""
+    image_data_url = data.get("image_data_url")
+    if not image_data_url and not data.get("image_url"):
+        return {"error": "Provide image_data_url (data URI) or image_url"}, 400
+    if image_data_url and len(image_data_url) > 10 * 1024 * 1024:
+        return {"error": "Image data URL is too large. Please use a smaller image."}, 400
+    return None
+
+
+STREAM_CONTENT_TYPES = {"sse": "text/event-stream", "ndjson": "application/x-ndjson"}
+
+
+def stream_format(accept: str, data: dict):
+    """Return "sse" or "ndjson" when the client asked for a streamed response."""
+    if "text/event-stream" in accept:
+        return "sse"
+    if "application/x-ndjson" in accept or data.get("stream"):
+        return "ndjson"
+    return None
+
+
+def encode_event(fmt: str, name: str, payload: dict) -> bytes:
+    body = json.dumps(payload)
+    if fmt == "sse":
+        return f"event: {name}\ndata: {body}\n\n".encode("utf-8")
+    return (json.dumps({"event": name, "data": payload}) + "\n").encode("utf-8")
+
+
+def fact_check_pipeline(data: dict):
+    """The (pipeline, argument) pair a validated fact-check payload runs."""
+    if data.get("url", ""):
+        return fact_check_url_input, data["url"]
+    return fact_check_text_input, data.get("text", "")
+
+
+def fact_check_event_stream(fmt: str, data: dict):
+    """Encoded per-stage events for a validated fact-check payload."""
+    for name, payload in stream_pipeline(*fact_check_pipeline(data)):
+        yield encode_event(fmt, name, payload)
+
+
 @app.route("/fact-check", methods=["POST"])
 @app.route("/api/fact-check", methods=["POST"])
 def fact_check():
     data = request.get_json(silent=True) or {}
-    text = data.get("text", "")
-    url = data.get("url", "")
+    error = fact_check_request_error(data)
+    if error:
+        return jsonify(error[0]), error[1]
 
-    if not text and not url:
-        return jsonify({"error": "No text or URL provided"}), 400
+    fmt = stream_format(request.headers.get("Accept", ""), data)
+    if fmt:
+        return Response(
+            stream_with_context(fact_check_event_stream(fmt, data)),
+            mimetype=STREAM_CONTENT_TYPES[fmt],
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
 
+    url = data.get("url", "")
     if url:
         response_data, status_code = fact_check_url_input(url)
     else:
-        response_data, status_code = fact_check_text_input(text)
+        response_data, status_code = fact_check_text_input(data.get("text", ""))
 
     return jsonify(response_data), status_code
 
@@ -107,18 +216,13 @@ def fact_check():
 @app.route("/api/fact-check-image", methods=["POST"])
 def fact_check_image():
     data = request.get_json(silent=True) or {}
-    image_data_url = data.get("image_data_url")
-    image_url = data.get("image_url")
-
-    if not image_data_url and not image_url:
-        return jsonify({"error": "Provide image_data_url (data URI) or image_url"}), 400
-
-    if image_data_url and len(image_data_url) > 10 * 1024 * 1024:
-        return jsonify(
-            {"error": "Image data URL is too large. Please use a smaller image."}
-        ), 400
+    error = image_request_error(data)
+    if error:
+        return jsonify(error[0]), error[1]
 
-    response_data, status_code = fact_check_image_input(image_data_url, image_url)
+    response_data, status_code = fact_check_image_input(
+        data.get("image_data_url"), data.get("image_url")
+    )
     return jsonify(response_data), status_code
 
 
@@ -130,5 +234,92 @@ def fact_check_extension_post():
     return jsonify(response_data), status_code
 
 
+def job_request(data: dict):
+    """Return (kind, payload, error) for a POST /api/jobs body.
+
+    ``kind`` may be omitted for text, URL and image checks; extension checks
+    must say ``"kind": "extension"``.
+    """
+    kind = data.get("kind", "")
+    if not kind:
+        if data.get("url"):
+            kind = "url"
+        elif data.get("text"):
+            kind = "text"
+        elif data.get("image_data_url") or data.get("image_url"):
+            kind = "image"
+    if kind == "url":
+        payload = {"url": data.get("url", "")}
+        return kind, payload, fact_check_request_error(payload)
+    if kind == "text":
+        payload = {"text": data.get("text", "")}
+        return kind, payload, fact_check_request_error(payload)
+    if kind == "image":
+        payload = {
+            "image_data_url": data.get("image_data_url"),
+            "image_url": data.get("image_url"),
+        }
+        return kind, payload, image_request_error(payload)
+    if kind == "extension":
+        return kind, {k: v for k, v in data.items() if k != "kind"}, None
+    message = "Provide text, url or an image, or set kind to extension"
+    return kind, {}, ({"error": message}, 400)
+
+
+def job_view(job: dict) -> dict:
+    view = {
+        "job_id": job["id"],
+        "kind": job["kind"],
+        "status": job["status"],
+        "created_at": job["created_at"],
+        "updated_at": job["updated_at"],
+        "expires_at": job["expires_at"],
+        "status_url": f"/api/jobs/{job['id']}",
+        "result_url": f"/api/jobs/{job['id']}/result",
+    }
+    if job.get("error"):
+        view["error"] = job["error"]
+    return view
+
+
+@app.route("/api/jobs", methods=["POST"])
+def submit_job():
+    if not JOBS_SUPPORTED:
+        message = (
+            "Background jobs need a long-running server; on serverless use "
+            "/api/fact-check, optionally streamed"
+        )
+        return jsonify({"error": message}), 501
+    data = request.get_json(silent=True) or {}
+    kind, payload, error = job_request(data)
+    if error:
+        return jsonify(error[0]), error[1]
+
+    job, created = JOBS.submit(kind, payload)
+    response = jsonify({**job_view(job), "deduplicated": not created})
+    response.headers["Location"] = f"/api/jobs/{job['id']}"
+    return response, 202
+
+
+@app.route("/api/jobs/<job_id>", methods=["GET"])
+def get_job(job_id):
+    job = JOBS.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found or expired"}), 404
+    return jsonify(job_view(job)), 200
+
+
+@app.route("/api/jobs/<job_id>/result", methods=["GET"])
+def get_job_result(job_id):
+    job = JOBS.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found or expired"}), 404
+    if job["status"] == "done":
+        return jsonify(job["result"]), job["status_code"]
+    if job["status"] == "failed":
+        return jsonify({"error": job.get("error") or "Job failed"}), 500
+    return jsonify(job_view(job)), 202
+
+
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=int(os.environ.get("PORT", 5000)), debug=False)
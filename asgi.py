@@ -0,0 +1,265 @@
+"""ASGI entry point.
+
+The fact-check routes await ``api.aio``, which runs the blocking pipelines on
+a bounded executor without blocking the event loop; when that executor and
+its wait queue are full the route answers 503 instead of queueing.
+Streamed fact checks (SSE or NDJSON) are sent as each stage finishes. Every
+other route (static files, health, CORS preflight) is passed through to the
+Flask app. Run with any ASGI server, e.g. ``uvicorn asgi:application``.
+"""
+
+import asyncio
+import json
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from asgiref.wsgi import WsgiToAsgi
+from werkzeug.datastructures import Headers
+
+from api.aio import (
+    PipelineBusy,
+    fact_check_extension_post_input_async,
+    fact_check_image_input_async,
+    fact_check_text_input_async,
+    fact_check_url_input_async,
+)
+from api.core import PIPELINE_FINAL_EVENTS, start_pipeline
+from app import (
+    STREAM_CONTENT_TYPES,
+    app,
+    cors_headers,
+    encode_event,
+    fact_check_pipeline,
+    fact_check_request_error,
+    image_request_error,
+    stream_format,
+)
+
+Response = Tuple[Dict[str, Any], int]
+
+# Everything that is not a native fact-check route is served by the Flask app.
+flask_application = WsgiToAsgi(app)
+
+
+async def _fact_check(data: Dict[str, Any]) -> Response:
+    error = fact_check_request_error(data)
+    if error:
+        return error
+    if data.get("url", ""):
+        return await fact_check_url_input_async(data["url"])
+    return await fact_check_text_input_async(data.get("text", ""))
+
+
+async def _fact_check_image(data: Dict[str, Any]) -> Response:
+    error = image_request_error(data)
+    if error:
+        return error
+    return await fact_check_image_input_async(
+        data.get("image_data_url"), data.get("image_url")
+    )
+
+
+async def _fact_check_extension(data: Dict[str, Any]) -> Response:
+    return await fact_check_extension_post_input_async(data)
+
+
+ASYNC_ROUTES: Dict[str, Callable[[Dict[str, Any]], Awaitable[Response]]] = {
+    "/fact-check": _fact_check,
+    "/api/fact-check": _fact_check,
+    "/fact-check-image": _fact_check_image,
+    "/api/fact-check-image": _fact_check_image,
+    "/extension/fact-check": _fact_check_extension,
+    "/api/extension/fact-check": _fact_check_extension,
+}
+
+
+class _ClientDisconnected(Exception):
+    pass
+
+
+async def _read_body(receive: Callable, limit: Optional[int]) -> Optional[bytes]:
+    """Read the request body, or return None once it exceeds ``limit`` bytes.
+
+    Raises _ClientDisconnected if the client goes away before the body ends.
+    """
+    chunks: List[bytes] = []
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            raise _ClientDisconnected()
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if limit is not None and size > limit:
+            return None
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+def _header(scope: Dict[str, Any], name: bytes) -> str:
+    for key, value in scope.get("headers", []):
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return ""
+
+
+def _cors_headers(scope: Dict[str, Any]) -> List[Tuple[str, str]]:
+    headers = Headers(
+        [
+            (name.decode("latin-1"), value.decode("latin-1"))
+            for name, value in scope.get("headers", [])
+        ]
+    )
+    return cors_headers(headers, scope["method"])
+
+
+def _json_payload(scope: Dict[str, Any], body: bytes) -> Dict[str, Any]:
+    # Mirrors request.get_json(silent=True): only JSON bodies count.
+    content_type = _header(scope, b"content-type").split(";")[0].strip().lower()
+    if content_type != "application/json" and not content_type.endswith("+json"):
+        return {}
+    try:
+        data = json.loads(body or b"null")
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+async def _send(
+    send: Callable, status: int, headers: List[Tuple[str, str]], body: bytes
+) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (name.lower().encode("latin-1"), value.encode("latin-1"))
+                for name, value in headers
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _wait_for_disconnect(receive: Callable) -> None:
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+async def _send_stream(
+    send: Callable,
+    receive: Callable,
+    headers: List[Tuple[str, str]],
+    fmt: str,
+    data: Dict[str, Any],
+) -> None:
+    # The pipeline runs on STREAM_POOL and hands each event to the loop, so an
+    # open stream holds no executor thread while it waits between stages.
+    loop = asyncio.get_running_loop()
+    events: "asyncio.Queue[Tuple[str, Dict[str, Any]]]" = asyncio.Queue()
+    closed = threading.Event()
+
+    def on_event(name: str, payload: Dict[str, Any]) -> None:
+        if closed.is_set():
+            return
+        try:
+            loop.call_soon_threadsafe(events.put_nowait, (name, payload))
+        except RuntimeError:
+            # The loop has already shut down; nobody is listening any more.
+            closed.set()
+
+    pipeline = start_pipeline(*fact_check_pipeline(data), on_event=on_event)
+    disconnected = asyncio.ensure_future(_wait_for_disconnect(receive))
+    try:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (name.lower().encode("latin-1"), value.encode("latin-1"))
+                    for name, value in [
+                        ("Content-Type", STREAM_CONTENT_TYPES[fmt]),
+                        ("Cache-Control", "no-cache"),
+                        *headers,
+                    ]
+                ],
+            }
+        )
+        while True:
+            next_event = asyncio.ensure_future(events.get())
+            await asyncio.wait(
+                {next_event, disconnected}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not next_event.done():
+                next_event.cancel()
+                return
+            name, payload = next_event.result()
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": encode_event(fmt, name, payload),
+                    "more_body": True,
+                }
+            )
+            if name in PIPELINE_FINAL_EVENTS:
+                break
+        await send({"type": "http.response.body", "body": b""})
+    finally:
+        closed.set()
+        pipeline.cancel()
+        disconnected.cancel()
+
+
+async def _lifespan(receive: Callable, send: Callable) -> None:
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def application(scope: Dict[str, Any], receive: Callable, send: Callable):
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+    if scope["type"] != "http":
+        return
+
+    limit = app.config.get("MAX_CONTENT_LENGTH")
+    declared = _header(scope, b"content-length")
+    too_large = limit is not None and declared.isdigit() and int(declared) > limit
+    handler = ASYNC_ROUTES.get(scope["path"])
+    if not too_large and (handler is None or scope["method"] != "POST"):
+        await flask_application(scope, receive, send)
+        return
+
+    try:
+        body = None if too_large else await _read_body(receive, limit)
+    except _ClientDisconnected:
+        return  # nobody is left to answer, so the pipeline is not run
+    if body is None:
+        await _send(
+            send,
+            413,
+            [("Content-Type", "application/json"), *_cors_headers(scope)],
+            json.dumps({"error": "Request body is too large"}).encode("utf-8"),
+        )
+        return
+
+    data = _json_payload(scope, body)
+    fmt = stream_format(_header(scope, b"accept"), data)
+    if handler is _fact_check and fmt and not fact_check_request_error(data):
+        await _send_stream(send, receive, _cors_headers(scope), fmt, data)
+        return
+
+    headers = [("Content-Type", "application/json"), *_cors_headers(scope)]
+    try:
+        response_data, status = await handler(data)
+    except PipelineBusy:
+        response_data, status = {"error": "Server is busy, try again shortly"}, 503
+        headers.append(("Retry-After", "1"))
+    await _send(send, status, headers, json.dumps(response_data).encode("utf-8"))
@@ -0,0 +1,81 @@
+"""Compare the lxml and BeautifulSoup search-result parsers on synthetic SERPs.
+
+Run with ``python bench_serp_parsing.py [iterations]``.
+"""
+
+import sys
+import time
+from unittest.mock import patch
+
+from api import core
+
+NOISE = "<div class='nav'>" + "<a href='/x'>menu</a><span>item</span>" * 400 + "</div>"
+
+
+def _duckduckgo_page(count: int = 10) -> str:
+    results = "".join(
+        "<div class='result results_links web-result'>"
+        "<h2 class='result__title'><a class='result__a' "
+        f"href='//duckduckgo.com/l/?uddg=https%3A%2F%2Fnews{i}.test%2Fstory%3Futm_source%3Dddg'>"
+        f"Story {i} <b>headline</b></a></h2>"
+        f"<a class='result__snippet'>Snippet {i} about the claim.</a></div>"
+        for i in range(count)
+    )
+    return f"<html><body>{NOISE}<div id='links'>{results}</div>{NOISE}</body></html>"
+
+
+def _bing_page(count: int = 10) -> str:
+    results = "".join(
+        "<li class='b_algo'><h2>"
+        "<a href='https://www.bing.com/ck/a?u=a1aHR0cHM6Ly9leGFtcGxlLnRlc3Qvc3Rvcnk&ntb=1'>"
+        f"Result {i}</a></h2><div class='b_caption'><p>Caption {i} text.</p></div></li>"
+        f"<li class='b_algo'><h2><a href='https://site{i}.test/page'>Site {i}</a></h2>"
+        f"<p>Second caption {i}.</p></li>"
+        for i in range(count // 2)
+    )
+    return f"<html><body>{NOISE}<ol id='b_results'>{results}</ol>{NOISE}</body></html>"
+
+
+def _yahoo_page(count: int = 10) -> str:
+    results = "".join(
+        "<div class='dd algo algo-sr'><div class='compTitle'>"
+        f"<a href='https://r.search.yahoo.com/x/RU=https%3a%2f%2fpaper{i}.test%2fstory/RK=2/RS=x'>"
+        f"Paper {i}</a></div><div class='compText aAbs'><p>Yahoo text {i}.</p></div></div>"
+        for i in range(count)
+    )
+    return f"<html><body>{NOISE}<ol>{results}</ol>{NOISE}</body></html>"
+
+
+PAGES = {
+    "duckduckgo": _duckduckgo_page(),
+    "bing": _bing_page(),
+    "yahoo": _yahoo_page(),
+}
+
+
+def _time_parser(parser: str, engine: str, html: str, iterations: int) -> float:
+    with patch.object(core, "SERP_PARSER", parser):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            core._parse_serp(engine, html, 5)
+        return (time.perf_counter() - started) / iterations * 1000
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    print(f"{'engine':<12}{'page KB':>8}{'bs4 ms':>10}{'lxml ms':>10}{'speedup':>9}")
+    for engine, html in PAGES.items():
+        with patch.object(core, "SERP_PARSER", "bs4"):
+            expected = core._parse_serp(engine, html, 5)
+        if core._parse_serp(engine, html, 5) != expected:
+            raise SystemExit(f"{engine}: lxml and bs4 results differ")
+        bs4_ms = _time_parser("bs4", engine, html, iterations)
+        lxml_ms = _time_parser("lxml", engine, html, iterations)
+        print(
+            f"{engine:<12}{len(html) // 1024:>8}{bs4_ms:>10.2f}{lxml_ms:>10.2f}"
+            f"{bs4_ms / lxml_ms:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+import asyncio
+import json
+import threading
+import unittest
+from unittest.mock import patch
+
+from api import aio
+from asgi import application
+
+
+def call_asgi(
+    method,
+    path,
+    payload=None,
+    content_type="application/json",
+    headers=(),
+    disconnect=False,
+):
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    scope = {
+        "type": "http",
+        "method": method,
+        "http_version": "1.1",
+        "path": path,
+        "query_string": b"",
+        "headers": [
+            (b"content-type", content_type.encode("latin-1")),
+            *((name.encode("latin-1"), value.encode("latin-1")) for name, value in headers),
+        ],
+        "server": ("testserver", 80),
+    }
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent = []
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        if not disconnect:
+            # The client stays connected until the response is complete.
+            await asyncio.Event().wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    async def run():
+        await application(scope, receive, send)
+
+    asyncio.run(run())
+    status = sent[0]["status"]
+    headers = dict(sent[0]["headers"])
+    return status, headers, b"".join(m.get("body", b"") for m in sent[1:])
+
+
+class AsgiEntryTests(unittest.TestCase):
+    @patch("api.core.fact_check_text_input")
+    def test_text_fact_check_runs_as_async_route(self, text_input):
+        text_input.return_value = ({"claims_found": 0}, 200)
+
+        status, headers, body = call_asgi("POST", "/api/fact-check", {"text": "hello"})
+
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body), {"claims_found": 0})
+        self.assertEqual(headers[b"access-control-allow-origin"], b"*")
+        text_input.assert_called_once_with("hello")
+
+    @patch.dict("app.CORS_OPTIONS", {"origins": ["https://allowed.test"]})
+    @patch("api.core.fact_check_text_input")
+    def test_native_routes_follow_the_flask_cors_policy(self, text_input):
+        text_input.return_value = ({"claims_found": 0}, 200)
+
+        _, allowed, _ = call_asgi(
+            "POST", "/api/fact-check", {"text": "hi"}, headers=[("Origin", "https://allowed.test")]
+        )
+        _, other, _ = call_asgi(
+            "POST", "/api/fact-check", {"text": "hi"}, headers=[("Origin", "https://other.test")]
+        )
+
+        self.assertEqual(allowed[b"access-control-allow-origin"], b"https://allowed.test")
+        self.assertNotIn(b"access-control-allow-origin", other)
+
+    def test_invalid_payload_is_rejected_without_running_pipeline(self):
+        status, _, body = call_asgi("POST", "/api/fact-check-image", {})
+
+        self.assertEqual(status, 400)
+        self.assertIn("error", json.loads(body))
+
+    @patch.dict("app.app.config", {"MAX_CONTENT_LENGTH": 64})
+    @patch("api.core.fact_check_text_input")
+    def test_oversized_body_is_rejected(self, text_input):
+        status, _, body = call_asgi("POST", "/api/fact-check", {"text": "x" * 100})
+
+        self.assertEqual(status, 413)
+        self.assertIn("error", json.loads(body))
+        text_input.assert_not_called()
+
+    @patch("api.core.fact_check_text_input")
+    def test_partial_body_from_a_departed_client_is_dropped(self, text_input):
+        sent = []
+        messages = [
+            {"type": "http.request", "body": b'{"text": "hel', "more_body": True},
+            {"type": "http.disconnect"},
+        ]
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/api/fact-check",
+            "headers": [(b"content-type", b"application/json")],
+        }
+        asyncio.run(application(scope, receive, send))
+
+        self.assertEqual(sent, [])
+        text_input.assert_not_called()
+
+    @patch.object(aio, "PIPELINE_MAX_WAITING", 0)
+    @patch.object(aio, "PIPELINE_MAX_WORKERS", 0)
+    @patch("api.core.fact_check_text_input")
+    def test_full_pipeline_queue_answers_503(self, text_input):
+        status, headers, body = call_asgi("POST", "/api/fact-check", {"text": "hi"})
+
+        self.assertEqual(status, 503)
+        self.assertEqual(headers[b"retry-after"], b"1")
+        self.assertIn("error", json.loads(body))
+        text_input.assert_not_called()
+
+    def test_other_routes_are_served_by_flask(self):
+        status, headers, body = call_asgi("GET", "/api/health")
+
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)["status"], "healthy")
+        self.assertIn("async_pipeline", json.loads(body))
+
+    @patch("api.core.fact_check_url_input")
+    def test_concurrent_checks_share_the_bounded_pipeline(self, url_input):
+        release = threading.Event()
+
+        def slow_check(url):
+            release.wait(2)
+            return {"url": url}, 200
+
+        url_input.side_effect = slow_check
+
+        async def run():
+            tasks = [
+                asyncio.ensure_future(
+                    aio.fact_check_url_input_async(f"https://example.test/{i}")
+                )
+                for i in range(3)
+            ]
+            await asyncio.sleep(0.05)
+            in_flight = aio.pipeline_stats()["in_flight"]
+            release.set()
+            return in_flight, await asyncio.gather(*tasks)
+
+        in_flight, results = asyncio.run(run())
+
+        self.assertEqual(in_flight, 3)
+        self.assertEqual([r[0]["url"] for r in results][2], "https://example.test/2")
+        self.assertEqual(aio.pipeline_stats()["in_flight"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
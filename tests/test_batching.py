@@ -0,0 +1,82 @@
+import threading
+import time
+import unittest
+
+from api.batching import MicroBatcher
+
+
+class MicroBatcherTests(unittest.TestCase):
+    def test_callers_arriving_while_a_batch_runs_share_one_handler_call(self):
+        calls = []
+        busy, release = threading.Event(), threading.Event()
+
+        def handler(items):
+            calls.append(list(items))
+            if len(calls) == 1:
+                busy.set()
+                release.wait(2)
+            return [i * 10 for i in items]
+
+        batcher = MicroBatcher(handler, window=5, max_items=4)
+        results = {}
+
+        def caller(name, items):
+            results[name] = batcher.map(items)
+
+        first = threading.Thread(target=caller, args=("first", [0]))
+        first.start()
+        busy.wait(2)
+        threads = [
+            threading.Thread(target=caller, args=("a", [1, 2])),
+            threading.Thread(target=caller, args=("b", [3])),
+        ]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 2
+        while batcher.stats()["open_items"] < 3:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+        release.set()
+        for thread in [first, *threads]:
+            thread.join(2)
+
+        self.assertEqual(results, {"first": [0], "a": [10, 20], "b": [30]})
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(sorted(calls[1]), [1, 2, 3])
+
+    def test_idle_batcher_runs_without_waiting_for_the_window(self):
+        batcher = MicroBatcher(lambda items: list(items), window=5)
+
+        started = time.monotonic()
+        self.assertEqual(batcher.map(["x"]), ["x"])
+        self.assertLess(time.monotonic() - started, 1.0)
+
+    def test_cost_budget_and_item_cap_split_batches(self):
+        calls = []
+        batcher = MicroBatcher(
+            lambda items: calls.append(list(items)) or list(items),
+            window=0.05,
+            max_items=3,
+            max_cost=10,
+            cost=len,
+        )
+
+        results = batcher.map(["aaaa", "bbbb", "cccc", "d", "e", "f", "g"])
+
+        self.assertEqual(results, ["aaaa", "bbbb", "cccc", "d", "e", "f", "g"])
+        self.assertEqual(calls, [["aaaa", "bbbb"], ["cccc", "d", "e"], ["f", "g"]])
+        self.assertEqual(batcher.stats()["batches"], 3)
+
+    def test_handler_failure_reaches_every_caller(self):
+        def handler(items):
+            raise RuntimeError("provider down")
+
+        batcher = MicroBatcher(handler, window=0)
+
+        with self.assertRaises(RuntimeError):
+            batcher.map(["x", "y"])
+        self.assertEqual(batcher.stats()["failed"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
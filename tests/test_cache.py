@@ -0,0 +1,99 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from api.cache import SQLiteCache, TieredCache, TTLCache, build_cache
+
+
+class TTLCacheTests(unittest.TestCase):
+    def test_entries_expire_after_ttl(self):
+        cache = TTLCache(ttl=10)
+        with patch("api.cache.time.monotonic", return_value=100.0):
+            cache.set("key", {"verdict": "TRUE"})
+        with patch("api.cache.time.monotonic", return_value=105.0):
+            self.assertEqual(cache.get("key"), {"verdict": "TRUE"})
+        with patch("api.cache.time.monotonic", return_value=111.0):
+            self.assertIsNone(cache.get("key"))
+
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = TTLCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+
+class SQLiteCacheTests(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".sqlite3")
+        os.close(handle)
+
+    def tearDown(self):
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.path + suffix):
+                os.remove(self.path + suffix)
+
+    def test_entries_survive_a_new_connection(self):
+        SQLiteCache(self.path, table="verdicts").set("key", [{"claim": "x"}], ttl=60)
+
+        self.assertEqual(
+            SQLiteCache(self.path, table="verdicts").get("key"), [{"claim": "x"}]
+        )
+
+    def test_disk_tier_evicts_least_recently_read_rows(self):
+        cache = SQLiteCache(self.path, max_entries=2)
+        with patch("api.cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0, 5.0]):
+            cache.set("a", 1, ttl=60)
+            cache.set("b", 2, ttl=60)
+            cache.get("a")
+            cache.set("c", 3, ttl=60)
+
+        self.assertEqual(cache.stats()["entries"], 2)
+        self.assertIsNone(cache.get("b"))
+
+    def test_tiered_cache_promotes_disk_hits_into_memory(self):
+        build_cache(10, 60, disk_path=self.path, table="t").set("key", "value")
+        cache = build_cache(10, 60, disk_path=self.path, table="t")
+
+        self.assertEqual(cache.get("key"), "value")
+        self.assertEqual(cache.memory.get("key"), "value")
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_promoted_disk_hit_keeps_its_remaining_lifetime(self):
+        SQLiteCache(self.path, table="t").set("key", "value", ttl=5)
+        cache = build_cache(10, 3600, disk_path=self.path, table="t")
+
+        with patch.object(cache.memory, "set") as memory_set:
+            self.assertEqual(cache.get("key"), "value")
+
+        ttl = memory_set.call_args.args[2]
+        self.assertLessEqual(ttl, 5)
+        self.assertGreater(ttl, 0)
+
+    def test_invalid_table_name_is_rejected(self):
+        with self.assertRaises(ValueError):
+            SQLiteCache(self.path, table="verdicts; DROP TABLE x")
+
+
+class TieredCacheTests(unittest.TestCase):
+    def test_memory_only_cache_counts_hits_and_misses(self):
+        cache = TieredCache(TTLCache())
+        cache.set("key", 1)
+
+        self.assertEqual(cache.get("key"), 1)
+        self.assertIsNone(cache.get("missing"))
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+        self.assertIsNone(cache.stats()["disk"])
+
+
+if __name__ == "__main__":
+    unittest.main()
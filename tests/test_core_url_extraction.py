@@ -1,11 +1,46 @@
 import json
+import threading
+import time
 import unittest
 from unittest.mock import patch
 
 from api import core
+from api.ratelimit import RateLimiter
+
+
+class FakeStreamedResponse:
+    def __init__(self, body, content_type="text/html; charset=utf-8", url="", status_code=200):
+        self.body = body.encode("utf-8") if isinstance(body, str) else body
+        self.headers = {"Content-Type": content_type}
+        self.url = url
+        self.status_code = status_code
+        self.chunks_read = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), chunk_size):
+            self.chunks_read += 1
+            yield self.body[start:start + chunk_size]
 
 
 class UrlExtractionTests(unittest.TestCase):
+    def setUp(self):
+        core.VERDICT_CACHE.clear()
+        core.CLAIM_STORE.clear()
+        core.SEARCH_CACHE.clear()
+        core.PAGE_SUMMARY_CACHE.clear()
+        core.EXTRACTION_CACHE.clear()
+        core.REDDIT_FAILURES.clear()
+        core.PROVIDER_ROUTER.clear()
+
     def test_default_headers_do_not_request_brotli(self):
         self.assertNotIn("br", core.DEFAULT_HEADERS.get("Accept-Encoding", ""))
 
@@ -24,7 +59,7 @@ class UrlExtractionTests(unittest.TestCase):
         self.assertEqual(result["text"], "The fall of Chegg")
         self.assertEqual(result["image_urls"], ["https://i.redd.it/example.jpeg"])
 
-    @patch("api.core.requests.get")
+    @patch("api.core._http_get")
     def test_reddit_json_falls_back_to_api_reddit(self, requests_get):
         class FakeResponse:
             def __init__(self, status_code, payload=None):
@@ -57,7 +92,61 @@ class UrlExtractionTests(unittest.TestCase):
         self.assertEqual(result["images"], ["https://i.redd.it/example.jpeg"])
         self.assertIn("api.reddit.com", requests_get.call_args_list[1].args[0])
 
-    @patch("api.core.requests.get")
+    @patch("api.core.REDDIT_HEDGE_DELAY_SECONDS", 0.05)
+    @patch("api.core._extract_reddit_unfurled", return_value=None)
+    @patch("api.core._extract_reddit_old_html")
+    @patch("api.core._reddit_json_post")
+    def test_reddit_chain_hedges_slow_json_candidates(self, json_post, old_html, _unfurled):
+        release = threading.Event()
+
+        def slow_json(json_url):
+            release.wait(2)
+            return None
+
+        json_post.side_effect = slow_json
+        old_html.return_value = {"text": "Old reddit text", "title": "Old", "images": []}
+
+        started = time.monotonic()
+        result = core._extract_reddit("https://www.reddit.com/r/test/comments/abc/example/")
+        elapsed = time.monotonic() - started
+        release.set()
+
+        self.assertEqual(result["text"], "Old reddit text")
+        self.assertLess(elapsed, 1.0)
+        self.assertIn("old.reddit.com", core.ADAPTER_POOL.stats()["hosts"])
+
+    @patch("api.core._reddit_json_post")
+    def test_reddit_routes_that_keep_failing_are_skipped(self, json_post):
+        json_post.side_effect = core.RouteUnavailable("HTTP 429")
+        url = "https://www.reddit.com/r/test/comments/abc/example/"
+
+        for _ in range(core.REDDIT_FAILURE_THRESHOLD):
+            core._extract_reddit_json(url)
+        json_post.reset_mock()
+        json_post.side_effect = lambda json_url: (
+            {"text": "ok", "title": "ok", "images": []} if "api.reddit.com" in json_url else None
+        )
+        core.REDDIT_FAILURES.record_success("api.reddit.com path")
+        core.REDDIT_FAILURES.record_success("api.reddit.com by_id")
+
+        result = core._extract_reddit_json(url)
+
+        self.assertEqual(result["text"], "ok")
+        called = [call.args[0] for call in json_post.call_args_list]
+        self.assertTrue(all("www.reddit.com" not in json_url for json_url in called))
+
+    @patch("api.core._reddit_json_post")
+    def test_reddit_routes_with_empty_answers_are_not_failures(self, json_post):
+        json_post.return_value = None  # e.g. a deleted post
+        url = "https://www.reddit.com/r/test/comments/abc/example/"
+
+        for _ in range(core.REDDIT_FAILURE_THRESHOLD):
+            core._extract_reddit_json(url)
+
+        self.assertEqual(core.REDDIT_FAILURES.stats()["cooling_down"], [])
+        self.assertEqual(core.REDDIT_FAILURES.stats()["failures"], {})
+
+    @patch("api.core._http_get")
     def test_reddit_old_html_extracts_primary_image(self, requests_get):
         class FakeResponse:
             status_code = 200
@@ -77,7 +166,7 @@ class UrlExtractionTests(unittest.TestCase):
         self.assertIn("https://i.redd.it/example.jpeg", result["images"])
         self.assertIn("https://preview.redd.it/example.jpeg?width=720&auto=webp", result["images"])
 
-    @patch("api.core.requests.get")
+    @patch("api.core._http_get")
     def test_reddit_unfurled_extracts_preview_image(self, requests_get):
         class FakeResponse:
             status_code = 200
@@ -107,6 +196,165 @@ class UrlExtractionTests(unittest.TestCase):
         self.assertEqual(result["image_urls"], ["https://cdn.example.test/media?id=123"])
         self.assertTrue(result["image_detection_info"]["has_images"])
 
+    @patch("api.core.build_doc", wraps=core.build_doc)
+    @patch("api.core._fetch_html")
+    def test_generic_page_is_parsed_once_for_all_extractors(self, fetch_html, build_doc):
+        paragraph = "<p>" + "The council approved the transit budget on Tuesday. " * 8 + "</p>"
+        fetch_html.return_value = (
+            "<html><head><title>Budget | News</title>"
+            '<meta property="og:title" content="Budget passes">'
+            '<meta property="og:image" content="/lead.jpg">'
+            '<script type="application/ld+json">{"image": "https://cdn.test/ld.jpg"}</script>'
+            f"</head><body><article>{paragraph}{paragraph}"
+            '<img src="/body.jpg"></article></body></html>',
+            "https://news.test/budget",
+            "text/html",
+        )
+
+        result = core.extract_content_from_url("https://news.test/budget")
+
+        build_doc.assert_called_once()
+        self.assertEqual(result["title"], "Budget passes")
+        self.assertIn("approved the transit budget", result["text"])
+        self.assertEqual(
+            result["image_urls"][:3],
+            [
+                "https://news.test/lead.jpg",
+                "https://cdn.test/ld.jpg",
+                "https://news.test/body.jpg",
+            ],
+        )
+
+    @patch("api.core._extract_reddit")
+    def test_repeat_url_extraction_is_served_from_cache(self, extract_reddit):
+        extract_reddit.return_value = {
+            "text": "The fall of Chegg",
+            "title": "The fall of Chegg",
+            "images": ["https://i.redd.it/example.jpeg"],
+        }
+
+        first = core.extract_content_from_url("https://www.reddit.com/r/test/comments/abc/example/")
+        first["image_urls"].append("https://example.test/mutated.jpg")
+        second = core.extract_content_from_url(
+            "https://www.reddit.com/r/test/comments/abc/example/?utm_source=share"
+        )
+
+        extract_reddit.assert_called_once()
+        self.assertEqual(second["image_urls"], ["https://i.redd.it/example.jpeg"])
+
+    @patch("api.core._http_get")
+    @patch("api.core._extract_content_uncached")
+    def test_stale_generic_page_is_revalidated_with_etag(self, extract_uncached, http_get):
+        class NotModified:
+            status_code = 304
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+        url = "https://example.test/article"
+
+        def extract(url, validators):
+            validators["etag"] = '"v1"'
+            return {
+                "text": "Article body",
+                "title": "Article",
+                "image_urls": [],
+                "image_detection_info": {},
+            }
+
+        extract_uncached.side_effect = extract
+        with patch("api.core.time.time", return_value=1000.0):
+            core.extract_content_from_url(url)
+        http_get.return_value = NotModified()
+        with patch("api.core.time.time", return_value=1000.0 + 3600):
+            result = core.extract_content_from_url(url)
+
+        extract_uncached.assert_called_once()
+        self.assertEqual(result["text"], "Article body")
+        self.assertEqual(http_get.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+
+    @patch("api.core._fetch_jina_text")
+    @patch("api.core._fetch_html")
+    def test_jina_fallback_content_is_not_revalidated(self, fetch_html, fetch_jina):
+        def fetch(url, head_only=False, validators=None):
+            validators["etag"] = '"v1"'
+            return "<html><body>Access denied</body></html>", url, "text/html"
+
+        fetch_html.side_effect = fetch
+        fetch_jina.return_value = "Readable article text from the reader proxy. " * 10
+        url = "https://example.test/blocked"
+
+        core.extract_content_from_url(url)
+
+        entry = core.EXTRACTION_CACHE.get(f"extract:{core._normalize_source_url(url)}")
+        self.assertEqual(entry["validators"], {})
+
+    @patch("api.core._extract_twitter_via_proxy")
+    @patch("api.core._http_get")
+    def test_twitter_sources_run_concurrently_and_keep_precedence(self, http_get, via_proxy):
+        class FakeResponse:
+            def __init__(self, status_code, payload=None):
+                self.status_code = status_code
+                self._payload = payload
+
+            def json(self):
+                return self._payload
+
+        release_slow = threading.Event()
+
+        def fake_get(url, **kwargs):
+            if "tweet-result" in url:
+                time.sleep(0.05)
+                return FakeResponse(200, {"text": "Syndication text", "user": {"screen_name": "first"}})
+            release_slow.wait(2)
+            return FakeResponse(500)
+
+        http_get.side_effect = fake_get
+        via_proxy.return_value = {
+            "text": "Proxy text",
+            "title": "Post by @proxy",
+            "images": ["https://pbs.twimg.com/media/abc.jpg"],
+        }
+
+        started = time.monotonic()
+        result = core._extract_twitter("https://x.com/example/status/123")
+        elapsed = time.monotonic() - started
+        release_slow.set()
+
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(result["text"], "Syndication text")
+        self.assertEqual(result["title"], "Post by @first")
+        self.assertEqual(result["images"], ["https://pbs.twimg.com/media/abc.jpg?format=jpg&name=orig"])
+
+    @patch("api.core.TWITTER_ADAPTER_DEADLINE_SECONDS", 0.2)
+    @patch("api.core._extract_twitter_via_proxy", return_value=None)
+    @patch("api.core._http_get")
+    def test_twitter_fan_out_returns_partial_result_at_deadline(self, http_get, _via_proxy):
+        class FakeResponse:
+            status_code = 200
+
+            def json(self):
+                return {"html": "<blockquote><p>oEmbed text</p></blockquote>", "author_name": "Example"}
+
+        release_slow = threading.Event()
+
+        def fake_get(url, **kwargs):
+            if "oembed" in url:
+                return FakeResponse()
+            release_slow.wait(2)
+            raise TimeoutError("slow")
+
+        http_get.side_effect = fake_get
+
+        result = core._extract_twitter("https://x.com/example/status/123")
+        release_slow.set()
+
+        self.assertEqual(result["text"], "oEmbed text")
+        self.assertEqual(result["images"], [])
+
     def test_invalid_hostname_without_dot_is_rejected(self):
         self.assertFalse(core.is_valid_url("https://not-a-url"))
 
@@ -223,6 +471,267 @@ class UrlExtractionTests(unittest.TestCase):
 
         self.assertEqual(core._unwrap_yahoo_url(url), "https://example.test/story")
 
+    def test_lxml_serp_parser_matches_beautifulsoup(self):
+        pages = {
+            "duckduckgo": (
+                "<div class='result web-result'><a class='result__a' "
+                "href='//duckduckgo.com/l/?uddg=https%3A%2F%2Fexample.test%2Fstory%3Futm_source%3Dx'>"
+                "Story <b>title</b></a><a class='result__snippet'>Snippet text<script>x()</script></a></div>"
+                "<div class='result'><span>no link</span></div>"
+            ),
+            "bing": (
+                "<li class='b_algo'><h2><a href='https://www.bing.com/ck/a?"
+                "u=a1aHR0cHM6Ly9leGFtcGxlLnRlc3Qvc3Rvcnk&ntb=1'>Bing title</a></h2>"
+                "<div><p>Bing caption</p><p>second</p></div></li>"
+            ),
+            "yahoo": (
+                "<div class='dd algo algo-sr'><a href='https://r.search.yahoo.com/x/"
+                "RU=https%3a%2f%2fexample.test%2fstory/RK=2/RS=x'>Yahoo title</a>"
+                "<div class='compText aAbs'><p>Yahoo text</p></div></div>"
+                "<div class='dd'><a href='https://other.test/'>not a result</a></div>"
+            ),
+        }
+
+        for engine, body in pages.items():
+            html = f"<html><body>{body}</body></html>"
+            with patch("api.core.SERP_PARSER", "bs4"):
+                expected = core._parse_serp(engine, html, 5)
+            result = core._parse_serp(engine, html, 5)
+
+            self.assertEqual(result, expected, engine)
+            self.assertEqual(len(result), 1, engine)
+            self.assertEqual(result[0]["url"], "https://example.test/story", engine)
+        self.assertEqual(result[0]["snippet"], "Yahoo text")
+
+    @patch("api.core._search_yahoo_sources")
+    @patch("api.core._search_bing_sources")
+    @patch("api.core._search_duckduckgo_sources")
+    def test_concurrent_search_stops_once_enough_sources_arrive(self, ddg, bing, yahoo):
+        release = threading.Event()
+
+        def slow_engine(query, max_results):
+            release.wait(2)
+            return [{"url": "https://slow.test/story", "title": "", "snippet": ""}]
+
+        ddg.side_effect = slow_engine
+        bing.return_value = [
+            {"url": "https://x.com/user/status/1", "title": "", "snippet": ""},
+            {"url": "https://bing-one.test/story", "title": "", "snippet": ""},
+        ]
+        yahoo.return_value = [
+            {"url": "https://yahoo-one.test/story", "title": "", "snippet": ""},
+        ]
+
+        started = time.perf_counter()
+        results = core._search_web_sources("claim under test", max_results=2)
+        elapsed = time.perf_counter() - started
+        release.set()
+
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(
+            [item["url"] for item in results],
+            ["https://bing-one.test/story", "https://yahoo-one.test/story"],
+        )
+
+    def test_search_results_are_cached_per_normalized_query(self):
+        calls = []
+
+        def engine(query, max_results):
+            calls.append(query)
+            return [{"url": "https://example.test/story", "title": "", "snippet": ""}]
+
+        search = core._cached_search("example.test")(engine)
+
+        first = search("Claim about  the budget", 5)
+        first[0]["title"] = "mutated"
+        second = search("claim about the budget", 5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(second[0]["title"], "")
+
+    def test_stale_search_result_is_served_while_revalidating(self):
+        refreshed = threading.Event()
+
+        def engine(query, max_results):
+            refreshed.set()
+            return [{"url": "https://fresh.test/story", "title": "", "snippet": ""}]
+
+        search = core._cached_search("example.test")(engine)
+        key = core._search_cache_key("example.test", "claim about the budget", 5)
+        core.SEARCH_CACHE.set(key, {
+            "results": [{"url": "https://stale.test/story", "title": "", "snippet": ""}],
+            "fresh_until": time.time() - 1,
+        })
+
+        result = search("claim about the budget", 5)
+
+        self.assertEqual(result[0]["url"], "https://stale.test/story")
+        self.assertTrue(refreshed.wait(2))
+        for _ in range(50):
+            if core.SEARCH_CACHE.get(key)["results"][0]["url"] == "https://fresh.test/story":
+                break
+            time.sleep(0.02)
+        self.assertEqual(search("claim about the budget", 5)[0]["url"], "https://fresh.test/story")
+
+    @patch("api.core._http_get")
+    def test_evidence_page_summary_is_fetched_once_per_url(self, http_get):
+        http_get.return_value = FakeStreamedResponse(
+            "<html><head><title>Budget passes</title>"
+            '<meta name="description" content="The budget passed on Tuesday.">'
+            "</head><body><p>The budget passed on Tuesday.</p></body></html>"
+        )
+
+        first = core._fetch_evidence_page_summary({"url": "https://news.test/budget"})
+        second = core._fetch_evidence_page_summary(
+            {"url": "https://news.test/budget?utm_source=feed", "snippet": "search"}
+        )
+
+        http_get.assert_called_once()
+        self.assertEqual(first["title"], "Budget passes")
+        self.assertEqual(second["snippet"], first["snippet"])
+
+    @patch("api.core.HTML_STREAM_CHUNK_BYTES", 16)
+    @patch("api.core.HTML_FETCH_MAX_BYTES", 64)
+    @patch("api.core._http_get")
+    def test_fetch_html_stops_reading_at_byte_cap(self, http_get):
+        http_get.return_value = FakeStreamedResponse(
+            "<html><body>" + "<p>paragraph</p>" * 100 + "</body></html>",
+            url="https://news.test/huge",
+        )
+
+        html, final_url, _ = core._fetch_html("https://news.test/huge")
+
+        self.assertEqual(len(html.encode("utf-8")), 64)
+        self.assertEqual(http_get.return_value.chunks_read, 4)
+        self.assertEqual(final_url, "https://news.test/huge")
+        self.assertTrue(http_get.call_args.kwargs["stream"])
+
+    @patch("api.core.HTML_STREAM_CHUNK_BYTES", 32)
+    @patch("api.core._http_get")
+    def test_head_only_fetch_stops_after_head(self, http_get):
+        head = (
+            "<html><head><title>Post</title>"
+            '<meta property="og:image" content="https://cdn.test/post.jpg">'
+            '<meta charset="windows-1252"></head>'
+        )
+        http_get.return_value = FakeStreamedResponse(
+            head + "<body>" + "<div>app shell</div>" * 500 + "</body></html>",
+            content_type="text/html",
+        )
+
+        html, _, _ = core._fetch_html("https://www.instagram.com/p/abc/", head_only=True)
+
+        self.assertLess(len(html), len(head) + 64)
+        self.assertIn("og:image", html)
+        self.assertEqual(
+            core._extract_meta_images(core._parse_html(html), "https://www.instagram.com/"),
+            ["https://cdn.test/post.jpg"],
+        )
+
+    @patch("api.core._http_get", side_effect=TimeoutError("slow"))
+    def test_unreachable_evidence_page_is_not_refetched(self, http_get):
+        source = {"url": "https://slow.test/page", "snippet": "from search"}
+
+        core._fetch_evidence_page_summary(dict(source))
+        result = core._fetch_evidence_page_summary(dict(source))
+
+        http_get.assert_called_once()
+        self.assertEqual(result["snippet"], "from search")
+
+    @patch("api.core._fetch_evidence_page_summary")
+    @patch("api.core._search_yahoo_sources", return_value=[])
+    @patch("api.core._search_bing_sources", return_value=[])
+    @patch("api.core._search_duckduckgo_sources")
+    def test_gather_uses_cached_page_summaries_without_fetching(
+        self, ddg, _bing, _yahoo, fetch_summary
+    ):
+        ddg.return_value = [{"url": "https://news.test/budget", "title": "", "snippet": ""}]
+        core.PAGE_SUMMARY_CACHE.set(
+            core._page_summary_cache_key("https://news.test/budget"),
+            {"title": "Budget passes", "snippet": "The budget passed on Tuesday."},
+        )
+
+        evidence = core._gather_web_evidence_for_claims(["Claim about the budget vote"])
+
+        fetch_summary.assert_not_called()
+        self.assertEqual(
+            evidence["Claim about the budget vote"][0]["snippet"],
+            "The budget passed on Tuesday.",
+        )
+
+    def test_empty_search_response_is_negatively_cached(self):
+        calls = []
+
+        def blocked_engine(query, max_results):
+            calls.append(query)
+            return []
+
+        search = core._cached_search("example.test")(blocked_engine)
+
+        self.assertEqual(search("claim about the budget", 5), [])
+        self.assertEqual(search("claim about the budget", 5), [])
+        self.assertEqual(len(calls), 1)
+
+    @patch("api.core._fetch_evidence_page_summary")
+    @patch("api.core._search_yahoo_sources", return_value=[])
+    @patch("api.core._search_bing_sources", return_value=[])
+    @patch("api.core._search_duckduckgo_sources")
+    def test_evidence_fetches_start_before_slower_claim_searches(
+        self, ddg, _bing, _yahoo, fetch_summary
+    ):
+        slow_claim_released = threading.Event()
+        fetch_started_before_release = []
+
+        def search(query, max_results):
+            if query.startswith("Slow"):
+                slow_claim_released.wait(2)
+            slug = query.split()[0].lower()
+            return [{"url": f"https://{slug}.test/story", "title": "", "snippet": ""}]
+
+        def fetch(source):
+            fetch_started_before_release.append(not slow_claim_released.is_set())
+            slow_claim_released.set()
+            return {**source, "snippet": "fetched"}
+
+        ddg.side_effect = search
+        fetch_summary.side_effect = fetch
+
+        evidence = core._gather_web_evidence_for_claims(
+            ["Fast claim about the budget", "Slow claim about the election"]
+        )
+
+        self.assertTrue(fetch_started_before_release[0])
+        self.assertEqual(
+            evidence["Fast claim about the budget"][0]["snippet"], "fetched"
+        )
+        self.assertEqual(
+            evidence["Slow claim about the election"][0]["url"],
+            "https://slow.test/story",
+        )
+        self.assertIn("bing.com", core.EVIDENCE_POOL.stats()["hosts"])
+
+    @patch("api.core._search_yahoo_sources")
+    @patch("api.core._search_bing_sources")
+    @patch("api.core._search_duckduckgo_sources")
+    def test_concurrent_search_keeps_engine_priority_order(self, ddg, bing, yahoo):
+        def delayed(delay, url):
+            def engine(query, max_results):
+                time.sleep(delay)
+                return [{"url": url, "title": "", "snippet": ""}]
+
+            return engine
+
+        ddg.side_effect = delayed(0.2, "https://ddg.test/story")
+        bing.side_effect = delayed(0.0, "https://bing.test/story")
+        yahoo.side_effect = RuntimeError("blocked")
+
+        results = core._search_web_sources("claim under test", max_results=5)
+
+        self.assertEqual(
+            [item["url"] for item in results],
+            ["https://ddg.test/story", "https://bing.test/story"],
+        )
+
     @patch("api.core._gather_web_evidence_for_claims")
     @patch.object(core.FactChecker, "_post_api")
     def test_refine_results_uses_web_evidence_sources(self, post_api, gather_evidence):
@@ -265,6 +774,346 @@ class UrlExtractionTests(unittest.TestCase):
         self.assertEqual(refined[0]["result"]["verdict"], "TRUE")
         self.assertEqual(refined[0]["result"]["sources"], ["https://thelogicalindian.com/story"])
 
+    @patch("time.sleep")
+    def test_post_groq_falls_back_to_second_model_on_pooled_client(self, _sleep):
+        class FakeUpstream:
+            def __init__(self, status_code, body):
+                self.status_code = status_code
+                self.content = body.encode("utf-8")
+                self.headers = {"Content-Type": "application/json"}
+
+        checker = core.FactChecker(groq_api_key="groq-key")
+        with patch.object(
+            core.PROVIDER_CLIENTS["groq"],
+            "post",
+            side_effect=[
+                FakeUpstream(503, '{"error":"over capacity"}'),
+                FakeUpstream(200, '{"choices":[]}'),
+            ],
+        ) as post:
+            response = checker._post_groq({"messages": []})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [call.kwargs["model"] for call in post.call_args_list],
+            [core.GROQ_TEXT_MODEL, core.GROQ_FALLBACK_TEXT_MODEL],
+        )
+
+    def test_post_groq_skips_model_blocked_by_retry_after(self):
+        class FakeUpstream:
+            def __init__(self, status_code, body, headers=None):
+                self.status_code = status_code
+                self.content = body.encode("utf-8")
+                self.headers = {"Content-Type": "application/json", **(headers or {})}
+
+        slept = []
+        limiter = RateLimiter(core.PROVIDER_RATE_LIMITS, sleep=slept.append)
+        checker = core.FactChecker(groq_api_key="groq-key")
+        with patch.object(core, "RATE_LIMITER", limiter), patch.object(
+            core.PROVIDER_CLIENTS["groq"],
+            "post",
+            side_effect=[
+                FakeUpstream(429, '{"error":"rate"}', {"Retry-After": "60"}),
+                FakeUpstream(200, '{"choices":[]}'),
+                FakeUpstream(200, '{"choices":[]}'),
+            ],
+        ) as post:
+            checker._post_groq({"messages": []})
+            response = checker._post_groq({"messages": []})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [call.kwargs["model"] for call in post.call_args_list],
+            [
+                core.GROQ_TEXT_MODEL,
+                core.GROQ_FALLBACK_TEXT_MODEL,
+                core.GROQ_FALLBACK_TEXT_MODEL,
+            ],
+        )
+        self.assertEqual(slept, [])
+
+    @patch.object(core.FactChecker, "_post_gemini")
+    @patch.object(core.FactChecker, "_post_groq")
+    def test_post_api_prefers_gemini_while_shared_groq_budget_is_spent(
+        self, post_groq, post_gemini
+    ):
+        ok = core.GeminiResponse(status_code=200, body='{"choices":[]}')
+        post_groq.return_value = ok
+        post_gemini.return_value = ok
+        limiter = RateLimiter(core.PROVIDER_RATE_LIMITS, sleep=lambda _: None)
+        checker = core.FactChecker(api_key="gemini-key", groq_api_key="groq-key")
+
+        with patch.object(core, "RATE_LIMITER", limiter):
+            checker._post_api({"messages": []})
+            self.assertEqual((post_groq.call_count, post_gemini.call_count), (1, 0))
+
+            for model in core._groq_models(use_vision=False):
+                limiter.observe("groq", model, {}, retry_after=30)
+            checker._post_api({"messages": []})
+
+        self.assertEqual((post_groq.call_count, post_gemini.call_count), (1, 1))
+
+    @patch("time.sleep")
+    def test_post_api_skips_groq_while_its_breakers_are_open(self, _sleep):
+        class FakeUpstream:
+            def __init__(self, status_code, body):
+                self.status_code = status_code
+                self.content = body.encode("utf-8")
+                self.headers = {"Content-Type": "application/json"}
+
+        checker = core.FactChecker(api_key="gemini-key", groq_api_key="groq-key")
+        for model in core._groq_models(use_vision=False):
+            for _ in range(core.ROUTER_MIN_SAMPLES):
+                core.PROVIDER_ROUTER.record("groq", model, 0.1, ok=False)
+        gemini_body = '{"candidates":[{"content":{"parts":[{"text":"ok"}]}}]}'
+
+        payload = {"messages": [{"role": "user", "content": "hi"}]}
+        groq_post = patch.object(core.PROVIDER_CLIENTS["groq"], "post").start()
+        gemini_post = patch.object(
+            core.PROVIDER_CLIENTS["gemini"],
+            "post",
+            return_value=FakeUpstream(200, gemini_body),
+        ).start()
+        self.addCleanup(patch.stopall)
+
+        response = checker._post_api(payload)
+
+        self.assertEqual(response.status_code, 200)
+        groq_post.assert_not_called()
+        self.assertEqual(gemini_post.call_count, 1)
+        stats = core.PROVIDER_ROUTER.stats()
+        self.assertEqual(stats[f"groq:{core.GROQ_TEXT_MODEL}"]["state"], "open")
+        self.assertEqual(stats[f"gemini:{core.GEMINI_PRIMARY_MODEL}"]["requests"], 1)
+
+    def test_quota_responses_do_not_open_the_breaker(self):
+        quota = core.GeminiResponse(status_code=429, body="{}")
+        for _ in range(core.ROUTER_MIN_SAMPLES * 2):
+            core._record_route("groq", core.GROQ_TEXT_MODEL, time.perf_counter(), quota)
+
+        self.assertTrue(core.PROVIDER_ROUTER.available("groq", core.GROQ_TEXT_MODEL))
+        route = core.PROVIDER_ROUTER.stats()[f"groq:{core.GROQ_TEXT_MODEL}"]
+        self.assertEqual((route["state"], route["errors"]), ("closed", 0))
+
+    @patch("api.core._gather_web_evidence_for_claims")
+    @patch.object(core.FactChecker, "_post_api")
+    def test_refine_only_sends_unseen_claims_after_claim_store_hit(
+        self, post_api, gather_evidence
+    ):
+        claim = "Chegg stock declined sharply in 2024."
+        evidence = [{"url": "https://example.test/chegg", "title": "Chegg", "snippet": "Shares fell."}]
+        gather_evidence.return_value = {claim: evidence}
+        post_api.return_value = core.GeminiResponse(
+            status_code=200,
+            body=json.dumps({"choices": [{"message": {"content": json.dumps({
+                "claims": [{
+                    "claim": claim,
+                    "verdict": "TRUE",
+                    "confidence": 90,
+                    "explanation": "Coverage confirms the decline.",
+                    "sources": ["https://example.test/chegg"],
+                }]
+            })}}]}),
+        )
+        checker = core.FactChecker(api_key="test-key")
+        preliminary = {
+            "claim": claim,
+            "result": {"verdict": "INSUFFICIENT EVIDENCE", "confidence": 40, "explanation": "", "sources": []},
+        }
+        checker.refine_results_with_web_evidence([preliminary])
+
+        other = {
+            "claim": "Chegg laid off staff.",
+            "result": {"verdict": "TRUE", "confidence": 70, "explanation": "", "sources": []},
+        }
+        gather_evidence.reset_mock()
+        gather_evidence.return_value = {}
+        refined = checker.refine_results_with_web_evidence([
+            {"claim": f"[Image] {claim}", "result": dict(preliminary["result"])},
+            other,
+        ])
+
+        gather_evidence.assert_called_once_with(["Chegg laid off staff."])
+        post_api.assert_called_once()
+        self.assertEqual(refined[0]["claim"], f"[Image] {claim}")
+        self.assertEqual(refined[0]["result"]["verdict"], "TRUE")
+        self.assertEqual(refined[1], other)
+
+    @patch("api.core._gather_web_evidence_for_claims")
+    @patch.object(core.FactChecker, "_post_api")
+    def test_refine_does_not_store_claims_without_evidence(
+        self, post_api, gather_evidence
+    ):
+        gather_evidence.return_value = {}
+        checker = core.FactChecker(api_key="test-key")
+        item = {
+            "claim": "Chegg laid off staff.",
+            "result": {"verdict": "TRUE", "confidence": 70, "explanation": "", "sources": []},
+        }
+        checker.refine_results_with_web_evidence([item])
+        refined = checker.refine_results_with_web_evidence([dict(item)])
+
+        self.assertEqual(gather_evidence.call_count, 2)
+        post_api.assert_not_called()
+        self.assertEqual(refined[0]["result"]["verdict"], "TRUE")
+        self.assertIsNone(core._known_claim_result(item))
+
+    @patch.object(core.FactChecker, "_post_api")
+    def test_duplicate_claims_in_a_batch_pool_their_evidence(self, post_api):
+        post_api.return_value = core.GeminiResponse(
+            status_code=200,
+            body=json.dumps({"choices": [{"message": {"content": '{"claims": []}'}}]}),
+        )
+        claim = "Chegg stock declined sharply in 2024."
+        entries = [
+            {"claim": claim, "evidence": [{"url": "https://a.test/1", "snippet": "A"}]},
+            {"claim": claim, "evidence": [
+                {"url": "https://a.test/1", "snippet": "A"},
+                {"url": "https://b.test/2", "snippet": "B"},
+            ]},
+        ]
+
+        core.FactChecker(api_key="test-key")._recheck_evidence_batch(entries)
+
+        prompt = post_api.call_args.args[0]["messages"][0]["content"]
+        package = json.loads(prompt.split("Evidence package: ", 1)[1])
+        self.assertEqual(len(package), 1)
+        self.assertEqual(
+            [item["url"] for item in package[0]["evidence"]],
+            ["https://a.test/1", "https://b.test/2"],
+        )
+
+    @patch.object(core, "EVIDENCE_BATCH_WINDOW_SECONDS", 5)
+    @patch("api.core._gather_web_evidence_for_claims")
+    @patch.object(core.FactChecker, "_post_api")
+    def test_refines_arriving_while_a_recheck_runs_share_one_prompt(
+        self, post_api, gather_evidence
+    ):
+        claims = ["Chegg stock declined sharply in 2024.", "Chegg laid off staff."]
+        gather_evidence.side_effect = lambda queries: {
+            query: [{"url": f"https://example.test/{len(query)}", "snippet": query}]
+            for query in queries
+        }
+        answer = core.GeminiResponse(
+            status_code=200,
+            body=json.dumps({"choices": [{"message": {"content": json.dumps({
+                "claims": [
+                    {"claim": claims[0], "verdict": "TRUE", "confidence": 90,
+                     "explanation": "Shares fell.", "sources": []},
+                    {"claim": claims[1], "verdict": "FALSE", "confidence": 80,
+                     "explanation": "No layoffs found.", "sources": []},
+                ]
+            })}}]}),
+        )
+        busy, release = threading.Event(), threading.Event()
+
+        def post(payload):
+            if not busy.is_set():
+                busy.set()
+                release.wait(5)
+            return answer
+
+        post_api.side_effect = post
+        checker = core.FactChecker(api_key="test-key")
+        refined = {}
+
+        def refine(claim):
+            refined[claim] = checker.refine_results_with_web_evidence([{
+                "claim": claim,
+                "result": {"verdict": "INSUFFICIENT EVIDENCE", "sources": []},
+            }])[0]
+
+        first = threading.Thread(target=refine, args=("Chegg was founded in 2005.",))
+        first.start()
+        busy.wait(5)
+        threads = [threading.Thread(target=refine, args=(claim,)) for claim in claims]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while checker._evidence_batcher.stats()["open_items"] < 2:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+        release.set()
+        for thread in [first, *threads]:
+            thread.join(5)
+
+        self.assertEqual(post_api.call_count, 2)
+        prompt = post_api.call_args.args[0]["messages"][0]["content"]
+        self.assertIn(claims[0], prompt)
+        self.assertIn(claims[1], prompt)
+        self.assertEqual(refined[claims[0]]["result"]["verdict"], "TRUE")
+        self.assertEqual(refined[claims[1]]["result"]["verdict"], "FALSE")
+        self.assertEqual(
+            refined[claims[1]]["result"]["sources"],
+            [f"https://example.test/{len(claims[1])}"],
+        )
+
+    @patch.object(core, "EVIDENCE_BATCH_WINDOW_SECONDS", 5)
+    @patch("api.core._gather_web_evidence_for_claims")
+    @patch.object(core.FactChecker, "_post_api")
+    def test_lone_refine_skips_the_batch_window(self, post_api, gather_evidence):
+        claim = "Chegg laid off staff."
+        gather_evidence.return_value = {
+            claim: [{"url": "https://example.test/chegg", "snippet": "Layoffs."}]
+        }
+        post_api.return_value = core.GeminiResponse(
+            status_code=200,
+            body=json.dumps({"choices": [{"message": {"content": '{"claims": []}'}}]}),
+        )
+        checker = core.FactChecker(api_key="test-key")
+
+        started = time.monotonic()
+        refined = checker.refine_results_with_web_evidence([{
+            "claim": claim,
+            "result": {"verdict": "TRUE", "sources": []},
+        }])
+
+        self.assertLess(time.monotonic() - started, 1.0)
+        # The answer skipped the claim: a failed re-check, so nothing is stored.
+        self.assertTrue(refined.error)
+        self.assertIsNone(core._known_claim_result(refined[0]))
+
+    def test_streamed_text_check_reports_claims_before_the_answer_ends(self):
+        answer = json.dumps({"claims": [
+            {"claim": "Water boils at 100C.", "verdict": "TRUE", "confidence": 90,
+             "explanation": "At sea level.", "sources": []},
+            {"claim": "The moon is cheese.", "verdict": "FALSE", "confidence": 99,
+             "explanation": "It is rock.", "sources": []},
+        ]})
+        pieces = [answer[i : i + 40] for i in range(0, len(answer), 40)]
+        seen = []
+
+        class FakeStream:
+            status_code = 200
+            headers = {"Content-Type": "text/event-stream"}
+
+            def iter_lines(self):
+                for index, piece in enumerate(pieces):
+                    seen.append(("chunk", index))
+                    event = {"candidates": [{"content": {"parts": [{"text": piece}]}}]}
+                    yield b"data: " + json.dumps(event).encode("utf-8")
+                    yield b""
+
+            def close(self):
+                pass
+
+        checker = core.FactChecker(api_key="gemini-key")
+        with patch.object(
+            core.PROVIDER_CLIENTS["gemini"], "post", return_value=FakeStream()
+        ) as post:
+            results = checker.fact_check_text_claims(
+                "Water boils at 100C. The moon is cheese.",
+                on_claim=lambda item: seen.append(("claim", item["claim"])),
+            )
+
+        self.assertIn(":streamGenerateContent?alt=sse&", post.call_args.args[0])
+        self.assertTrue(post.call_args.kwargs["stream"])
+        self.assertEqual(
+            [item["claim"] for item in results],
+            ["Water boils at 100C.", "The moon is cheese."],
+        )
+        first_claim = seen.index(("claim", "Water boils at 100C."))
+        self.assertLess(first_claim, seen.index(("chunk", len(pieces) - 1)))
+
     def test_parse_json_block_handles_fenced_array(self):
         parsed = core._try_parse_json_block(
             '```json\n[{"claim":"Chegg declined","verdict":"TRUE"}]\n```'
@@ -361,18 +1210,14 @@ class UrlExtractionTests(unittest.TestCase):
         self.assertEqual(results[0]["result"]["verdict"], "ANALYSIS COMPLETE")
 
     @patch("api.core._download_image_as_data_url", return_value=None)
-    @patch("api.core.FactChecker")
-    def test_image_queue_returns_per_image_failure(self, fact_checker_class, _download):
+    def test_image_queue_returns_per_image_failure(self, _download):
         class FakeChecker:
-            def __init__(self, api_key=None):
-                self.api_key = api_key or "test-key"
-                self.last_image_error = ""
+            api_key = "test-key"
 
             def fact_check_image_content(self, image_url=None, image_data_url=None):
                 if image_url and "bad" in image_url:
-                    self.last_image_error = "Rate limit exceeded after retries"
-                    return []
-                return [{
+                    return core.CheckResults([], error="Rate limit exceeded after retries")
+                return core.CheckResults([{
                     "claim": "[Image] Image claim",
                     "result": {
                         "verdict": "TRUE",
@@ -380,13 +1225,10 @@ class UrlExtractionTests(unittest.TestCase):
                         "explanation": "Verified.",
                         "sources": [],
                     },
-                }]
-
-        fact_checker_class.side_effect = lambda api_key=None: FakeChecker(api_key)
-        parent_checker = FakeChecker("test-key")
+                }])
 
         results = core._analyze_image_urls_with_queue(
-            parent_checker,
+            FakeChecker(),
             ["https://example.test/good.jpg", "https://example.test/bad.jpg"],
         )
 
@@ -396,6 +1238,69 @@ class UrlExtractionTests(unittest.TestCase):
         self.assertEqual(results[1]["status"], "failed")
         self.assertEqual(results[1]["reason"], "Rate limit exceeded after retries")
 
+    @patch.object(core.FactChecker, "_post_gemini")
+    def test_text_claim_errors_are_returned_per_call(self, post_gemini):
+        checker = core.FactChecker(api_key="test-key")
+        post_gemini.return_value = core.GeminiResponse(
+            status_code=429,
+            body='{"error":{"message":"Quota exceeded."}}',
+        )
+
+        results = checker.fact_check_text_claims("OpenAI released ChatGPT.")
+
+        self.assertEqual(results, [])
+        self.assertEqual(results.error, "Quota exceeded.")
+
+    @patch.object(core.FactChecker, "_post_gemini")
+    def test_repeat_text_check_is_served_from_verdict_cache(self, post_gemini):
+        checker = core.FactChecker(api_key="test-key")
+        post_gemini.return_value = core.GeminiResponse(
+            status_code=200,
+            body=json.dumps({
+                "choices": [{
+                    "message": {
+                        "content": json.dumps({"claims": [{
+                            "claim": "OpenAI released ChatGPT.",
+                            "verdict": "TRUE",
+                            "confidence": 98,
+                            "explanation": "OpenAI announced ChatGPT publicly.",
+                            "sources": [],
+                        }]})
+                    }
+                }]
+            }),
+        )
+
+        first = checker.fact_check_text_claims("OpenAI  released ChatGPT.")
+        first[0]["result"]["verdict"] = "MUTATED"
+        second = checker.fact_check_text_claims("openai released chatgpt.")
+
+        post_gemini.assert_called_once()
+        self.assertEqual(second[0]["result"]["verdict"], "TRUE")
+        self.assertEqual(core.VERDICT_CACHE.stats()["hits"], 1)
+
+    @patch.object(core.FactChecker, "_post_gemini")
+    def test_failed_claim_check_is_not_cached(self, post_gemini):
+        checker = core.FactChecker(api_key="test-key")
+        post_gemini.return_value = core.GeminiResponse(status_code=503, body="")
+
+        checker.fact_check_claim("The moon is made of cheese.")
+        checker.fact_check_claim("The moon is made of cheese.")
+
+        self.assertEqual(post_gemini.call_count, 2)
+
+    def test_checker_registry_reuses_checker_until_keys_change(self):
+        registry = core.CheckerRegistry(reload_seconds=0)
+        with patch.dict("os.environ", {"GROQ_API_KEY": "groq-one"}, clear=True):
+            first, _ = registry.get()
+            second, _ = registry.get()
+        with patch.dict("os.environ", {"GROQ_API_KEY": "groq-two"}, clear=True):
+            third, _ = registry.get()
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, third)
+        self.assertEqual(third.groq_api_key, "groq-two")
+
     @patch.object(core.FactChecker, "_post_gemini")
     def test_extract_image_claims_filters_intro_line(self, post_gemini):
         checker = core.FactChecker(api_key="test-key")
@@ -417,6 +1322,65 @@ class UrlExtractionTests(unittest.TestCase):
 
         self.assertEqual(claims, ["Chegg Inc is identified as the first company officially wiped out by AI."])
 
+    @patch("api.core._analyze_image_urls_with_queue")
+    @patch("api.core.extract_content_from_url")
+    @patch("api.core._get_checker")
+    def test_url_fact_check_refines_text_while_images_are_analyzed(
+        self,
+        get_checker,
+        extract_content,
+        analyze_images,
+    ):
+        images_done = threading.Event()
+        refined_batches = []
+
+        def check(claim):
+            return {"claim": claim, "result": {"verdict": "TRUE", "sources": []}}
+
+        class FakeChecker:
+            def fact_check_text_claims(self, text):
+                return core.CheckResults([check("Chegg stock fell 40 percent in 2024.")])
+
+            def refine_results_with_web_evidence(self, results):
+                refined_batches.append(
+                    ([item["claim"] for item in results], images_done.is_set())
+                )
+                return core.CheckResults(results)
+
+        def slow_images(checker, image_urls):
+            time.sleep(0.2)
+            images_done.set()
+            return [{
+                "image_url": image_urls[0],
+                "status": "ok",
+                "claims": ["[Image] Chegg fell sharply."],
+                "checks": [check("[Image] Chegg fell sharply.")],
+            }]
+
+        get_checker.return_value = (FakeChecker(), None)
+        analyze_images.side_effect = slow_images
+        extract_content.return_value = {
+            "text": "Chegg stock fell 40 percent in 2024 after AI competition.",
+            "title": "Chegg",
+            "image_urls": ["https://i.redd.it/example.jpeg"],
+            "image_detection_info": {"has_images": True, "image_detected": True, "message": ""},
+        }
+
+        response, status = core.fact_check_url_input("https://reddit.com/r/test/comments/abc/title/")
+
+        self.assertEqual(status, 200)
+        self.assertEqual(
+            [item["claim"] for item in response["fact_check_results"]],
+            ["Chegg stock fell 40 percent in 2024.", "[Image] Chegg fell sharply."],
+        )
+        self.assertEqual(
+            refined_batches,
+            [
+                (["Chegg stock fell 40 percent in 2024."], False),
+                (["[Image] Chegg fell sharply."], True),
+            ],
+        )
+
     @patch("api.core._analyze_image_urls_with_queue")
     @patch("api.core.extract_content_from_url")
     @patch("api.core._get_checker")
@@ -50,6 +50,12 @@ class FakeChecker:
 
 
 class ExtensionEndpointTests(unittest.TestCase):
+    def setUp(self):
+        core.VERDICT_CACHE.clear()
+        core.CLAIM_STORE.clear()
+        core.SEARCH_CACHE.clear()
+        core.PAGE_SUMMARY_CACHE.clear()
+
     @patch("api.core._get_checker")
     def test_extension_post_fact_check_uses_visible_text_context(self, get_checker):
         checker = FakeChecker()
@@ -93,6 +99,13 @@ class ExtensionEndpointTests(unittest.TestCase):
         self.assertTrue(response["extraction"]["screenshot_used"])
         self.assertEqual(checker.image_inputs[0][1], "data:image/png;base64,abc123")
 
+    def test_health_reports_verdict_cache_counters(self):
+        client = app.test_client()
+        response = client.get("/api/health")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("hits", response.get_json()["verdict_cache"])
+
     def test_extension_route_returns_validation_error(self):
         client = app.test_client()
         response = client.post("/api/extension/fact-check", json={})
@@ -0,0 +1,179 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from api.jobs import JOB_RUNNERS, JobManager, SQLiteJobStore
+from app import app
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class JobManagerTests(unittest.TestCase):
+    def setUp(self):
+        self.release = threading.Event()
+        self.calls = []
+
+        def run_text(payload):
+            self.calls.append(payload)
+            self.release.wait(2)
+            return {"claims_found": 0, "original_text": payload["text"]}, 200
+
+        def run_url(payload):
+            raise RuntimeError("extraction crashed")
+
+        self.jobs = JobManager(
+            {"text": run_text, "url": run_url}, SQLiteJobStore(), max_workers=2
+        )
+
+    def test_identical_submissions_share_one_job(self):
+        first, created = self.jobs.submit("text", {"text": "Water boils."})
+        second, created_again = self.jobs.submit("text", {"text": "Water boils."})
+        self.release.set()
+
+        self.assertTrue(created)
+        self.assertFalse(created_again)
+        self.assertEqual(first["id"], second["id"])
+        self.assertTrue(
+            wait_for(lambda: self.jobs.get(first["id"])["status"] == "done")
+        )
+        self.assertEqual(len(self.calls), 1)
+        result = self.jobs.get(first["id"])["result"]
+        self.assertEqual(result["original_text"], "Water boils.")
+
+    def test_failed_job_records_error_and_is_not_reused(self):
+        job, _ = self.jobs.submit("url", {"url": "https://example.com"})
+        self.assertTrue(
+            wait_for(lambda: self.jobs.get(job["id"])["status"] == "failed")
+        )
+
+        retry, created = self.jobs.submit("url", {"url": "https://example.com"})
+
+        self.assertIn("extraction crashed", self.jobs.get(job["id"])["error"])
+        self.assertTrue(created)
+        self.assertNotEqual(retry["id"], job["id"])
+
+    def test_job_that_ended_in_a_server_error_is_not_reused(self):
+        self.jobs.runners["image"] = lambda payload: ({"error": "Timed out"}, 504)
+        job, _ = self.jobs.submit("image", {"image_url": "https://example.com/a.png"})
+        self.assertTrue(wait_for(lambda: self.jobs.get(job["id"])["status"] == "done"))
+
+        retry, created = self.jobs.submit(
+            "image", {"image_url": "https://example.com/a.png"}
+        )
+
+        self.assertTrue(created)
+        self.assertNotEqual(retry["id"], job["id"])
+
+    def test_expired_jobs_are_gone(self):
+        self.jobs.ttl = 0.05
+        job, _ = self.jobs.submit("text", {"text": "Old news."})
+        self.release.set()
+        time.sleep(0.1)
+
+        self.assertIsNone(self.jobs.get(job["id"]))
+        _, created = self.jobs.submit("text", {"text": "Old news."})
+        self.assertTrue(created)
+
+    def test_jobs_left_by_a_dead_worker_are_failed(self):
+        store = SQLiteJobStore()
+        store.create_or_find("orphan", "text", "key", ttl=60)
+        store.update("orphan", status="running")
+        jobs = JobManager(self.jobs.runners, store, stale_after=0.05)
+        time.sleep(0.1)
+
+        job = jobs.get("orphan")
+
+        self.assertEqual(job["status"], "failed")
+        self.assertIn("worker stopped", job["error"])
+
+
+class SharedJobStoreTests(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".sqlite3")
+        os.close(handle)
+
+    def tearDown(self):
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.path + suffix):
+                os.remove(self.path + suffix)
+
+    def test_workers_sharing_a_file_create_one_job(self):
+        release = threading.Event()
+        calls = []
+
+        def run_text(payload):
+            calls.append(payload)
+            release.wait(2)
+            return {"claims_found": 0}, 200
+
+        workers = [
+            JobManager({"text": run_text}, SQLiteJobStore(self.path)) for _ in range(4)
+        ]
+        outcomes = []
+        threads = [
+            threading.Thread(
+                target=lambda jobs=jobs: outcomes.append(
+                    jobs.submit("text", {"text": "Shared claim."})
+                )
+            )
+            for jobs in workers
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        release.set()
+
+        self.assertEqual(len({job["id"] for job, _ in outcomes}), 1)
+        self.assertEqual(sum(created for _, created in outcomes), 1)
+        self.assertTrue(wait_for(lambda: len(calls) == 1))
+
+
+class JobRouteTests(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("app.JOBS", JobManager(JOB_RUNNERS, SQLiteJobStore()))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch("api.core.fact_check_text_input")
+    def test_submit_poll_and_fetch_result(self, text_input):
+        text_input.return_value = ({"claims_found": 1}, 200)
+        client = app.test_client()
+
+        submitted = client.post("/api/jobs", json={"text": "Job route claim."})
+
+        self.assertEqual(submitted.status_code, 202)
+        job_url = submitted.headers["Location"]
+        self.assertTrue(
+            wait_for(lambda: client.get(job_url).get_json()["status"] == "done")
+        )
+        result = client.get(f"{job_url}/result")
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(result.get_json(), {"claims_found": 1})
+        text_input.assert_called_once_with("Job route claim.")
+
+    def test_invalid_job_and_unknown_id(self):
+        client = app.test_client()
+
+        self.assertEqual(client.post("/api/jobs", json={}).status_code, 400)
+        self.assertEqual(client.get("/api/jobs/missing").status_code, 404)
+
+    @patch("app.JOBS_SUPPORTED", False)
+    def test_jobs_are_refused_on_serverless(self):
+        response = app.test_client().post("/api/jobs", json={"text": "Claim."})
+
+        self.assertEqual(response.status_code, 501)
+
+
+if __name__ == "__main__":
+    unittest.main()
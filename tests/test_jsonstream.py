@@ -0,0 +1,32 @@
+import unittest
+
+from api.jsonstream import JsonArrayStream
+
+
+class JsonArrayStreamTests(unittest.TestCase):
+    def test_yields_each_element_as_soon_as_it_closes(self):
+        text = '```json\n{"claims":[{"claim":"a } [ \\" x","n":{"k":[1]}},{"claim":"b"}]}'
+        stream = JsonArrayStream("claims")
+        seen = []
+        for end in range(len(text) + 1):
+            seen.extend((end, item) for item in stream.feed(text[:end]))
+
+        self.assertEqual([item["claim"] for _, item in seen], ['a } [ " x', "b"])
+        self.assertEqual(seen[0][0], text.index(',{"claim":"b"'))
+
+    def test_ignores_other_keys_and_nested_arrays(self):
+        stream = JsonArrayStream("claims")
+
+        items = stream.feed('{"notes":[{"x":1}],"claims":[{"claim":"c"}],"more":[{}]}')
+
+        self.assertEqual(items, [{"claim": "c"}])
+
+    def test_accepts_bare_array_and_restarts_on_new_text(self):
+        stream = JsonArrayStream("claims")
+        self.assertEqual(stream.feed('[{"claim":"a"},{"cla'), [{"claim": "a"}])
+
+        self.assertEqual(stream.feed('{"claims":[{"claim":"b"}'), [{"claim": "b"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
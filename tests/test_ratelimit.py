@@ -0,0 +1,148 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from api.ratelimit import RateLimiter, SQLiteRateStore, parse_reset_seconds
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class RateLimiterTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.limiter = RateLimiter(
+            {"groq": {"rpm": 60, "tpm": 6000}, "groq:small": {"tpm": 600}},
+            clock=self.clock,
+            sleep=self.clock.sleep,
+        )
+
+    def test_waits_only_once_budget_is_exhausted(self):
+        for _ in range(60):
+            self.assertTrue(self.limiter.acquire("groq", "big", tokens=10))
+        self.assertEqual(self.clock.slept, [])
+
+        self.assertTrue(self.limiter.acquire("groq", "big", tokens=10))
+
+        self.assertEqual(len(self.clock.slept), 1)
+        self.assertAlmostEqual(self.clock.slept[0], 1.0)
+
+    def test_token_budget_is_per_model(self):
+        self.assertTrue(self.limiter.acquire("groq", "small", tokens=600))
+
+        self.assertFalse(self.limiter.acquire("groq", "small", tokens=300, max_wait=5))
+        self.assertTrue(self.limiter.acquire("groq", "big", tokens=300, max_wait=5))
+        self.assertEqual(self.clock.slept, [])
+        self.assertEqual(self.limiter.stats()["groq:small"]["rejected"], 1)
+
+    def test_token_headers_tighten_the_budget(self):
+        self.limiter.observe(
+            "groq",
+            "big",
+            {
+                "x-ratelimit-remaining-tokens": "0",
+                "x-ratelimit-reset-tokens": "7.5s",
+            },
+        )
+
+        self.assertAlmostEqual(self.limiter.wait_time("groq", "big"), 7.5)
+        self.assertEqual(self.limiter.stats()["groq:big"]["tpm_available"], 0)
+
+    def test_daily_request_headers_do_not_touch_the_minute_budget(self):
+        self.limiter.observe(
+            "groq",
+            "big",
+            {
+                "x-ratelimit-remaining-requests": "0",
+                "x-ratelimit-reset-requests": "2m30s",
+                "x-ratelimit-remaining-tokens": "5000",
+            },
+        )
+
+        self.assertEqual(self.limiter.wait_time("groq", "big"), 0)
+        self.assertEqual(self.limiter.stats()["groq:big"]["tpm_available"], 5000)
+
+    def test_retry_after_blocks_until_it_passes(self):
+        self.limiter.observe("groq", "big", {}, retry_after=3)
+
+        self.assertFalse(self.limiter.acquire("groq", "big", max_wait=1))
+        self.assertTrue(self.limiter.acquire("groq", "big"))
+        self.assertAlmostEqual(self.clock.slept[0], 3.0)
+
+    def test_parse_reset_seconds(self):
+        self.assertEqual(parse_reset_seconds("7.5"), 7.5)
+        self.assertAlmostEqual(parse_reset_seconds("2m59.5s"), 179.5)
+        self.assertAlmostEqual(parse_reset_seconds("500ms"), 0.5)
+        self.assertIsNone(parse_reset_seconds("soon"))
+
+
+class SharedRateStoreTests(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".sqlite3")
+        os.close(handle)
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.path + suffix):
+                os.remove(self.path + suffix)
+
+    def worker(self):
+        return RateLimiter(
+            {"gemini": {"rpm": 2}},
+            clock=self.clock,
+            sleep=self.clock.sleep,
+            store=SQLiteRateStore(self.path),
+        )
+
+    def test_workers_draw_from_one_budget(self):
+        first, second = self.worker(), self.worker()
+
+        self.assertTrue(first.acquire("gemini", "flash", max_wait=0))
+        self.assertTrue(second.acquire("gemini", "flash", max_wait=0))
+
+        self.assertFalse(first.acquire("gemini", "flash", max_wait=0))
+        self.assertAlmostEqual(second.wait_time("gemini", "flash"), 30.0)
+
+    def test_retry_after_seen_by_one_worker_blocks_the_others(self):
+        first, second = self.worker(), self.worker()
+
+        first.observe("gemini", "flash", {}, retry_after=20)
+
+        self.assertAlmostEqual(second.wait_time("gemini", "flash"), 20.0)
+        self.assertEqual(second.stats()["gemini:flash"]["blocked_for_seconds"], 20.0)
+
+    def test_locked_store_does_not_block_reads_or_fail_acquire(self):
+        limiter = RateLimiter(
+            {"gemini": {"rpm": 2}},
+            clock=self.clock,
+            sleep=self.clock.sleep,
+            store=SQLiteRateStore(self.path, timeout=0.05),
+        )
+        limiter.acquire("gemini", "flash")
+        other = sqlite3.connect(self.path, isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+        try:
+            self.assertEqual(limiter.stats()["gemini:flash"]["rpm_available"], 1.0)
+            self.assertEqual(limiter.wait_time("gemini", "flash"), 0.0)
+            self.assertTrue(limiter.acquire("gemini", "flash", max_wait=0))
+        finally:
+            other.execute("ROLLBACK")
+            other.close()
+
+        self.assertEqual(limiter.store_errors, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
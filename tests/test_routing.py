@@ -0,0 +1,76 @@
+import unittest
+
+from api.routing import ProviderRouter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class ProviderRouterTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.router = ProviderRouter(
+            window=4,
+            min_samples=4,
+            error_threshold=0.5,
+            open_seconds=10,
+            clock=self.clock,
+        )
+
+    def fail(self, times):
+        for _ in range(times):
+            self.router.record("groq", "llama", 0.2, ok=False)
+
+    def test_breaker_opens_after_error_rate_crosses_threshold(self):
+        self.router.record("groq", "llama", 0.2, ok=True)
+        self.fail(2)
+        self.assertTrue(self.router.allow("groq", "llama"))
+
+        self.fail(1)
+
+        self.assertFalse(self.router.allow("groq", "llama"))
+        self.assertEqual(self.router.stats()["groq:llama"]["state"], "open")
+        self.assertEqual(self.router.stats()["groq:llama"]["skipped"], 1)
+
+    def test_single_probe_closes_breaker_on_recovery(self):
+        self.fail(4)
+        self.clock.now += 10
+
+        self.assertTrue(self.router.available("groq", "llama"))
+        self.assertTrue(self.router.allow("groq", "llama"))
+        self.assertFalse(self.router.allow("groq", "llama"))
+
+        self.router.record("groq", "llama", 0.3, ok=True)
+
+        self.assertEqual(self.router.stats()["groq:llama"]["state"], "closed")
+        self.assertTrue(self.router.allow("groq", "llama"))
+
+    def test_failed_probe_reopens_for_longer(self):
+        self.fail(4)
+        self.clock.now += 10
+        self.assertTrue(self.router.allow("groq", "llama"))
+
+        self.fail(1)
+
+        self.assertEqual(self.router.stats()["groq:llama"]["open_for_seconds"], 20.0)
+        self.clock.now += 10
+        self.assertFalse(self.router.available("groq", "llama"))
+
+    def test_score_is_error_weighted_latency_ewma(self):
+        self.assertIsNone(self.router.score("gemini", ["flash"]))
+        self.router.record("gemini", "flash", 1.0, ok=True)
+        self.router.record("gemini", "flash", 2.0, ok=True)
+
+        self.assertAlmostEqual(self.router.score("gemini", ["flash"]), 1.3)
+
+        self.router.record("gemini", "flash", 5.0, ok=False)
+        self.assertAlmostEqual(self.router.score("gemini", ["flash"]), 1.3 * 4 / 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import json
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from api import core
+from app import app
+from tests.test_asgi import call_asgi
+
+
+def check(claim, verdict):
+    return {"claim": claim, "result": {"verdict": verdict, "sources": []}}
+
+
+class FakeChecker:
+    def fact_check_text_claims(self, text, on_claim=None, on_reset=None):
+        claim = check("Water boils at 100C.", "INSUFFICIENT EVIDENCE")
+        if on_claim is not None:
+            on_claim(claim)
+        return core.CheckResults([claim])
+
+    def refine_results_with_web_evidence(self, results):
+        return core.CheckResults([check("Water boils at 100C.", "TRUE")])
+
+
+class ClaimStreamTests(unittest.TestCase):
+    def setUp(self):
+        core.VERDICT_CACHE.clear()
+
+    @patch.object(core.FactChecker, "_post_api")
+    def test_restarted_answer_resets_and_claims_are_not_repeated(self, post_api):
+        first = '{"claims":[{"claim":"A","verdict":"TRUE"},'
+        answer = (
+            '{"claims":[{"claim":"A","verdict":"TRUE"},{"claim":"A","verdict":"TRUE"},'
+            '{"claim":"B","verdict":"FALSE"}]}'
+        )
+
+        def post(payload, on_content=None):
+            on_content(first)  # failed attempt
+            on_content(answer[:40])  # fallback provider starts over
+            on_content(answer)
+            body = {"choices": [{"message": {"content": answer}}]}
+            return core.GeminiResponse(status_code=200, body=json.dumps(body))
+
+        post_api.side_effect = post
+        events = []
+        core.FactChecker(api_key="test-key").fact_check_text_claims(
+            "A and B.",
+            on_claim=lambda item: events.append(item["claim"]),
+            on_reset=lambda: events.append("reset"),
+        )
+
+        self.assertEqual(events, ["A", "reset", "A", "B"])
+
+
+@patch("api.core._get_checker", return_value=(FakeChecker(), None))
+class FactCheckStreamingTests(unittest.TestCase):
+    def setUp(self):
+        core.VERDICT_CACHE.clear()
+
+    def test_ndjson_stream_emits_each_stage_then_result(self, _get_checker):
+        response = app.test_client().post(
+            "/api/fact-check", json={"text": "Water boils at 100C.", "stream": True}
+        )
+
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+        events = [json.loads(line) for line in response.data.splitlines()]
+        self.assertEqual(
+            [event["event"] for event in events],
+            ["claim", "preliminary", "refined", "result"],
+        )
+        preliminary = events[1]["data"]["fact_check_results"][0]
+        self.assertEqual(preliminary["result"]["verdict"], "INSUFFICIENT EVIDENCE")
+        self.assertEqual(events[3]["data"]["status_code"], 200)
+        self.assertEqual(events[3]["data"]["claims_found"], 1)
+
+    @patch("api.core.extract_content_from_url")
+    def test_url_stream_sends_extracted_content_first(self, extract, _get_checker):
+        extract.return_value = {"text": "Water boils at 100C.", "title": "Water"}
+
+        response = app.test_client().post(
+            "/api/fact-check",
+            json={"url": "https://example.com/water"},
+            headers={"Accept": "text/event-stream"},
+        )
+
+        self.assertEqual(response.mimetype, "text/event-stream")
+        blocks = response.get_data(as_text=True).strip().split("\n\n")
+        names = [block.split("\n")[0].removeprefix("event: ") for block in blocks]
+        self.assertEqual(names, ["extracted", "claim", "preliminary", "refined", "result"])
+        extracted = json.loads(blocks[0].split("data: ", 1)[1])
+        self.assertEqual(extracted["source_title"], "Water")
+
+    def test_asgi_streams_events(self, _get_checker):
+        status, headers, body = call_asgi(
+            "POST", "/api/fact-check", {"text": "Water boils at 100C.", "stream": True}
+        )
+
+        self.assertEqual(status, 200)
+        self.assertEqual(headers[b"content-type"], b"application/x-ndjson")
+        events = [json.loads(line)["event"] for line in body.splitlines()]
+        self.assertEqual(events, ["claim", "preliminary", "refined", "result"])
+
+    def test_asgi_stream_stops_when_the_client_disconnects(self, get_checker):
+        release = threading.Event()
+
+        class SlowChecker(FakeChecker):
+            def fact_check_text_claims(self, text, on_claim=None, on_reset=None):
+                release.wait(2)
+                return super().fact_check_text_claims(text, on_claim, on_reset)
+
+        get_checker.return_value = (SlowChecker(), None)
+        started = time.monotonic()
+        # Its own text: the abandoned pipeline still finishes and caches a
+        # verdict after release, which must not leak into other tests.
+        status, _, body = call_asgi(
+            "POST",
+            "/api/fact-check",
+            {"text": "Ice melts at 0C.", "stream": True},
+            disconnect=True,
+        )
+        elapsed = time.monotonic() - started
+        release.set()
+
+        self.assertEqual(status, 200)
+        self.assertEqual(body, b"")
+        self.assertLess(elapsed, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
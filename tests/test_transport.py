@@ -0,0 +1,100 @@
+import datetime
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from api.transport import HttpPool, ProviderClient
+
+
+class FakeResponse:
+    status_code = 200
+
+
+class HttpPoolTests(unittest.TestCase):
+    def test_sessions_are_shared_per_host(self):
+        pool = HttpPool()
+
+        first = pool.session_for("https://www.reddit.com/r/test/.json")
+        second = pool.session_for("https://www.reddit.com/r/other/.json")
+        other = pool.session_for("https://api.reddit.com/r/test")
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+    def test_host_pool_size_applies_to_www_variant(self):
+        pool = HttpPool(default_pool_size=2, host_pool_sizes={"bing.com": 6})
+
+        session = pool.session_for("https://www.bing.com/search?q=x")
+
+        self.assertEqual(session.get_adapter("https://www.bing.com/")._pool_maxsize, 6)
+        self.assertEqual(pool.stats()["hosts"]["www.bing.com"]["pool_size"], 6)
+
+    def test_stats_count_requests_and_errors(self):
+        pool = HttpPool()
+        with patch.object(requests.Session, "request", return_value=FakeResponse()):
+            pool.get("https://duckduckgo.com/html/")
+            pool.head("https://duckduckgo.com/html/")
+        with patch.object(
+            requests.Session, "request", side_effect=requests.Timeout("slow")
+        ):
+            with self.assertRaises(requests.Timeout):
+                pool.get("https://duckduckgo.com/html/")
+
+        stats = pool.stats()
+        self.assertEqual(stats["hosts"]["duckduckgo.com"]["requests"], 3)
+        self.assertEqual(stats["hosts"]["duckduckgo.com"]["errors"], 1)
+        self.assertEqual(stats["in_flight"], 0)
+
+    def test_max_connections_bounds_in_flight_requests(self):
+        pool = HttpPool(max_connections=1, acquire_timeout=0.05)
+        release = threading.Event()
+
+        def slow_request(*args, **kwargs):
+            release.wait(1)
+            return FakeResponse()
+
+        with patch.object(requests.Session, "request", side_effect=slow_request):
+            worker = threading.Thread(target=pool.get, args=("https://example.test/a",))
+            worker.start()
+            time.sleep(0.02)
+            with self.assertRaises(requests.ConnectionError):
+                pool.get("https://example.test/b")
+            release.set()
+            worker.join()
+
+        self.assertEqual(pool.stats()["exhausted"], 1)
+
+
+class ProviderClientTests(unittest.TestCase):
+    def test_post_uses_split_timeouts_and_records_latency(self):
+        client = ProviderClient("groq", connect_timeout=2, read_timeout=20)
+        response = requests.Response()
+        response.status_code = 200
+        response.elapsed = datetime.timedelta(milliseconds=150)
+
+        with patch.object(requests.Session, "post", return_value=response) as post:
+            client.post("https://api.groq.com/x", model="llama", data=b"{}")
+
+        self.assertEqual(post.call_args.kwargs["timeout"], (2, 20))
+        stats = client.stats()["models"]["llama"]
+        self.assertEqual(stats["requests"], 1)
+        self.assertEqual(stats["errors"], 0)
+        self.assertEqual(stats["ttfb_ms_p50"], 150.0)
+
+    def test_post_counts_transport_errors(self):
+        client = ProviderClient("gemini")
+
+        with patch.object(
+            requests.Session, "post", side_effect=requests.ConnectionError("reset")
+        ):
+            with self.assertRaises(requests.ConnectionError):
+                client.post("https://example.test/x", model="flash")
+
+        self.assertEqual(client.stats()["models"]["flash"]["errors"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import threading
+import time
+import unittest
+
+from api.workpool import WorkPool
+
+
+class WorkPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.pool = WorkPool(max_workers=6, host_limits={"bing.com": 2})
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def test_host_limit_caps_tasks_in_flight(self):
+        lock = threading.Lock()
+        state = {"current": 0, "peak": 0}
+
+        def task():
+            with lock:
+                state["current"] += 1
+                state["peak"] = max(state["peak"], state["current"])
+            time.sleep(0.05)
+            with lock:
+                state["current"] -= 1
+            return True
+
+        futures = [self.pool.submit(task, host="www.bing.com") for _ in range(6)]
+
+        self.assertTrue(all(future.result(timeout=2) for future in futures))
+        self.assertEqual(state["peak"], 2)
+        host_stats = self.pool.stats()["hosts"]["bing.com"]
+        self.assertEqual(host_stats["submitted"], 6)
+        self.assertGreater(host_stats["throttled"], 0)
+
+    def test_throttled_host_does_not_block_other_hosts(self):
+        release = threading.Event()
+        blocked = [
+            self.pool.submit(release.wait, 2, host="bing.com") for _ in range(4)
+        ]
+
+        other = self.pool.submit(lambda: "page", host="example.test")
+
+        self.assertEqual(other.result(timeout=1), "page")
+        stats = self.pool.stats()
+        self.assertEqual(stats["hosts"]["bing.com"]["waiting"], 2)
+        self.assertGreaterEqual(stats["peak_queue_depth"], 2)
+        release.set()
+        for future in blocked:
+            future.result(timeout=2)
+
+    def test_exceptions_and_cancellation_are_reported(self):
+        release = threading.Event()
+        running = [self.pool.submit(release.wait, 2, host="bing.com") for _ in range(2)]
+        queued = self.pool.submit(lambda: "never", host="bing.com")
+        failing = self.pool.submit(lambda: 1 / 0, host="example.test")
+
+        self.assertTrue(queued.cancel())
+        with self.assertRaises(ZeroDivisionError):
+            failing.result(timeout=1)
+        release.set()
+        for future in running:
+            future.result(timeout=2)
+        self.assertEqual(self.pool.stats()["failed"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()